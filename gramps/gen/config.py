@@ -159,6 +159,7 @@ register("behavior.do-not-show-previously-seen-addon-updates", True)
 register("behavior.date-about-range", 50)
 register("behavior.date-after-range", 50)
 register("behavior.date-before-range", 50)
+register("behavior.filter-processes", 1)
 register("behavior.generation-depth", 15)
 register("behavior.max-age-prob-alive", 110)
 register("behavior.max-sib-age-diff", 20)
@@ -195,6 +196,11 @@ register("csv.dialect", "excel")
 register("csv.delimiter", ",")
 
 register("database.backend", "sqlite")
+register("database.cache-size", 0)
+register("database.cache-memory", 0)
+register("database.proxy-cache-size", 131071)
+register("database.proxy-cache-memory", 0)
+register("database.proxy-cache-budgets", {})
 register("database.compress-backup", True)
 register("database.backup-path", USER_HOME)
 register("database.backup-on-exit", True)
@@ -275,6 +281,7 @@ register("interface.toolbar-tools", True)
 register("interface.view", True)
 register("interface.surname-box-height", 150)
 register("interface.treemodel-cache-size", 1000)
+register("interface.treemodel-cache-memory", 0)
 
 register("paths.recent-export-dir", USER_HOME)
 register("paths.recent-file", "")
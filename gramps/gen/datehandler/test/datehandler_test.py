@@ -84,7 +84,10 @@ class DateHandlerTest(unittest.TestCase):
                 self.assertTrue(
                     test_date.is_equal(new_date),
                     "{} -> {}\n{} -> {}".format(
-                        test_date, new_date, test_date.__dict__, new_date.__dict__
+                        test_date,
+                        new_date,
+                        test_date.get_object_state(),
+                        new_date.get_object_state(),
                     ),
                 )
 
@@ -30,6 +30,7 @@ from this class.
 # Python modules
 #
 # -------------------------------------------------------------------------
+import contextlib
 import logging
 
 # -------------------------------------------------------------------------
@@ -39,6 +40,7 @@ import logging
 # -------------------------------------------------------------------------
 from ..const import GRAMPS_LOCALE as glocale
 from ..db.dbconst import DBLOGNAME
+from ..errors import HandleError
 from ..lib.childref import ChildRef
 from ..lib.childreftype import ChildRefType
 from .exceptions import DbTransactionCancel
@@ -120,6 +122,23 @@ class DbReadBase:
         """
         raise NotImplementedError
 
+    def find_handles_where(self, class_name, where, values):
+        """
+        Return the handles of the objects of the given type that match an
+        SQL WHERE clause, or None if the database doesn't support SQL
+        queries.
+
+        :param class_name: name of the object type, e.g. "Person".
+        :type class_name: str
+        :param where: WHERE clause with "?" placeholders.
+        :type where: str
+        :param values: values for the placeholders.
+        :type values: list
+        :returns: list of handles, in the order of the cursor of the
+                  objects, or None.
+        """
+        return None
+
     def find_initial_person(self):
         """
         Returns first person in the database
@@ -602,6 +621,166 @@ class DbReadBase:
         """
         raise NotImplementedError
 
+    def _get_from_handles_singly(self, get_func, handles):
+        """
+        Return a list of objects for an iterable of handles, by fetching the
+        objects one at a time with get_func.
+
+        Handles that are empty, not found or filtered out are skipped, and
+        each distinct handle is returned at most once.
+        """
+        objs = []
+        for handle in dict.fromkeys(handles):
+            if not handle:
+                continue
+            try:
+                obj = get_func(handle)
+            except HandleError:
+                continue
+            if obj is not None:
+                objs.append(obj)
+        return objs
+
+    def get_citations_from_handles(self, handles):
+        """
+        Return a list of Citation objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Citation exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_citation_from_handle, handles)
+
+    def get_events_from_handles(self, handles):
+        """
+        Return a list of Event objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Event exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_event_from_handle, handles)
+
+    def get_families_from_handles(self, handles):
+        """
+        Return a list of Family objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Family exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_family_from_handle, handles)
+
+    def get_media_from_handles(self, handles):
+        """
+        Return a list of Media objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Media exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_media_from_handle, handles)
+
+    def get_notes_from_handles(self, handles):
+        """
+        Return a list of Note objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Note exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_note_from_handle, handles)
+
+    def get_people_from_handles(self, handles):
+        """
+        Return a list of Person objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Person exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_person_from_handle, handles)
+
+    def get_places_from_handles(self, handles):
+        """
+        Return a list of Place objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Place exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_place_from_handle, handles)
+
+    def get_repositories_from_handles(self, handles):
+        """
+        Return a list of Repository objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Repository exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_repository_from_handle, handles)
+
+    def get_sources_from_handles(self, handles):
+        """
+        Return a list of Source objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Source exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_source_from_handle, handles)
+
+    def get_tags_from_handles(self, handles):
+        """
+        Return a list of Tag objects in the database from an iterable of
+        handles.
+
+        :param handles: handles of the objects to search for.
+        :type handles: iterable of str
+
+        The objects are returned in the order of the handles.  Handles for
+        which no Tag exists, or which are filtered out by a proxy, are
+        skipped.
+        """
+        return self._get_from_handles_singly(self.get_tag_from_handle, handles)
+
     def get_citation_handles(self, sort_handles=False, locale=glocale):
         """
         Return a list of database handles, one handle for each Citation in
@@ -734,6 +913,41 @@ class DbReadBase:
         """
         raise NotImplementedError
 
+    def get_field_values(self, class_name, field):
+        """
+        Return a list of (value, handle) pairs, with the value of a field for
+        each object of a primary class, in no particular order.
+
+        Only fields that the database stores outside of the object data can
+        be read this way. None is returned if the database can't read the
+        field without loading every object.
+
+        :param class_name: The primary class, such as "Person".
+        :type class_name: str
+        :param field: The name of the field, such as "gramps_id".
+        :type field: str
+        """
+        return None
+
+    def get_surname_counts(self):
+        """
+        Return a list of (surname, count) pairs, with the number of people
+        for each surname, in no particular order.
+
+        The surname of a person is the first surname of their primary name.
+        None is returned if the database can't count the people without
+        loading every person, or if some people are not grouped by that
+        surname.
+        """
+        return None
+
+    def iter_raw_person_data_by_surname(self, surnames):
+        """
+        Return an iterator over (handle, raw data) pairs of the people that
+        have one of the surnames, as counted by get_surname_counts.
+        """
+        raise NotImplementedError
+
     def get_event_roles(self):
         """
         Return a list of all custom event role names associated with Event
@@ -1580,6 +1794,16 @@ class DbWriteBase(DbReadBase):
         """
         raise NotImplementedError
 
+    def bulk_load(self):
+        """
+        Return a context manager to be entered around the batch transactions
+        of a large import.
+
+        Backends can use it to defer index and reference maintenance until
+        the import is done. The default does nothing.
+        """
+        return contextlib.nullcontext(self)
+
     def commit_citation(self, citation, transaction, change_time=None):
         """
         Commit the specified Event to the database, storing the changes as
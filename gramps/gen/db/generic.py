@@ -31,12 +31,15 @@ Gramps generic database handler
 # ------------------------------------------------------------------------
 from __future__ import annotations
 import bisect
+import copy
 import logging
 import os
 import pickle
 import random
 import re
+import sqlite3
 import time
+import zlib
 from pathlib import Path
 from typing import Any
 
@@ -45,7 +48,9 @@ from typing import Any
 # Gramps modules
 #
 # ------------------------------------------------------------------------
+from ..config import config
 from ..const import GRAMPS_LOCALE as glocale
+from ..display.name import displayer as name_displayer
 from ..errors import HandleError
 from ..lib import (
     Citation,
@@ -66,6 +71,7 @@ from ..lib.researcher import Researcher
 from ..updatecallback import UpdateCallback
 from ..utils.callback import Callback
 from ..utils.id import create_id
+from ..utils.lru import LRUCache
 from . import (
     CITATION_KEY,
     DBLOGNAME,
@@ -112,6 +118,9 @@ SIGBASE = (
     "citation",
 )
 
+# The number of undo entries kept in memory before they are compressed
+UNDO_WINDOW = 256
+
 
 # ------------------------------------------------------------------------
 #
@@ -121,50 +130,111 @@ SIGBASE = (
 class DbGenericUndo(DbUndo):
     """
     Generic undo/redo handler
+
+    The entries are kept in a journal, in a private temporary SQLite
+    database which is deleted when it is closed.  The entries are compressed,
+    and only the last ones are kept in memory, so the memory used does not
+    grow with the number of changes.
     """
 
     def __init__(self, grampsdb, path):
         super().__init__(grampsdb)
-        self.undodb = []
+        self.undodb = None
+        self.__count = 0
+        # The entries not written to the journal yet, from index __written
+        self.__window = []
+        self.__written = 0
 
     def open(self, value=None):
         """
-        Open the backing storage.  Needs to be overridden in the derived
-        class.
+        Open the journal.
         """
+        if self.undodb is None:
+            # An empty file name is a temporary database on disk, deleted
+            # when it is closed.
+            self.undodb = sqlite3.connect("", check_same_thread=False)
+            self.undodb.execute("PRAGMA journal_mode = OFF")
+            self.undodb.execute("PRAGMA synchronous = OFF")
+            self.undodb.execute(
+                "CREATE TABLE undo (recno INTEGER PRIMARY KEY, data BLOB)"
+            )
+            self.__count = 0
+            self.__window = []
+            self.__written = 0
 
     def close(self):
         """
-        Close the backing storage.  Needs to be overridden in the derived
-        class.
+        Close and delete the journal.
         """
+        if self.undodb is not None:
+            self.undodb.close()
+            self.undodb = None
+
+    def __flush(self):
+        """
+        Write the entries of the window to the journal.
+        """
+        with self.undodb:
+            self.undodb.executemany(
+                "INSERT INTO undo (recno, data) VALUES (?, ?)",
+                (
+                    (recno, zlib.compress(value, 1))
+                    for recno, value in enumerate(self.__window, self.__written)
+                ),
+            )
+        self.__written += len(self.__window)
+        self.__window.clear()
+
+    def __get_index(self, index):
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("undo journal index out of range")
+        return index
 
     def append(self, value):
         """
-        Add a new entry on the end.  Needs to be overridden in the derived
-        class.
+        Add a new entry on the end, and return its index.
         """
-        self.undodb.append(value)
+        if self.undodb is None:
+            self.open()
+        if len(self.__window) >= UNDO_WINDOW:
+            self.__flush()
+        self.__window.append(value)
+        self.__count += 1
+        return self.__count - 1
 
     def __getitem__(self, index):
         """
-        Returns an entry by index number.  Needs to be overridden in the
-        derived class.
+        Returns an entry by index number.
         """
-        return self.undodb[index]
+        index = self.__get_index(index)
+        if index >= self.__written:
+            return self.__window[index - self.__written]
+        row = self.undodb.execute(
+            "SELECT data FROM undo WHERE recno = ?", (index,)
+        ).fetchone()
+        return zlib.decompress(row[0])
 
     def __setitem__(self, index, value):
         """
-        Set an entry to a value.  Needs to be overridden in the derived class.
+        Set an entry to a value.
         """
-        self.undodb[index] = value
+        index = self.__get_index(index)
+        if index >= self.__written:
+            self.__window[index - self.__written] = value
+        else:
+            with self.undodb:
+                self.undodb.execute(
+                    "UPDATE undo SET data = ? WHERE recno = ?",
+                    (zlib.compress(value, 1), index),
+                )
 
     def __len__(self):
         """
-        Returns the number of entries.  Needs to be overridden in the derived
-        class.
+        Returns the number of entries.
         """
-        return len(self.undodb)
+        return self.__count
 
     def _redo(self, update_history):
         """
@@ -183,14 +253,13 @@ class DbGenericUndo(DbUndo):
         try:
             self.db._txn_begin()
             for record_id in subitems:
-                (key, trans_type, handle, __, new_data) = pickle.loads(
-                    self.undodb[record_id]
-                )
+                (key, trans_type, handle, __, new_data) = pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.db.undo_reference(new_data, handle)
                 else:
                     self.db.undo_data(new_data, handle, key)
+                    self.db.clear_cache(key, handle)
                     sigs[key][trans_type].append(handle)
             # now emit the signals
             self.undo_sigs(sigs, False)
@@ -232,14 +301,13 @@ class DbGenericUndo(DbUndo):
         try:
             self.db._txn_begin()
             for record_id in subitems:
-                (key, trans_type, handle, old_data, x) = pickle.loads(
-                    self.undodb[record_id]
-                )
+                (key, trans_type, handle, old_data, x) = pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.db.undo_reference(old_data, handle)
                 else:
                     self.db.undo_data(old_data, handle, key)
+                    self.db.clear_cache(key, handle)
                     sigs[key][trans_type].append(handle)
             # now emit the signals
             self.undo_sigs(sigs, True)
@@ -350,6 +418,202 @@ class Cursor:
         pass
 
 
+# ------------------------------------------------------------------------
+#
+# ObjectCache class
+#
+# ------------------------------------------------------------------------
+class ObjectCache:
+    """
+    Bounded cache of raw object data, with one LRUCache per object table.
+
+    A table with a size of 0 is not cached.
+    """
+
+    def __init__(self):
+        self.__sizes = {}
+        self.__tables = {}
+
+    def set_size(self, obj_key, size, memory=0):
+        """
+        Set the maximum number of entries cached for a table, and the
+        maximum estimated memory of their data.
+
+        :param obj_key: The object table key, e.g. PERSON_KEY.
+        :type obj_key: int
+        :param size: The maximum number of entries, 0 to disable.
+        :type size: int
+        :param memory: The maximum estimated memory in bytes, 0 for no limit.
+        :type memory: int
+        """
+        self.__sizes[obj_key] = size
+        if size > 0:
+            self.__tables[obj_key] = LRUCache(size, memory)
+        else:
+            self.__tables.pop(obj_key, None)
+
+    def is_enabled(self, obj_key):
+        """
+        Return True if the given table is cached.
+        """
+        return obj_key in self.__tables
+
+    def get(self, obj_key, handle):
+        """
+        Return the cached data for a handle, or None if it is not cached.
+        """
+        table = self.__tables.get(obj_key)
+        if table is None:
+            return None
+        return table.get(handle)
+
+    def put(self, obj_key, handle, data):
+        """
+        Store the data for a handle.
+        """
+        table = self.__tables.get(obj_key)
+        if table is not None:
+            table[handle] = data
+
+    def invalidate(self, obj_key, handle):
+        """
+        Remove a handle from the cache.
+        """
+        table = self.__tables.get(obj_key)
+        if table is not None:
+            table.pop(handle)
+
+    def clear(self, obj_key=None):
+        """
+        Remove all entries for a table, or for all tables if obj_key is None.
+        """
+        if obj_key is None:
+            for table in self.__tables.values():
+                table.clear()
+        elif obj_key in self.__tables:
+            self.__tables[obj_key].clear()
+
+    def get_statistics(self):
+        """
+        Return a dictionary of {obj_key: statistics} for the cached tables,
+        with the size of the table and the statistics of its LRUCache.
+        """
+        return {
+            obj_key: dict(table.get_statistics(), size=self.__sizes[obj_key])
+            for obj_key, table in self.__tables.items()
+        }
+
+
+# ------------------------------------------------------------------------
+#
+# GrampsIdIndex class
+#
+# ------------------------------------------------------------------------
+class GrampsIdIndex:
+    """
+    In-memory index between the handles and the Gramps IDs of the objects,
+    with one table per object type.
+
+    A table is loaded from the database the first time it is used, and is
+    then kept current by the commits and removes of the database.
+    """
+
+    def __init__(self, loader):
+        """
+        :param loader: A function that returns the (handle, gramps_id) pairs
+                       of a table, given its object table key.
+        :type loader: callable
+        """
+        self.__loader = loader
+        self.__handles = {}
+        self.__ids = {}
+        # Gramps IDs that are used by more than one object
+        self.__shared = {}
+
+    def __load(self, obj_key):
+        """
+        Return the table mapping the Gramps IDs to the handles, loading it
+        if needed.
+        """
+        handles = self.__handles.get(obj_key)
+        if handles is None:
+            handles = {}
+            ids = {}
+            shared = set()
+            for handle, gramps_id in self.__loader(obj_key):
+                ids[handle] = gramps_id
+                if handles.setdefault(gramps_id, handle) != handle:
+                    shared.add(gramps_id)
+            self.__handles[obj_key] = handles
+            self.__ids[obj_key] = ids
+            self.__shared[obj_key] = shared
+        return handles
+
+    def has_gramps_id(self, obj_key, gramps_id):
+        """
+        Return True if an object of the table has the Gramps ID.
+        """
+        return gramps_id in self.__load(obj_key)
+
+    def get_handle(self, obj_key, gramps_id):
+        """
+        Return the handle of the object with the Gramps ID, or None.
+        """
+        return self.__load(obj_key).get(gramps_id)
+
+    def update(self, obj_key, handle, gramps_id):
+        """
+        Record the Gramps ID of an added or changed object.
+        """
+        ids = self.__ids.get(obj_key)
+        if ids is None:
+            # Not loaded yet, the database will be read when it is used
+            return
+        old_id = ids.get(handle)
+        if old_id == gramps_id:
+            return
+        if old_id is not None and not self.__unmap(obj_key, handle, old_id):
+            return
+        ids[handle] = gramps_id
+        if self.__handles[obj_key].setdefault(gramps_id, handle) != handle:
+            self.__shared[obj_key].add(gramps_id)
+
+    def remove(self, obj_key, handle):
+        """
+        Forget the Gramps ID of a removed object.
+        """
+        ids = self.__ids.get(obj_key)
+        if ids is not None and handle in ids:
+            if self.__unmap(obj_key, handle, ids[handle]):
+                del ids[handle]
+
+    def __unmap(self, obj_key, handle, gramps_id):
+        """
+        Remove the Gramps ID of an object from the table.  Return False if
+        the table had to be dropped, because another object has the same
+        Gramps ID.
+        """
+        if gramps_id in self.__shared[obj_key]:
+            self.clear(obj_key)
+            return False
+        del self.__handles[obj_key][gramps_id]
+        return True
+
+    def clear(self, obj_key=None):
+        """
+        Drop a table, or all tables if obj_key is None.  They are loaded
+        again when they are used.
+        """
+        if obj_key is None:
+            self.__handles.clear()
+            self.__ids.clear()
+            self.__shared.clear()
+        else:
+            self.__handles.pop(obj_key, None)
+            self.__ids.pop(obj_key, None)
+            self.__shared.pop(obj_key, None)
+
+
 # ------------------------------------------------------------------------
 #
 # DbGeneric class
@@ -393,7 +657,7 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
     __callback_map = {}
 
-    VERSION = (21, 0, 0)
+    VERSION = (22, 0, 0)
 
     def __init__(self, directory=None):
         DbReadBase.__init__(self)
@@ -574,6 +838,7 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.brief_name = None
         self.readonly = False
         self.db_is_open = False
+        self.__credentials = (None, None)
         self.name_formats = []
         # Bookmarks:
         self.bookmarks = DbBookmarks()
@@ -616,6 +881,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.surname_list = []
         self.genderStats = GenderStats()  # can pass in loaded stats as dict
         self.owner = Researcher()
+        self._cache = ObjectCache()
+        self._id_index = GrampsIdIndex(self._iter_gramps_ids)
         if directory:
             self.load(directory)
 
@@ -684,6 +951,7 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
         # run backend-specific code:
         self._initialize(directory, username, password)
+        self.__credentials = (username, password)
 
         need_to_set_version = False
         if not self._schema_exists():
@@ -759,6 +1027,12 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.rmap_index = self._get_metadata("rmap_index", 0)
         self.nmap_index = self._get_metadata("nmap_index", 0)
 
+        # Object cache:
+        self.set_cache_size(
+            config.get("database.cache-size"),
+            memory=config.get("database.cache-memory"),
+        )
+
         self.db_is_open = True
 
         # Check on db version to see if we need upgrade or too new
@@ -857,9 +1131,24 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             except IOError:
                 pass
 
+        if self.undodb is not None:
+            self.undodb.close()
+        self._cache.clear()
+        self._id_index.clear()
         self.db_is_open = False
         self._directory = None
 
+    def reopen(self):
+        """
+        Open a new read-only connection to the backend of the loaded
+        database.
+
+        This is for a process forked from the one that loaded the database,
+        which must not use the connection of its parent.
+        """
+        self.readonly = True
+        self._initialize(self._directory, *self.__credentials)
+
     def is_open(self):
         return self.db_is_open
 
@@ -1313,6 +1602,13 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         """
         raise NotImplementedError
 
+    def _iter_gramps_ids(self, obj_key):
+        """
+        Iterate over the (handle, gramps_id) pairs of all the objects of a
+        table, to load the Gramps ID index.
+        """
+        raise NotImplementedError
+
     def get_person_gramps_ids(self):
         """
         Return a list of Gramps IDs, one ID for each Person in the
@@ -1387,11 +1683,28 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             raise HandleError("Handle is None")
         if not handle:
             raise HandleError("Handle is empty")
+        if self._cache.is_enabled(obj_key):
+            data = self._get_cached_raw_data(obj_key, handle)
+            if data:
+                return self.serializer.data_to_object(obj_class, data)
+        else:
+            obj = self._get_object(obj_key, obj_class, handle)
+            if obj is not None:
+                return obj
+
+        raise HandleError(f"Handle {handle} not found")
+
+    def _get_object(self, obj_key, obj_class, handle):
+        """
+        Return the object with the given handle, or None if it is not found.
+
+        Backends that store serialized strings can override this method to
+        decode the stored string into an object in a single pass.
+        """
         data = self._get_raw_data(obj_key, handle)
         if data:
             return self.serializer.data_to_object(obj_class, data)
-
-        raise HandleError(f"Handle {handle} not found")
+        return None
 
     def get_event_from_handle(self, handle):
         return self._get_from_handle(EVENT_KEY, Event, handle)
@@ -1423,6 +1736,91 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
     def get_tag_from_handle(self, handle):
         return self._get_from_handle(TAG_KEY, Tag, handle)
 
+    ################################################################
+    #
+    # get_*_from_handles methods
+    #
+    ################################################################
+
+    def _get_from_handles(self, obj_key, obj_class, handles):
+        """
+        Return a list of objects for the given handles, in handle order.
+
+        Duplicate, empty and missing handles are skipped. Objects found in
+        the object cache are served from it; the rest are fetched from the
+        backend in bulk.
+        """
+        handles = [handle for handle in dict.fromkeys(handles) if handle]
+        objects = {}
+        if self._cache.is_enabled(obj_key):
+            missing = []
+            for handle in handles:
+                data = self._cache.get(obj_key, handle)
+                if data is None:
+                    missing.append(handle)
+                else:
+                    objects[handle] = self.serializer.data_to_object(obj_class, data)
+            for handle, data in self._iter_raw_data_from_handles(obj_key, missing):
+                self._cache.put(obj_key, handle, data)
+                objects[handle] = self.serializer.data_to_object(obj_class, data)
+        else:
+            objects.update(self._iter_objects_from_handles(obj_key, obj_class, handles))
+        return [objects[handle] for handle in handles if handle in objects]
+
+    def _iter_raw_data_from_handles(self, obj_key, handles):
+        """
+        Iterate over (handle, raw data) pairs for the given handles.
+
+        Missing handles are skipped. Backends that can fetch several rows
+        in a single query should override this method.
+        """
+        for handle in handles:
+            data = self._get_raw_data(obj_key, handle)
+            if data:
+                yield (handle, data)
+
+    def _iter_objects_from_handles(self, obj_key, obj_class, handles):
+        """
+        Iterate over (handle, object) pairs for the given handles.
+
+        Missing handles are skipped. Backends that can fetch several rows
+        in a single query should override this method.
+        """
+        for handle in handles:
+            obj = self._get_object(obj_key, obj_class, handle)
+            if obj is not None:
+                yield (handle, obj)
+
+    def get_citations_from_handles(self, handles):
+        return self._get_from_handles(CITATION_KEY, Citation, handles)
+
+    def get_events_from_handles(self, handles):
+        return self._get_from_handles(EVENT_KEY, Event, handles)
+
+    def get_families_from_handles(self, handles):
+        return self._get_from_handles(FAMILY_KEY, Family, handles)
+
+    def get_media_from_handles(self, handles):
+        return self._get_from_handles(MEDIA_KEY, Media, handles)
+
+    def get_notes_from_handles(self, handles):
+        return self._get_from_handles(NOTE_KEY, Note, handles)
+
+    def get_people_from_handles(self, handles):
+        return self._get_from_handles(PERSON_KEY, Person, handles)
+
+    def get_places_from_handles(self, handles):
+        return self._get_from_handles(PLACE_KEY, Place, handles)
+
+    def get_repositories_from_handles(self, handles):
+        return self._get_from_handles(REPOSITORY_KEY, Repository, handles)
+
+    def get_sources_from_handles(self, handles):
+        return self._get_from_handles(SOURCE_KEY, Source, handles)
+
+    def get_tags_from_handles(self, handles):
+        return self._get_from_handles(TAG_KEY, Tag, handles)
+
     ################################################################
     #
     # get_*_from_gramps_id methods
@@ -1783,35 +2181,114 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         """
         raise NotImplementedError
 
+    def _get_cached_raw_data(self, obj_key, handle):
+        """
+        Return raw object data from the object cache, fetching it from the
+        backend on a cache miss.
+
+        The returned data is owned by the cache and must not be modified or
+        handed out to callers.
+        """
+        data = self._cache.get(obj_key, handle)
+        if data is None:
+            data = self._get_raw_data(obj_key, handle)
+            if data:
+                self._cache.put(obj_key, handle, data)
+        return data
+
+    def _get_raw_data_copy(self, obj_key, handle):
+        """
+        Return raw object data, using the object cache if it is enabled.
+        The cached data is copied with its nested lists and dicts, so the
+        caller can modify it.
+        """
+        if self._cache.is_enabled(obj_key):
+            data = self._get_cached_raw_data(obj_key, handle)
+            if data:
+                return copy.deepcopy(data)
+            return data
+        return self._get_raw_data(obj_key, handle)
+
     def get_raw_person_data(self, handle):
-        return self._get_raw_data(PERSON_KEY, handle)
+        return self._get_raw_data_copy(PERSON_KEY, handle)
 
     def get_raw_family_data(self, handle):
-        return self._get_raw_data(FAMILY_KEY, handle)
+        return self._get_raw_data_copy(FAMILY_KEY, handle)
 
     def get_raw_source_data(self, handle):
-        return self._get_raw_data(SOURCE_KEY, handle)
+        return self._get_raw_data_copy(SOURCE_KEY, handle)
 
     def get_raw_citation_data(self, handle):
-        return self._get_raw_data(CITATION_KEY, handle)
+        return self._get_raw_data_copy(CITATION_KEY, handle)
 
     def get_raw_event_data(self, handle):
-        return self._get_raw_data(EVENT_KEY, handle)
+        return self._get_raw_data_copy(EVENT_KEY, handle)
 
     def get_raw_media_data(self, handle):
-        return self._get_raw_data(MEDIA_KEY, handle)
+        return self._get_raw_data_copy(MEDIA_KEY, handle)
 
     def get_raw_place_data(self, handle):
-        return self._get_raw_data(PLACE_KEY, handle)
+        return self._get_raw_data_copy(PLACE_KEY, handle)
 
     def get_raw_repository_data(self, handle):
-        return self._get_raw_data(REPOSITORY_KEY, handle)
+        return self._get_raw_data_copy(REPOSITORY_KEY, handle)
 
     def get_raw_note_data(self, handle):
-        return self._get_raw_data(NOTE_KEY, handle)
+        return self._get_raw_data_copy(NOTE_KEY, handle)
 
     def get_raw_tag_data(self, handle):
-        return self._get_raw_data(TAG_KEY, handle)
+        return self._get_raw_data_copy(TAG_KEY, handle)
+
+    ################################################################
+    #
+    # Object cache methods
+    #
+    ################################################################
+
+    def set_cache_size(self, size, obj_key=None, memory=0):
+        """
+        Set the maximum number of objects cached for a table.
+
+        :param size: The maximum number of objects, 0 to disable the cache.
+        :type size: int
+        :param obj_key: The object table key, e.g. PERSON_KEY, or None for
+                        all tables.
+        :type obj_key: int
+        :param memory: The maximum estimated memory of the objects cached
+                       for a table in bytes, 0 for no limit.
+        :type memory: int
+        """
+        if obj_key is None:
+            for key in KEY_TO_NAME_MAP:
+                self._cache.set_size(key, size, memory)
+        else:
+            self._cache.set_size(obj_key, size, memory)
+
+    def clear_cache(self, obj_key=None, handle=None):
+        """
+        Remove entries from the object cache.
+
+        If a handle is given only that object is removed, otherwise all
+        objects of the table are removed.  If obj_key is None the whole
+        cache is cleared.
+        """
+        if handle is not None:
+            self._cache.invalidate(obj_key, handle)
+        else:
+            self._cache.clear(obj_key)
+
+    def get_cache_statistics(self):
+        """
+        Return a dictionary of object cache statistics, keyed by table name.
+
+        Each value is a dictionary with the size of the table, the number of
+        entries, their estimated memory, and the number of hits, misses and
+        evictions.
+        """
+        return {
+            KEY_TO_NAME_MAP[obj_key]: stats
+            for obj_key, stats in self._cache.get_statistics().items()
+        }
 
     ################################################################
     #
@@ -2656,10 +3133,12 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
     def _get_person_data(self, person):
         """
-        Given a Person, return primary_name.first_name and surname.
+        Given a Person, return primary_name.first_name, surname and the
+        sorted name of the primary name in the current name format.
         """
         given_name = ""
         surname = ""
+        sort_name = ""
         if person:
             primary_name = person.get_primary_name()
             if primary_name:
@@ -2669,7 +3148,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
                     surname_obj = surname_list[0]
                     if surname_obj:
                         surname = surname_obj.surname
-        return (given_name, surname)
+                sort_name = name_displayer.sorted_name(primary_name)
+        return (given_name, surname, sort_name)
 
     def _get_place_data(self, place):
         """
@@ -2699,6 +3179,7 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             gramps_upgrade_19,
             gramps_upgrade_20,
             gramps_upgrade_21,
+            gramps_upgrade_22,
         )
 
         if version < 14:
@@ -2717,6 +3198,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             gramps_upgrade_20(self)
         if version < 21:
             gramps_upgrade_21(self)
+        if version < 22:
+            gramps_upgrade_22(self)
 
         self.rebuild_secondary(callback)
         self.reindex_reference_map(callback)
@@ -2741,3 +3224,4 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
             self.serializer = BlobSerializer
         elif serializer_name == "json":
             self.serializer = JSONSerializer
+        self._cache.clear()
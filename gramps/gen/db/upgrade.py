@@ -63,6 +63,17 @@ _ = glocale.translation.gettext
 LOG = logging.getLogger(".upgrade")
 
 
+def gramps_upgrade_22(self):
+    """
+    Add sort_name field to the person table. Its values are filled when
+    the secondary columns are rebuilt after the upgrade.
+    """
+    self._txn_begin()
+    self.upgrade_table_for_sort_name()
+    self._set_metadata("version", 22, use_txn=False)
+    self._txn_commit()
+
+
 def gramps_upgrade_21(self):
     """
     Add json_data field to tables.
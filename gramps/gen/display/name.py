@@ -439,6 +439,18 @@ class NameDisplay:
         global PAT_AS_SURN
         return PAT_AS_SURN
 
+    def get_sort_format_key(self):
+        """
+        Return a string that changes whenever the name formats or options
+        change in a way that can change the sorted names, so that sorted
+        names which are stored can be checked.
+        """
+        formats = sorted(
+            (num, value[_F_FMT], value[_F_ACT])
+            for num, value in self.name_formats.items()
+        )
+        return repr((formats, self.default_format, PAT_AS_SURN))
+
     def _format_fn(self, fmt_str):
         return lambda x: self.format_str(x, fmt_str)
 
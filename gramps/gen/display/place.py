@@ -27,8 +27,12 @@ Class handling displaying of places.
 # Python imports
 #
 # ---------------------------------------------------------------
+from __future__ import annotations
+
 import os
+import weakref
 import xml.dom.minidom
+from collections import defaultdict
 
 # -------------------------------------------------------------------------
 #
@@ -39,9 +43,307 @@ from ..const import PLACE_FORMATS, GRAMPS_LOCALE as glocale
 
 _ = glocale.translation.gettext
 from ..config import config
-from ..utils.location import get_location_list
+from ..utils.callback import Callback
+from ..utils.location import (
+    get_location_date,
+    get_location_list,
+    get_location_step,
+)
 from ..lib import PlaceType
 
+# The database signals after which the cached titles of the places, and of
+# the places they enclose, must be computed again
+SIGNALS = ["place-add", "place-update", "place-delete"]
+
+# The number of dates for which the location list of a place is kept
+_MAX_BUCKETS = 32
+
+_CACHES: weakref.WeakKeyDictionary[Callback, PlaceTitleCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_place_titles(db):
+    """
+    Return the cached titles of the places of a database or proxy, or None
+    if the database doesn't emit signals, so that the cache can't be kept up
+    to date.
+
+    None is also returned while a proxy records the objects read, in its
+    reads dictionary, as for the pages of an incremental web report: all
+    the places of a title must then be read through the proxy.
+    """
+    if getattr(db, "reads", None) is not None:
+        return None
+    # The database behind a proxy
+    basedb = getattr(db, "basedb", db)
+    if not isinstance(basedb, Callback):
+        return None
+    cache = _CACHES.get(basedb)
+    if cache is None:
+        cache = PlaceTitleCache()
+        cache.connect_db_signals(basedb)
+        _CACHES[basedb] = cache
+    return cache.get_titles(db)
+
+
+def _get_bucket(date):
+    """
+    Return the key of a date, for the location lists which depend on it.
+    """
+    if date is None:
+        return None
+    return (
+        date.calendar,
+        date.modifier,
+        date.quality,
+        tuple(date.dateval),
+        date.text,
+        date.newyear,
+    )
+
+
+def _is_dated(place):
+    """
+    Return True if the names or the enclosing places of a place depend on
+    the date.
+    """
+    for item in place.get_all_names() + place.get_placeref_list():
+        if not item.get_date_object().is_empty():
+            return True
+    return False
+
+
+def _is_raw_dated(data):
+    """
+    Return True if the names or the enclosing places of the raw data of a
+    place may depend on the date.
+    """
+    for item in [data["name"]] + data["alt_names"] + data["placeref_list"]:
+        date = item["date"]
+        if date["text"] or any(date["dateval"][:3]) or any(date["dateval"][4:7]):
+            return True
+    return False
+
+
+# -------------------------------------------------------------------------
+#
+# PlaceTitleCache class
+#
+# -------------------------------------------------------------------------
+class PlaceTitleCache:
+    """
+    The titles of the places of a database, and the location lists they are
+    made of.
+
+    A title is kept per database or proxy that the places were taken from,
+    since a proxy can hide some of the enclosing places.
+    """
+
+    def __init__(self):
+        self.titles = weakref.WeakKeyDictionary()
+
+    def connect_db_signals(self, db):
+        """
+        Forget the titles of the places which change, and of the places they
+        enclose.
+        """
+        for name in SIGNALS:
+            db.connect(name, self._datachange_callback)
+        db.connect("place-rebuild", self._rebuild_callback)
+
+    def _datachange_callback(self, handle_list=None):
+        for titles in self.titles.values():
+            titles.forget(handle_list)
+
+    def _rebuild_callback(self, *args):
+        self.titles.clear()
+
+    def get_titles(self, db):
+        """
+        Return the titles of the places of a database or proxy.
+        """
+        titles = self.titles.get(db)
+        if titles is None:
+            titles = self.titles[db] = PlaceTitles()
+        return titles
+
+
+# -------------------------------------------------------------------------
+#
+# PlaceTitles class
+#
+# -------------------------------------------------------------------------
+class PlaceTitles:
+    """
+    The titles of the places of a database or proxy.
+
+    The location list of a place only depends on the date if the place, or
+    one of the places enclosing it, has dated names or enclosing places.
+    Otherwise, the list and the titles are kept for all the dates.
+    """
+
+    def __init__(self):
+        # Handle -> {(language, date bucket): [(handle, name, type)]}
+        self.locations = {}
+        # Handle -> True if the location list depends on the date
+        self.dated = {}
+        # Handle -> {(format, date bucket): title}
+        self.titles = {}
+        # Handle -> handles of the places whose lists were made with it
+        self.enclosed = defaultdict(set)
+        # The keys of the formats that were precomputed for all the places
+        self.complete = set()
+
+    def forget(self, handles):
+        """
+        Forget the places and the places they enclose.
+        """
+        todo = list(handles)
+        while todo:
+            handle = todo.pop()
+            self.locations.pop(handle, None)
+            self.dated.pop(handle, None)
+            self.titles.pop(handle, None)
+            todo.extend(self.enclosed.pop(handle, ()))
+
+    def __get_key(self, handle, value, date):
+        dated = self.dated.get(handle)
+        if dated is None:
+            return None
+        return (value, _get_bucket(date) if dated else None)
+
+    def get_title(self, handle, fmt, date):
+        """
+        Return the title of a place in a format at a date, or None if it is
+        not known.
+        """
+        key = self.__get_key(handle, fmt, date)
+        if key is None:
+            return None
+        return self.titles.get(handle, {}).get(key)
+
+    def set_title(self, handle, fmt, date, title):
+        """
+        Keep the title of a place, whose location list is known.
+        """
+        key = self.__get_key(handle, fmt, date)
+        if key is not None:
+            titles = self.titles.setdefault(handle, {})
+            if len(titles) >= _MAX_BUCKETS:
+                titles.clear()
+            titles[key] = title
+
+    def __set_locations(self, handle, lang, date, dated, lines):
+        self.dated[handle] = dated
+        locations = self.locations.setdefault(handle, {})
+        if len(locations) >= _MAX_BUCKETS:
+            locations.clear()
+        locations[self.__get_key(handle, lang, date)] = lines
+
+    def get_location_list(self, db, place, date=None, lang=""):
+        """
+        Return the location list of a place, as for
+        :func:`~gramps.gen.utils.location.get_location_list`.
+
+        The place can differ from the one in the database, as in an editor,
+        so that only the places enclosing it are taken from the cache.
+        """
+        if date is None:
+            date = get_location_date(place)
+        name, handle = get_location_step(place, date, lang)
+        lines = [(name, place.get_type())]
+        if handle is not None and handle != place.handle:
+            if place.handle:
+                self.enclosed[handle].add(place.handle)
+            chain = self.get_locations(db, handle, date, lang, (place.handle,))
+            if chain is None:
+                return get_location_list(db, place, date, lang)
+            lines.extend((name, place_type) for dummy, name, place_type in chain)
+        return lines
+
+    def get_locations(self, db, handle, date, lang="", visited=()):
+        """
+        Return the location list of the place with a handle as a list of
+        (handle, name, type) tuples, or None if it goes back to one of the
+        visited places.
+        """
+        key = self.__get_key(handle, lang, date)
+        if key is not None:
+            lines = self.locations.get(handle, {}).get(key)
+            if lines is not None:
+                return lines
+        place = db.get_place_from_handle(handle)
+        if place is None:
+            self.__set_locations(handle, lang, date, False, [])
+            return []
+        if date is None:
+            date = get_location_date(place)
+        name, parent = get_location_step(place, date, lang)
+        lines = [(handle, name, place.get_type())]
+        dated = _is_dated(place)
+        if parent is not None and parent != handle:
+            if parent in visited:
+                # Not the list of the place on its own
+                return None
+            self.enclosed[parent].add(handle)
+            chain = self.get_locations(db, parent, date, lang, visited + (handle,))
+            if chain is None:
+                return None
+            lines.extend(chain)
+            dated = dated or self.dated.get(parent, True)
+        self.__set_locations(handle, lang, date, dated, lines)
+        return lines
+
+    def precompute(self, db, formats):
+        """
+        Compute the location lists and titles of the places of a database,
+        in one pass over the place tree.  The places whose location list
+        depends on the date are left to be computed when displayed.
+
+        @param: formats -- The place formats to compute the titles in
+        """
+        formats = [pf for pf in formats if _get_format_key(pf) not in self.complete]
+        if not formats:
+            return
+        languages = {pf.language for pf in formats}
+        for handle, data in db._iter_raw_place_tree_data():
+            if not isinstance(data, dict):
+                # Not the raw data of a JSON database
+                return
+            parent = None
+            if data["placeref_list"]:
+                parent = data["placeref_list"][0]["ref"]
+                if self.dated.get(parent) is not False:
+                    continue
+            if _is_raw_dated(data):
+                continue
+            names = [data["name"]] + data["alt_names"]
+            place_type = PlaceType(data["place_type"])
+            if parent is not None:
+                self.enclosed[parent].add(handle)
+            for lang in languages:
+                name = names[0]["value"]
+                for place_name in names:
+                    if place_name["lang"] == lang:
+                        name = place_name["value"]
+                        break
+                lines = [(handle, name, place_type)]
+                if parent is not None:
+                    chain = self.locations[parent].get((lang, None))
+                    if chain is None:
+                        break
+                    lines.extend(chain)
+                self.__set_locations(handle, lang, None, False, lines)
+            else:
+                for pf in formats:
+                    lines = self.locations[handle][(pf.language, None)]
+                    title = _format_places(
+                        pf, [(name, place_type) for dummy, name, place_type in lines]
+                    )
+                    self.set_title(handle, _get_format_key(pf), None, title)
+        self.complete.update(_get_format_key(pf) for pf in formats)
+
 
 # -------------------------------------------------------------------------
 #
@@ -79,11 +381,27 @@ class PlaceDisplay:
         if not event:
             return ""
         place_handle = event.get_place_handle()
-        if place_handle:
+        if not place_handle:
+            return ""
+        titles = get_place_titles(db)
+        if titles is None or not config.get("preferences.place-auto"):
             place = db.get_place_from_handle(place_handle)
             return self.display(db, place, event.get_date_object(), fmt)
-        else:
-            return ""
+        if fmt == -1:
+            fmt = config.get("preferences.place-format")
+        pf = self.place_formats[fmt]
+        fmt_key = _get_format_key(pf)
+        date = event.get_date_object()
+        title = titles.get_title(place_handle, fmt_key, date)
+        if title is None:
+            lines = titles.get_locations(db, place_handle, date, pf.language)
+            if lines is None:
+                place = db.get_place_from_handle(place_handle)
+                return self.display(db, place, date, fmt)
+            all_places = [(name, place_type) for dummy, name, place_type in lines]
+            title = _format_places(pf, all_places)
+            titles.set_title(place_handle, fmt_key, date, title)
+        return title
 
     def display(self, db, place, date=None, fmt=-1):
         if not place:
@@ -95,55 +413,34 @@ class PlaceDisplay:
                 fmt = config.get("preferences.place-format")
             pf = self.place_formats[fmt]
             lang = pf.language
-            all_places = get_location_list(db, place, date, lang)
-
-            # Apply format string to place list
-            index = _find_populated_place(all_places)
-            places = []
-            for slice in pf.levels.split(","):
-                parts = slice.split(":")
-                if len(parts) == 1:
-                    offset = _get_offset(parts[0], index)
-                    if offset is not None:
-                        try:
-                            places.append(all_places[offset])
-                        except IndexError:
-                            pass
-                elif len(parts) == 2:
-                    start = _get_offset(parts[0], index)
-                    end = _get_offset(parts[1], index)
-                    if start is None:
-                        places.extend(all_places[:end])
-                    elif end is None:
-                        places.extend(all_places[start:])
-                    else:
-                        places.extend(all_places[start:end])
-
-            if pf.street:
-                types = [item[1] for item in places]
-                try:
-                    idx = types.index(PlaceType.NUMBER)
-                except ValueError:
-                    idx = None
-                if idx is not None and len(places) > idx + 1:
-                    if pf.street == 1:
-                        combined = (
-                            places[idx][0] + " " + places[idx + 1][0],
-                            places[idx + 1][1],
-                        )
-                    else:
-                        combined = (
-                            places[idx + 1][0] + " " + places[idx][0],
-                            places[idx + 1][1],
-                        )
-                    places = places[:idx] + [combined] + places[idx + 2 :]
-
-            names = [item[0] for item in places]
-            if pf.reverse:
-                names.reverse()
-
-            # TODO for Arabic, should the next line's comma be translated?
-            return ", ".join(names)
+            titles = get_place_titles(db)
+            if titles is None:
+                all_places = get_location_list(db, place, date, lang)
+            else:
+                all_places = titles.get_location_list(db, place, date, lang)
+            return _format_places(pf, all_places)
+
+    def precompute(self, db, fmt=None):
+        """
+        Compute the titles of all the places of a database in one pass over
+        the place tree, for the views and reports which display them all.
+
+        @param: fmt -- The index of the place format, or None for all the
+                       formats
+        """
+        if not config.get("preferences.place-auto"):
+            return
+        titles = get_place_titles(db)
+        if titles is None or getattr(db, "basedb", db) is not db:
+            # The raw data of the database is not filtered by the proxy
+            return
+        if fmt is None:
+            formats = self.place_formats
+        elif fmt == -1:
+            formats = [self.place_formats[config.get("preferences.place-format")]]
+        else:
+            formats = [self.place_formats[fmt]]
+        titles.precompute(db, formats)
 
     def get_formats(self):
         return self.place_formats
@@ -182,6 +479,66 @@ class PlaceDisplay:
             doc.writexml(f_d, addindent="  ", newl="\n", encoding="utf-8")
 
 
+def _get_format_key(pf):
+    """
+    Return the key of a place format, which can be edited in place.
+    """
+    return (pf.levels, pf.language, pf.street, pf.reverse)
+
+
+def _format_places(pf, all_places):
+    """
+    Return the title of a place from its location list, in a place format.
+    """
+    # Apply format string to place list
+    index = _find_populated_place(all_places)
+    places = []
+    for slice in pf.levels.split(","):
+        parts = slice.split(":")
+        if len(parts) == 1:
+            offset = _get_offset(parts[0], index)
+            if offset is not None:
+                try:
+                    places.append(all_places[offset])
+                except IndexError:
+                    pass
+        elif len(parts) == 2:
+            start = _get_offset(parts[0], index)
+            end = _get_offset(parts[1], index)
+            if start is None:
+                places.extend(all_places[:end])
+            elif end is None:
+                places.extend(all_places[start:])
+            else:
+                places.extend(all_places[start:end])
+
+    if pf.street:
+        types = [item[1] for item in places]
+        try:
+            idx = types.index(PlaceType.NUMBER)
+        except ValueError:
+            idx = None
+        if idx is not None and len(places) > idx + 1:
+            if pf.street == 1:
+                combined = (
+                    places[idx][0] + " " + places[idx + 1][0],
+                    places[idx + 1][1],
+                )
+            else:
+                combined = (
+                    places[idx + 1][0] + " " + places[idx][0],
+                    places[idx + 1][1],
+                )
+            places = places[:idx] + [combined] + places[idx + 2 :]
+
+    names = [item[0] for item in places]
+    if pf.reverse:
+        names.reverse()
+
+    # TODO for Arabic, should the next line's comma be translated?
+    return ", ".join(names)
+
+
 def _get_offset(value, index):
     if index is not None and value.startswith("p"):
         try:
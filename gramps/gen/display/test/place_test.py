@@ -0,0 +1,127 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the cached place titles.
+"""
+
+import unittest
+from unittest import mock
+
+from gramps.gen.config import config
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.display.place import PlaceDisplay
+from gramps.gen.lib import Date, Event, Place, PlaceName, PlaceRef, PlaceType
+
+
+class PlaceTitleTest(unittest.TestCase):
+    def setUp(self):
+        config.set("preferences.place-auto", True)
+        config.set("preferences.place-format", 0)
+        self.displayer = PlaceDisplay()
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn("Add places", self.db) as trans:
+            self.country = self.add_place("Country", PlaceType.COUNTRY, None, trans)
+            self.county = self.add_place(
+                "County", PlaceType.COUNTY, self.country, trans
+            )
+            self.city = self.add_place("City", PlaceType.CITY, self.county, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_place(self, name, place_type, parent, trans):
+        place = Place()
+        place.set_name(PlaceName(value=name))
+        place.set_type(place_type)
+        if parent is not None:
+            placeref = PlaceRef()
+            placeref.ref = parent
+            place.add_placeref(placeref)
+        return self.db.add_place(place, trans)
+
+    def rename(self, handle, name, date=None):
+        """
+        Give a place a new name, from a date if any.
+        """
+        place = self.db.get_place_from_handle(handle)
+        if date is not None:
+            place.add_alternative_name(place.get_name())
+        place_name = PlaceName(value=name)
+        if date is not None:
+            place_name.set_date_object(date)
+        place.set_name(place_name)
+        with DbTxn("Rename place", self.db) as trans:
+            self.db.commit_place(place, trans)
+
+    def title(self, date=None):
+        event = Event()
+        event.set_place_handle(self.city)
+        if date is not None:
+            event.set_date_object(date)
+        return self.displayer.display_event(self.db, event)
+
+    def test_cached(self):
+        self.assertEqual(self.title(), "City, County, Country")
+        with mock.patch.object(self.db, "get_place_from_handle") as get_place:
+            self.assertEqual(self.title(), "City, County, Country")
+            get_place.assert_not_called()
+
+    def test_enclosing_place_changed(self):
+        self.assertEqual(self.title(), "City, County, Country")
+        self.rename(self.country, "Land")
+        self.assertEqual(self.title(), "City, County, Land")
+
+    def test_dated_name(self):
+        self.assertEqual(self.title(), "City, County, Country")
+        date = Date()
+        date.set(modifier=Date.MOD_AFTER, value=(0, 0, 1900, False))
+        self.rename(self.county, "Shire", date)
+        self.assertEqual(self.title(Date(1850)), "City, County, Country")
+        self.assertEqual(self.title(Date(1950)), "City, Shire, Country")
+        self.assertEqual(self.title(Date(1850)), "City, County, Country")
+
+    def test_edited_place(self):
+        self.assertEqual(self.title(), "City, County, Country")
+        place = self.db.get_place_from_handle(self.city)
+        place.set_name(PlaceName(value="Town"))
+        self.assertEqual(
+            self.displayer.display(self.db, place), "Town, County, Country"
+        )
+
+    def test_precompute(self):
+        self.displayer.precompute(self.db)
+        with mock.patch.object(self.db, "get_place_from_handle") as get_place:
+            self.assertEqual(self.title(), "City, County, Country")
+            get_place.assert_not_called()
+        self.rename(self.county, "Shire")
+        self.assertEqual(self.title(), "City, Shire, Country")
+
+    def test_precompute_once(self):
+        self.displayer.precompute(self.db)
+        with mock.patch.object(self.db, "_iter_raw_place_tree_data") as iter_data:
+            self.displayer.precompute(self.db)
+            iter_data.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,14 @@
 Package providing filtering framework for Gramps.
 """
 
+# ------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+# ------------------------------------------------------------------------
+import multiprocessing
+import os
+
 # ------------------------------------------------------------------------
 #
 # Gramps imports
@@ -39,11 +47,53 @@ from ..lib.repo import Repository
 from ..lib.media import Media
 from ..lib.note import Note
 from ..lib.tag import Tag
-from ..lib.serialize import from_dict
+from ..lib.serialize import DataDict, from_dict
+from ..config import config
 from ..const import GRAMPS_LOCALE as glocale
 
 _ = glocale.translation.gettext
 
+# The minimum number of objects for which a filter is applied in parallel
+PARALLEL_MIN_OBJECTS = 10000
+
+# The state of a worker process, set by _init_worker
+_WORKER = None
+
+
+def _to_data_dict(data):
+    """
+    Wrap the raw data of an object in a DataDict, unless it already is one.
+    """
+    if isinstance(data, DataDict):
+        return data
+    return DataDict(data)
+
+
+def _init_worker(filter_, db_class, directory):
+    """
+    Open the database read-only and prepare the filter in a worker process.
+    """
+    global _WORKER
+    from ..db.dbconst import DBMODE_R
+
+    db = db_class()
+    db.load(directory, mode=DBMODE_R)
+    for rule in filter_.flist:
+        rule.requestprepare(db, None)
+    _WORKER = (filter_, db)
+
+
+def _check_chunk(args):
+    """
+    Apply the filter of a worker process to a part of the objects.
+    """
+    id_list, tupleind = args
+    filter_, db = _WORKER
+    res = filter_.check_sql(db, id_list, None, tupleind)
+    if res is None:
+        res = filter_.get_check_func()(db, id_list, None, tupleind)
+    return res
+
 
 # -------------------------------------------------------------------------
 #
@@ -136,6 +186,12 @@ class GenericFilter:
     def find_from_handle(self, db, handle):
         return db.get_person_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_people_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_person_handles()
+
     def get_number(self, db):
         return db.get_number_of_people()
 
@@ -144,9 +200,10 @@ class GenericFilter:
         if user:
             user.begin_progress(_("Filter"), _("Applying ..."), self.get_number(db))
         if id_list is None:
+            make_obj = self.get_data_func()
             with self.get_tree_cursor(db) if tree else self.get_cursor(db) as cursor:
                 for handle, data in cursor:
-                    person = from_dict(data)
+                    person = make_obj(data)
                     if user:
                         user.step_progress()
                     if task(db, person) != self.invert:
@@ -172,9 +229,10 @@ class GenericFilter:
         if user:
             user.begin_progress(_("Filter"), _("Applying ..."), self.get_number(db))
         if id_list is None:
+            make_obj = self.get_data_func()
             with self.get_tree_cursor(db) if tree else self.get_cursor(db) as cursor:
                 for handle, data in cursor:
-                    person = from_dict(data)
+                    person = make_obj(data)
                     if user:
                         user.step_progress()
                     val = all(rule.apply(db, person) for rule in flist)
@@ -233,7 +291,175 @@ class GenericFilter:
     def check(self, db, handle):
         return self.get_check_func()(db, [handle])
 
-    def apply(self, db, id_list=None, tupleind=None, user=None, tree=False):
+    @staticmethod
+    def defines_with_apply(rule, name):
+        """
+        Return True if the attribute name of a rule is defined by the same
+        class as its apply method, or by a subclass of it.
+
+        A rule that overrides apply, but not the attribute, can't rely on
+        the attribute that it inherits.
+        """
+        for cls in type(rule).__mro__:
+            if name in cls.__dict__:
+                return True
+            if "apply" in cls.__dict__:
+                return False
+        return False
+
+    @staticmethod
+    def get_rule_sql(rule):
+        """
+        Return the SQL condition of a rule, or None if it has none.
+        """
+        if GenericFilter.defines_with_apply(rule, "to_sql"):
+            return rule.to_sql()
+        return None
+
+    @staticmethod
+    def get_rule_data_fields(rule):
+        """
+        Return the fields of the raw data read by a rule, or None if the
+        rule needs the full object.
+        """
+        if GenericFilter.defines_with_apply(rule, "data_fields"):
+            return rule.data_fields
+        return None
+
+    def get_data_func(self):
+        """
+        Return the function that converts the raw data of the cursor into
+        the object passed to the rules.
+
+        If all rules can be applied to the raw data, it is only wrapped in
+        a DataDict, so that the full object isn't built for every row.
+        """
+        if all(self.get_rule_data_fields(rule) is not None for rule in self.flist):
+            return _to_data_dict
+        return from_dict
+
+    def check_sql(self, db, id_list, user=None, tupleind=None, tree=False):
+        """
+        Apply the filter by pushing the rules that can be expressed in SQL
+        down to the database.
+
+        The other rules are only applied to the objects matched by the SQL
+        query. Returns None if the filter can't be applied this way, e.g.
+        because the database doesn't support SQL queries.
+        """
+        if self.logical_op not in ("and", "or"):
+            return None
+        if tree and type(self).get_tree_cursor is not GenericFilter.get_tree_cursor:
+            # The tree cursor returns the objects in a particular order
+            return None
+        clauses = []
+        values = []
+        residual = []
+        for rule in self.flist:
+            sql = self.get_rule_sql(rule)
+            if sql is None:
+                residual.append(rule)
+            else:
+                clauses.append("(%s)" % sql[0])
+                values += sql[1]
+        if not clauses or (residual and (self.invert or self.logical_op == "or")):
+            return None
+        where = (" %s " % self.logical_op.upper()).join(clauses)
+        if self.invert:
+            where = "NOT (%s)" % where
+        class_name = self.make_obj().__class__.__name__
+        handles = db.find_handles_where(class_name, where, values)
+        if handles is None:
+            return None
+
+        if id_list is not None:
+            candidates = set(handles)
+            if tupleind is None:
+                handles = [handle for handle in id_list if handle in candidates]
+            else:
+                handles = [data[tupleind] for data in id_list]
+                handles = [handle for handle in handles if handle in candidates]
+        if residual:
+            if user:
+                user.begin_progress(_("Filter"), _("Applying ..."), len(handles))
+            matches = set()
+            for obj in self.find_from_handles(db, handles):
+                if user:
+                    user.step_progress()
+                if all(rule.apply(db, obj) for rule in residual):
+                    matches.add(obj.handle)
+            if user:
+                user.end_progress()
+            handles = [handle for handle in handles if handle in matches]
+        if id_list is None or tupleind is None:
+            return handles
+        matches = set(handles)
+        return [data for data in id_list if data[tupleind] in matches]
+
+    def check_parallel(
+        self, db, id_list, user=None, tupleind=None, tree=False, processes=None
+    ):
+        """
+        Apply the filter in several worker processes, each of which opens the
+        database read-only and checks a part of the objects.
+
+        Rules that are not parallel are prepared once, before the workers are
+        started, and the workers inherit them. The other rules are prepared
+        in each worker. Returns None if the filter can't be applied this way,
+        e.g. because the database is not stored in a directory or worker
+        processes can't be forked.
+        """
+        from ..db.generic import DbGeneric
+
+        if processes is None:
+            processes = config.get("behavior.filter-processes")
+        if processes == 0:
+            processes = os.cpu_count() or 1
+        if processes < 2 or tree or not isinstance(db, DbGeneric):
+            return None
+        directory = db.get_save_path()
+        if not directory or directory == ":memory:":
+            return None
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            return None
+        if id_list is None:
+            # List the handles in the order of the cursor, so that the result
+            # doesn't depend on the number of processes
+            class_name = self.make_obj().__class__.__name__
+            id_list = db.find_handles_where(class_name, "1", [])
+            if id_list is None:
+                id_list = list(self.get_handles(db))
+            tupleind = None
+        if len(id_list) < PARALLEL_MIN_OBJECTS:
+            return None
+
+        size = -(-len(id_list) // (processes * 4))
+        chunks = [
+            (id_list[index : index + size], tupleind)
+            for index in range(0, len(id_list), size)
+        ]
+        prepared = [rule for rule in self.flist if not rule.parallel]
+        for rule in prepared:
+            rule.requestprepare(db, user)
+        final_list = []
+        if user:
+            user.begin_progress(_("Filter"), _("Applying ..."), len(chunks))
+        with context.Pool(processes, _init_worker, (self, type(db), directory)) as pool:
+            for res in pool.imap(_check_chunk, chunks):
+                if user:
+                    user.step_progress()
+                final_list.extend(res)
+        if user:
+            user.end_progress()
+        for rule in prepared:
+            rule.requestreset()
+        return final_list
+
+    def apply(
+        self, db, id_list=None, tupleind=None, user=None, tree=False, processes=None
+    ):
         """
         Apply the filter using db.
         If id_list given, the handles in id_list are used. If not given
@@ -245,15 +471,24 @@ class GenericFilter:
 
         user is optional. If present it must be an instance of a User class.
 
+        processes is the number of worker processes used to apply the filter
+        in parallel, see check_parallel. 0 means one per CPU. If it is not
+        given, the "behavior.filter-processes" setting is used.
+
         :Returns: if id_list given, it is returned with the items that
                 do not match the filter, filtered out.
                 if id_list not given, all items in the database that
                 match the filter are returned as a list of handles
         """
+        res = self.check_parallel(db, id_list, user, tupleind, tree, processes)
+        if res is not None:
+            return res
         m = self.get_check_func()
         for rule in self.flist:
             rule.requestprepare(db, user)
-        res = m(db, id_list, user, tupleind, tree)
+        res = self.check_sql(db, id_list, user, tupleind, tree)
+        if res is None:
+            res = m(db, id_list, user, tupleind, tree)
         for rule in self.flist:
             rule.requestreset()
         return res
@@ -272,6 +507,12 @@ class GenericFamilyFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_family_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_families_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_family_handles()
+
     def get_number(self, db):
         return db.get_number_of_families()
 
@@ -289,6 +530,12 @@ class GenericEventFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_event_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_events_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_event_handles()
+
     def get_number(self, db):
         return db.get_number_of_events()
 
@@ -306,6 +553,12 @@ class GenericSourceFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_source_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_sources_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_source_handles()
+
     def get_number(self, db):
         return db.get_number_of_sources()
 
@@ -326,6 +579,12 @@ class GenericCitationFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_citation_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_citations_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_citation_handles()
+
     def get_number(self, db):
         return db.get_number_of_citations()
 
@@ -346,6 +605,12 @@ class GenericPlaceFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_place_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_places_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_place_handles()
+
     def get_number(self, db):
         return db.get_number_of_places()
 
@@ -363,6 +628,12 @@ class GenericMediaFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_media_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_media_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_media_handles()
+
     def get_number(self, db):
         return db.get_number_of_media()
 
@@ -380,6 +651,12 @@ class GenericRepoFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_repository_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_repositories_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_repository_handles()
+
     def get_number(self, db):
         return db.get_number_of_repositories()
 
@@ -397,6 +674,12 @@ class GenericNoteFilter(GenericFilter):
     def find_from_handle(self, db, handle):
         return db.get_note_from_handle(handle)
 
+    def find_from_handles(self, db, handles):
+        return db.get_notes_from_handles(handles)
+
+    def get_handles(self, db):
+        return db.get_note_handles()
+
     def get_number(self, db):
         return db.get_number_of_notes()
 
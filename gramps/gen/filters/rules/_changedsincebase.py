@@ -58,6 +58,7 @@ class ChangedSinceBase(Rule):
         "date/time is given."
     )
     category = _("General filters")
+    data_fields = ("change",)
 
     def add_time(self, date):
         if re.search(r"\d.*\s+\d{1,2}:\d{2}:\d{2}", date):
@@ -102,7 +103,7 @@ class ChangedSinceBase(Rule):
             self.before = self.time_str_to_sec(self.list[1])
 
     def apply(self, db, obj):
-        obj_time = obj.get_change_time()
+        obj_time = obj.change
         if self.since:
             if obj_time < self.since:
                 return False
@@ -112,3 +113,12 @@ class ChangedSinceBase(Rule):
         if self.before:
             return obj_time < self.before
         return False
+
+    def to_sql(self):
+        if self.since:
+            if self.before:
+                return ("change >= ? AND change < ?", [self.since, self.before])
+            return ("change >= ?", [self.since])
+        if self.before:
+            return ("change < ?", [self.before])
+        return ("1 = 0", [])
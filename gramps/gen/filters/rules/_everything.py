@@ -46,6 +46,7 @@ class Everything(Rule):
     name = "Every object"
     category = _("General filters")
     description = "Matches every object in the database"
+    data_fields = ()
 
     def is_empty(self):
         return True
@@ -48,6 +48,7 @@ class HasGrampsId(Rule):
     name = "Object with <Id>"
     description = "Matches objects with a specified Gramps ID"
     category = _("General filters")
+    data_fields = ("gramps_id",)
 
     def apply(self, db, obj):
         """
@@ -55,3 +56,6 @@ class HasGrampsId(Rule):
         return true if the rule passes, false otherwise.
         """
         return obj.gramps_id == self.list[0]
+
+    def to_sql(self):
+        return ("gramps_id = ?", [self.list[0]])
@@ -52,6 +52,7 @@ class HasTagBase(Rule):
     name = "Objects with the <tag>"
     description = "Matches objects with the given tag"
     category = _("General filters")
+    data_fields = ("tag_list",)
 
     def prepare(self, db, user):
         """
@@ -68,4 +69,13 @@ class HasTagBase(Rule):
         """
         if self.tag_handle is None:
             return False
-        return self.tag_handle in obj.get_tag_list()
+        return self.tag_handle in obj.tag_list
+
+    def to_sql(self):
+        if self.tag_handle is None:
+            return ("1 = 0", [])
+        return (
+            "handle IN (SELECT obj_handle FROM reference "
+            "WHERE ref_handle = ? AND ref_class = 'Tag')",
+            [self.tag_handle],
+        )
@@ -42,6 +42,10 @@ class IsPrivate(Rule):
     name = "Objects marked private"
     description = "Matches objects that are indicated as private"
     category = _("General filters")
+    data_fields = ("private",)
 
     def apply(self, db, obj):
-        return obj.get_privacy()
+        return obj.private
+
+    def to_sql(self):
+        return ("private = 1", [])
@@ -39,6 +39,10 @@ class IsPublic(Rule):
     name = "Objects not marked private"
     description = "Matches objects that are not indicated as private"
     category = _("General filters")
+    data_fields = ("private",)
 
     def apply(self, db, obj):
-        return not obj.get_privacy()
+        return not obj.private
+
+    def to_sql(self):
+        return ("private = 0", [])
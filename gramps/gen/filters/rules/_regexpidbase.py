@@ -55,6 +55,17 @@ class RegExpIdBase(Rule):
     )
     category = _("General filters")
     allow_regex = True
+    data_fields = ("gramps_id",)
 
     def apply(self, db, obj):
         return self.match_substring(0, obj.gramps_id)
+
+    def to_sql(self):
+        text = self.list[0]
+        if not text:
+            return ("1 = 1", [])
+        if self.use_regex or not text.isascii():
+            # LIKE only folds the case of ASCII characters
+            return None
+        text = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return ("gramps_id LIKE ? ESCAPE '\\'", ["%" + text + "%"])
@@ -59,6 +59,15 @@ class Rule:
     category = _("Miscellaneous filters")
     description = _("No description")
     allow_regex = False
+    # The fields read by apply, if it only reads these fields as attributes
+    # and calls no methods, so that the rule can be applied to the raw data
+    # of an object (a DataDict). None if apply needs the full object.
+    data_fields: tuple[str, ...] | None = None
+    # False if prepare computes a result over the whole database, so that
+    # the rule is prepared only once when a filter is applied in parallel.
+    # The apply method of such a rule must not use the database saved by
+    # prepare, since the worker processes have their own connection.
+    parallel = True
 
     def __init__(self, arg, use_regex=False, use_case=False):
         self.list = []
@@ -155,6 +164,19 @@ class Rule:
         """Apply the rule to some database entry; must be overwritten."""
         return True
 
+    def to_sql(self):
+        """
+        Return an SQL condition equivalent to the apply method, or None if
+        the rule can't be expressed in SQL.
+
+        The condition is a (clause, values) tuple, where the clause is a
+        WHERE clause on the table of the filtered object type that uses "?"
+        placeholders for the values. It may only use the secondary columns
+        of the table (see get_secondary_fields) and the reference table.
+        It is called after the rule has been prepared.
+        """
+        return None
+
     def display_values(self):
         """Return the labels and values of this rule."""
         l_v = (
@@ -141,6 +141,7 @@ class DeepRelationshipPathBetween(Rule):
         " target people.  Each path is not necessarily"
         " the shortest path."
     )
+    parallel = False
 
     def prepare(self, db, user):
         root_person_id = self.list[0]
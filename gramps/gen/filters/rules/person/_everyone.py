@@ -46,6 +46,7 @@ class Everyone(Rule):
     name = _("Everyone")
     category = _("General filters")
     description = _("Matches everyone in the database")
+    data_fields = ()
 
     def is_empty(self):
         return True
@@ -32,7 +32,6 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
-from ....utils.db import for_each_ancestor
 from ._hascommonancestorwith import HasCommonAncestorWith
 from ._matchesfilter import MatchesFilter
 
@@ -53,18 +52,9 @@ class HasCommonAncestorWithFilterMatch(HasCommonAncestorWith):
     )
     category = _("Ancestral filters")
 
-    def __init__(self, list, use_regex=False, use_case=False):
-        HasCommonAncestorWith.__init__(self, list, use_regex, use_case)
-        self.ancestor_cache = {}
-
     def prepare(self, db, user):
         self.db = db
-        # For each(!) person we keep track of who their ancestors
-        # are, in a set(). So we only have to compute a person's
-        # ancestor list once.
-        # Start with filling the cache for root person (gramps_id in self.list[0])
-        self.ancestor_cache = {}
-        self.with_people = []
+        self.matches = set()
         self.filt = MatchesFilter(self.list)
         self.filt.requestprepare(db, user)
         if user:
@@ -73,19 +63,17 @@ class HasCommonAncestorWithFilterMatch(HasCommonAncestorWith):
                 _("Retrieving all sub-filter matches"),
                 db.get_number_of_people(),
             )
+        handles = []
         for handle in db.iter_person_handles():
             person = db.get_person_from_handle(handle)
             if user:
                 user.step_progress()
             if person and self.filt.apply(db, person):
-                # store all people in the filter so as to compare later
-                self.with_people.append(person.handle)
-                # fill list of ancestor of person if not present yet
-                if handle not in self.ancestor_cache:
-                    self.add_ancs(db, person)
+                handles.append(handle)
+        self.add_matches(db, handles)
         if user:
             user.end_progress()
 
     def reset(self):
         self.filt.requestreset()
-        self.ancestor_cache = {}
+        self.matches = set()
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -47,6 +48,7 @@ class IsAncestorOf(Rule):
     name = _("Ancestors of <person>")
     category = _("Ancestral filters")
     description = _("Matches people that are ancestors of a specified person")
+    parallel = False
 
     def prepare(self, db, user):
         """Assume that if 'Inclusive' not defined, assume inclusive"""
@@ -71,18 +73,10 @@ class IsAncestorOf(Rule):
     def init_ancestor_list(self, db, person, first):
         if not person:
             return
-        if person.handle in self.map:
-            return
-        if not first:
-            self.map.add(person.handle)
-        fam_id = person.get_main_parents_family_handle()
-        if fam_id:
-            fam = db.get_family_from_handle(fam_id)
-            if fam:
-                f_id = fam.get_father_handle()
-                m_id = fam.get_mother_handle()
+        self.add_ancestors(db, [person.handle], first)
 
-                if f_id:
-                    self.init_ancestor_list(db, db.get_person_from_handle(f_id), 0)
-                if m_id:
-                    self.init_ancestor_list(db, db.get_person_from_handle(m_id), 0)
+    def add_ancestors(self, db, handles, first):
+        graph = get_pedigree_graph(db)
+        self.map.update(
+            handle for handle, gen in graph.iter_ancestors(handles, inclusive=not first)
+        )
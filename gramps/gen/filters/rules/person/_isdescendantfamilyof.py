@@ -55,6 +55,7 @@ class IsDescendantFamilyOf(Rule):
         "Matches people that are descendants or the spouse "
         "of a descendant of a specified person"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
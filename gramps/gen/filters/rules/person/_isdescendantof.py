@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -48,6 +49,7 @@ class IsDescendantOf(Rule):
     name = _("Descendants of <person>")
     category = _("Descendant filters")
     description = _("Matches all descendants for the specified person")
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -69,14 +71,13 @@ class IsDescendantOf(Rule):
         return person.handle in self.map
 
     def init_list(self, person, first):
-        if not person or person.handle in self.map:
-            # if we have been here before, skip
+        if not person:
             return
-        if not first:
-            self.map.add(person.handle)
+        self.add_descendants([person.handle], first)
 
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(self.db.get_person_from_handle(child_ref.ref), 0)
+    def add_descendants(self, handles, first):
+        graph = get_pedigree_graph(self.db)
+        self.map.update(
+            handle
+            for handle, gen in graph.iter_descendants(handles, inclusive=not first)
+        )
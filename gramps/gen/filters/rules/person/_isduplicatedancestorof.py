@@ -51,6 +51,7 @@ class IsDuplicatedAncestorOf(Rule):
     description = _(
         "Matches people that are ancestors twice or more " "of a specified person"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -47,6 +47,10 @@ class IsFemale(Rule):
     name = _("Females")
     category = _("General filters")
     description = _("Matches all females")
+    data_fields = ("gender",)
 
     def apply(self, db, person):
         return person.gender == Person.FEMALE
+
+    def to_sql(self):
+        return ("gender = ?", [Person.FEMALE])
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -51,6 +52,7 @@ class IsLessThanNthGenerationAncestorOf(Rule):
         "Matches people that are ancestors "
         "of a specified person not more than N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -62,27 +64,12 @@ class IsLessThanNthGenerationAncestorOf(Rule):
                 self.init_ancestor_list(root_handle)
 
     def init_ancestor_list(self, root_handle):
-        queue = [(root_handle, 1)]  # generation 1 is root
-        while queue:
-            handle, gen = queue.pop(0)  # pop off front of queue
-            if handle in self.map:
-                # if we have been here before, skip
-                continue
-            self.map.add(handle)
-            gen += 1
-            if gen <= int(self.list[1]):
-                p = self.db.get_person_from_handle(handle)
-                fam_id = p.get_main_parents_family_handle()
-                if fam_id:
-                    fam = self.db.get_family_from_handle(fam_id)
-                    if fam:
-                        f_id = fam.get_father_handle()
-                        m_id = fam.get_mother_handle()
-                        # append to back of queue:
-                        if f_id:
-                            queue.append((f_id, gen))
-                        if m_id:
-                            queue.append((m_id, gen))
+        # generation 1 is root
+        max_gen = max(int(self.list[1]) - 1, 0)
+        graph = get_pedigree_graph(self.db)
+        self.map.update(
+            handle for handle, gen in graph.iter_ancestors([root_handle], max_gen)
+        )
 
     def reset(self):
         self.map.clear()
@@ -57,6 +57,7 @@ class IsLessThanNthGenerationAncestorOfBookmarked(Rule):
         "Matches ancestors of the people on the bookmark list "
         "not more than N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
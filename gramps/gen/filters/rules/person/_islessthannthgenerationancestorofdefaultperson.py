@@ -51,6 +51,7 @@ class IsLessThanNthGenerationAncestorOfDefaultPerson(Rule):
     description = _(
         "Matches ancestors of the Home Person " "not more than N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -51,6 +52,7 @@ class IsLessThanNthGenerationDescendantOf(Rule):
         "Matches people that are descendants of a "
         "specified person not more than N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -68,18 +70,13 @@ class IsLessThanNthGenerationDescendantOf(Rule):
         return person.handle in self.map
 
     def init_list(self, person, gen):
-        if not person or person.handle in self.map:
-            # if we have been here before, skip
+        if not person:
             return
-        if gen:
-            self.map.add(person.handle)
-            if gen >= int(self.list[1]):
-                return
-
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(
-                        self.db.get_person_from_handle(child_ref.ref), gen + 1
-                    )
+        max_gen = max(int(self.list[1]) - gen, 1)
+        graph = get_pedigree_graph(self.db)
+        self.map.update(
+            handle
+            for handle, generation in graph.iter_descendants(
+                [person.handle], max_gen, inclusive=False
+            )
+        )
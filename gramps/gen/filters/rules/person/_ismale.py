@@ -47,6 +47,10 @@ class IsMale(Rule):
     name = _("Males")
     category = _("General filters")
     description = _("Matches all males")
+    data_fields = ("gender",)
 
     def apply(self, db, person):
         return person.gender == Person.MALE
+
+    def to_sql(self):
+        return ("gender = ?", [Person.MALE])
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -51,6 +52,7 @@ class IsMoreThanNthGenerationAncestorOf(Rule):
         "Matches people that are ancestors "
         "of a specified person at least N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -62,24 +64,11 @@ class IsMoreThanNthGenerationAncestorOf(Rule):
                 self.init_ancestor_list(root_handle)
 
     def init_ancestor_list(self, root_handle):
-        queue = [(root_handle, 1)]  # generation 1 is root
-        while queue:
-            handle, gen = queue.pop(0)  # pop off front of queue
-            if gen > int(self.list[1]):
-                self.map.add(handle)
-            gen += 1
-            p = self.db.get_person_from_handle(handle)
-            fam_id = p.get_main_parents_family_handle()
-            if fam_id:
-                fam = self.db.get_family_from_handle(fam_id)
-                if fam:
-                    f_id = fam.get_father_handle()
-                    m_id = fam.get_mother_handle()
-                    # append to back of queue:
-                    if f_id:
-                        queue.append((f_id, gen))
-                    if m_id:
-                        queue.append((m_id, gen))
+        # generation 1 is root
+        graph = get_pedigree_graph(self.db)
+        self.map.update(
+            graph.iter_deep_ancestors([root_handle], max(int(self.list[1]), 0))
+        )
 
     def reset(self):
         self.map.clear()
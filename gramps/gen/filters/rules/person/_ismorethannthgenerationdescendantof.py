@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 # -------------------------------------------------------------------------
+from ....utils.pedigree import get_pedigree_graph
 from .. import Rule
 
 
@@ -51,6 +52,7 @@ class IsMoreThanNthGenerationDescendantOf(Rule):
         "Matches people that are descendants of a specified "
         "person at least N generations away"
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
@@ -70,13 +72,6 @@ class IsMoreThanNthGenerationDescendantOf(Rule):
     def init_list(self, person, gen):
         if not person:
             return
-        if gen >= int(self.list[1]):
-            self.map.add(person.handle)
-
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(
-                        self.db.get_person_from_handle(child_ref.ref), gen + 1
-                    )
+        min_gen = max(int(self.list[1]) - gen, 0)
+        graph = get_pedigree_graph(self.db)
+        self.map.update(graph.iter_deep_descendants([person.handle], min_gen))
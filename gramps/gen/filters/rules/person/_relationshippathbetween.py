@@ -52,6 +52,7 @@ class RelationshipPathBetween(Rule):
         "to a common ancestor, producing the relationship "
         "path between two persons."
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
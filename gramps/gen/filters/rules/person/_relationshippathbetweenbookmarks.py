@@ -57,6 +57,7 @@ class RelationshipPathBetweenBookmarks(Rule):
         "back to common ancestors, producing the relationship "
         "path(s) between bookmarked persons."
     )
+    parallel = False
 
     def prepare(self, db, user):
         self.db = db
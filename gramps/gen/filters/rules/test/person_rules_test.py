@@ -23,14 +23,18 @@ Unittest that tests person-specific filter rules
 """
 import unittest
 import os
+import tempfile
 from time import perf_counter
 import inspect
+from unittest.mock import patch
 
 from ....filters import reload_custom_filters
 
 reload_custom_filters()
-from ....db.utils import import_as_dict
+from ....db.utils import import_as_dict, import_from_filename, make_database
 from ....filters import GenericFilter, CustomFilters
+from ....lib import Person
+from ....lib.serialize import from_dict
 from ....const import DATA_DIR
 from ....user import User
 from ....utils.unittest import localize_date
@@ -1270,6 +1274,158 @@ class BaseTest(unittest.TestCase):
         )
         self.assertEqual(self.filter_with_rule(rule), set(["GNUJQCL9MD64AM56OH"]))
 
+    def __check_sql(self, rules, l_op="and", invert=False, id_list=None):
+        """
+        Check that applying the filter with SQL gives the same result as
+        applying it in Python.
+        """
+        filter_ = GenericFilter()
+        filter_.set_rules(rules)
+        filter_.set_logical_op(l_op)
+        filter_.set_invert(invert)
+        for rule in rules:
+            rule.requestprepare(self.db, None)
+        results = filter_.check_sql(self.db, id_list)
+        expected = filter_.get_check_func()(self.db, id_list)
+        for rule in rules:
+            rule.requestreset()
+        self.assertIsNotNone(results)
+        # The handles are in the order of id_list, or of the cursor
+        self.assertEqual(results, expected)
+
+    def test_sql_and(self):
+        """
+        Test SQL pushdown of rules combined with "and".
+        """
+        self.__check_sql([IsMale([]), HasIdOf(["I0044"])])
+
+    def test_sql_or(self):
+        """
+        Test SQL pushdown of rules combined with "or".
+        """
+        self.__check_sql([IsFemale([]), HasIdOf(["I0044"])], l_op="or")
+
+    def test_sql_invert(self):
+        """
+        Test SQL pushdown of an inverted filter.
+        """
+        self.__check_sql([IsMale([])], invert=True)
+
+    def test_sql_order(self):
+        """
+        Test that SQL pushdown keeps the order of the cursor when the query
+        uses an index.
+        """
+        self.__check_sql(
+            [HasIdOf(["I0044"]), HasIdOf(["I0001"]), HasIdOf(["I0002"])], l_op="or"
+        )
+
+    def test_sql_residual(self):
+        """
+        Test SQL pushdown with a rule that is applied in Python.
+        """
+        self.__check_sql([IsFemale([]), RegExpName(["^Garner"], use_regex=True)])
+
+    def test_sql_id_list(self):
+        """
+        Test SQL pushdown when a list of handles is given.
+        """
+        id_list = sorted(self.db.get_person_handles())[:500]
+        self.__check_sql([IsMale([]), HavePhotos([0, "greater than"])], id_list=id_list)
+
+    def test_sql_no_sql(self):
+        """
+        Test that filters with an "or" of rules that can't all be expressed in
+        SQL are applied in Python.
+        """
+        filter_ = GenericFilter()
+        filter_.set_rules([IsMale([]), RegExpName(["^Garner"], use_regex=True)])
+        filter_.set_logical_op("or")
+        self.assertIsNone(filter_.check_sql(self.db, None))
+
+    def test_data_fields(self):
+        """
+        Test that rules which declare the fields they read are applied to
+        the raw data, and give the same result as on the full objects.
+        """
+        filter_ = GenericFilter()
+        filter_.set_rules([Everyone([]), IsMale([])])
+        self.assertIsNot(filter_.get_data_func(), from_dict)
+        expected = set(
+            person.handle
+            for person in self.db.iter_people()
+            if person.gender == Person.MALE
+        )
+        self.assertEqual(set(filter_.check_and(self.db, None)), expected)
+        filter_.add_rule(RegExpName(["^Garner"], use_regex=True))
+        self.assertIs(filter_.get_data_func(), from_dict)
+
+
+class ParallelTest(unittest.TestCase):
+    """
+    Tests of applying person filters in worker processes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Import example database into a database in a temporary directory.
+        """
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.db = make_database("sqlite")
+        cls.db.load(cls.tmpdir.name)
+        import_from_filename(cls.db, EXAMPLE, User())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        cls.tmpdir.cleanup()
+
+    def check_parallel(self, rules, id_list=None):
+        """
+        Check that applying the filter in parallel gives the same result as
+        applying it in this process.
+        """
+        filter_ = GenericFilter()
+        filter_.set_rules(rules)
+        expected = filter_.apply(self.db, id_list, processes=1)
+        with patch("gramps.gen.filters._genericfilter.PARALLEL_MIN_OBJECTS", 1):
+            results = filter_.check_parallel(self.db, id_list, processes=2)
+        self.assertIsNotNone(results)
+        self.assertEqual(results, expected)
+        for rule in rules:
+            self.assertEqual(rule.nrprepare, 0)
+
+    def test_parallel(self):
+        """
+        Test a rule that is prepared in each worker process.
+        """
+        self.check_parallel([RegExpName(["^Garner"], use_regex=True)])
+
+    def test_parallel_prepared(self):
+        """
+        Test a rule that is prepared before the worker processes are started.
+        """
+        self.check_parallel(
+            [IsDescendantOf(["I0044", 1]), HavePhotos([0, "greater than"])]
+        )
+
+    def test_parallel_id_list(self):
+        """
+        Test applying a filter in parallel to a list of handles.
+        """
+        id_list = sorted(self.db.get_person_handles())[:500]
+        self.check_parallel([IsMale([])], id_list)
+
+    def test_parallel_memory(self):
+        """
+        Test that a filter is not applied in parallel to an in-memory database.
+        """
+        db = import_as_dict(EXAMPLE, User())
+        filter_ = GenericFilter()
+        filter_.set_rules([IsMale([])])
+        self.assertIsNone(filter_.check_parallel(db, None, processes=2))
+
 
 if __name__ == "__main__":
     unittest.main()
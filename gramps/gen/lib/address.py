@@ -55,6 +55,21 @@ class Address(
     Provides address information.
     """
 
+    __slots__ = (
+        "private",
+        "citation_list",
+        "note_list",
+        "date",
+        "street",
+        "locality",
+        "city",
+        "county",
+        "state",
+        "country",
+        "postal",
+        "phone",
+    )
+
     def __init__(self, source=None):
         """
         Create a new Address instance, copying from the source if provided.
@@ -43,6 +43,8 @@ class AttributeRootBase:
     Base class for attribute-aware objects.
     """
 
+    __slots__ = ()
+
     _CLASS = AttributeRoot
 
     def __init__(self, source=None):
@@ -158,6 +160,8 @@ class AttributeBase(AttributeRootBase):
     Base class for an Attribute list.
     """
 
+    __slots__ = ()
+
     _CLASS = Attribute
 
 
@@ -171,4 +175,6 @@ class SrcAttributeBase(AttributeRootBase):
     Base class for a SrcAttribute list.
     """
 
+    __slots__ = ()
+
     _CLASS = SrcAttribute
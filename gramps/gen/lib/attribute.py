@@ -62,6 +62,8 @@ class AttributeRoot(SecondaryObject, PrivacyBase):
     Gramps at the moment does not support this GEDCOM Attribute structure.
     """
 
+    __slots__ = ("private", "type", "value")
+
     def __init__(self, source=None):
         """
         Create a new Attribute object, copying from the source if provided.
@@ -87,7 +89,7 @@ class AttributeRoot(SecondaryObject, PrivacyBase):
         """
         (privacy, the_type, self.value) = data
         PrivacyBase.unserialize(self, privacy)
-        self.type.unserialize(the_type)
+        self.type = self.type.get_shared(*the_type)
         return self
 
     def get_text_data_list(self):
@@ -167,7 +169,7 @@ class AttributeRoot(SecondaryObject, PrivacyBase):
 
     def set_type(self, val):
         """Set the type (or key) of the Attribute instance."""
-        self.type.set(val)
+        self.type = self.type.__class__(val)
 
     def get_type(self):
         """Return the type (or key) or the Attribute instance."""
@@ -192,6 +194,8 @@ class Attribute(AttributeRoot, CitationBase, NoteBase):
     An attribute class that supports citation and note annotations.
     """
 
+    __slots__ = ("citation_list", "note_list")
+
     def __init__(self, source=None):
         """
         Create a new Attribute object, copying from the source if provided.
@@ -227,7 +231,7 @@ class Attribute(AttributeRoot, CitationBase, NoteBase):
         PrivacyBase.unserialize(self, privacy)
         CitationBase.unserialize(self, citation_list)
         NoteBase.unserialize(self, note_list)
-        self.type.unserialize(the_type)
+        self.type = self.type.get_shared(*the_type)
         return self
 
     @classmethod
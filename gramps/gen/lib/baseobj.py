@@ -28,9 +28,38 @@ Base Object class for Gramps
 # Python modules
 #
 # -------------------------------------------------------------------------
+import logging
 import re
 from abc import ABCMeta, abstractmethod
 
+LOG = logging.getLogger(".gen.lib")
+
+# -------------------------------------------------------------------------
+#
+# Functions
+#
+# -------------------------------------------------------------------------
+# The public slot names of each class, from the base classes down
+_PUBLIC_SLOTS: dict[type, tuple[str, ...]] = {}
+
+
+def _get_public_slots(cls):
+    """
+    Return the names of the public attributes that the instances of a class
+    store in slots.
+    """
+    try:
+        return _PUBLIC_SLOTS[cls]
+    except KeyError:
+        pass
+    names = []
+    for klass in reversed(cls.__mro__):
+        for name in klass.__dict__.get("__slots__", ()):
+            if not name.startswith("_") and name not in names:
+                names.append(name)
+    _PUBLIC_SLOTS[cls] = names = tuple(names)
+    return names
+
 
 # -------------------------------------------------------------------------
 #
@@ -44,8 +73,15 @@ class BaseObject(metaclass=ABCMeta):
 
     Its main goal is to provide common capabilites to all objects, such as
     searching through all available information.
+
+    The data objects store their attributes in ``__slots__`` rather than in an
+    instance dictionary, which keeps large trees compact in memory.  Mixin
+    classes declare empty slots, and the classes that hold the data declare
+    the attributes they set.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def serialize(self):
         """
@@ -73,11 +109,19 @@ class BaseObject(metaclass=ABCMeta):
                   of the object.
         :rtype: dict
         """
-        attr_dict = dict(
-            (key, value)
-            for key, value in self.__dict__.items()
-            if not key.startswith("_")
-        )
+        attr_dict = {}
+        for key in _get_public_slots(self.__class__):
+            try:
+                attr_dict[key] = getattr(self, key)
+            except AttributeError:
+                pass
+        if hasattr(self, "__dict__"):
+            # Classes derived outside of gen.lib may not define __slots__
+            attr_dict.update(
+                (key, value)
+                for key, value in self.__dict__.items()
+                if not key.startswith("_")
+            )
         attr_dict["_class"] = self.__class__.__name__
         return attr_dict
 
@@ -97,7 +141,16 @@ class BaseObject(metaclass=ABCMeta):
                           the object.
         :type attr_dict: dict
         """
-        self.__dict__.update(attr_dict)
+        for key, value in attr_dict.items():
+            if key != "_class":
+                try:
+                    setattr(self, key, value)
+                except AttributeError:
+                    # An attribute which the class no longer has, such as the
+                    # position of a person in trees imported by old versions
+                    LOG.debug(
+                        "ignoring %s attribute '%s'", self.__class__.__name__, key
+                    )
 
     def matches_string(self, pattern, case_sensitive=False):
         """
@@ -53,6 +53,8 @@ class ChildRef(SecondaryObject, PrivacyBase, CitationBase, NoteBase, RefBase):
     A class for tracking information about how a child relates to their parents.
     """
 
+    __slots__ = ("private", "citation_list", "note_list", "ref", "frel", "mrel")
+
     def __init__(self, source=None):
         PrivacyBase.__init__(self, source)
         CitationBase.__init__(self, source)
@@ -87,10 +89,8 @@ class ChildRef(SecondaryObject, PrivacyBase, CitationBase, NoteBase, RefBase):
         CitationBase.unserialize(self, citation_list)
         NoteBase.unserialize(self, note_list)
         RefBase.unserialize(self, ref)
-        self.frel = ChildRefType()
-        self.frel.unserialize(frel)
-        self.mrel = ChildRefType()
-        self.mrel.unserialize(mrel)
+        self.frel = ChildRefType.get_shared(*frel)
+        self.mrel = ChildRefType.get_shared(*mrel)
         return self
 
     @classmethod
@@ -216,7 +216,7 @@ class ChildRef(SecondaryObject, PrivacyBase, CitationBase, NoteBase, RefBase):
 
     def set_mother_relation(self, rel):
         """Set relation between the person and mother."""
-        self.mrel.set(rel)
+        self.mrel = ChildRefType(rel)
 
     def get_mother_relation(self):
         """Return the relation between the person and mother."""
@@ -224,7 +224,7 @@ class ChildRef(SecondaryObject, PrivacyBase, CitationBase, NoteBase, RefBase):
 
     def set_father_relation(self, frel):
         """Set relation between the person and father."""
-        self.frel.set(frel)
+        self.frel = ChildRefType(frel)
 
     def get_father_relation(self):
         """Return the relation between the person and father."""
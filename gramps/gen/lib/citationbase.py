@@ -55,6 +55,8 @@ class CitationBase:
     class. I.e. SourceRef = CitationBase + Citation
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Create a new CitationBase, copying from source if not None.
@@ -266,6 +268,8 @@ class IndirectCitationBase:
               objects.
     """
 
+    __slots__ = ()
+
     def has_citation_reference(self, citation_handle):
         """
         Return True if any of the child objects has reference to this citation
@@ -79,6 +79,17 @@ class Event(
     Compare this with attribute: :class:`~.attribute.Attribute`
     """
 
+    __slots__ = (
+        "citation_list",
+        "note_list",
+        "media_list",
+        "attribute_list",
+        "date",
+        "place",
+        "__description",
+        "__type",
+    )
+
     def __init__(self, source=None):
         """
         Create a new Event instance, copying from the source if present.
@@ -245,8 +256,7 @@ class Event(
             self.private,
         ) = data
 
-        self.__type = EventType()
-        self.__type.unserialize(the_type)
+        self.__type = EventType.get_shared(*the_type)
         DateBase.unserialize(self, date)
         MediaBase.unserialize(self, media_list)
         AttributeBase.unserialize(self, attribute_list)
@@ -436,7 +446,7 @@ class Event(
         :param the_type: Type to assign to the Event
         :type the_type: tuple
         """
-        self.__type.set(the_type)
+        self.__type = EventType(the_type)
 
     def get_type(self):
         """
@@ -59,6 +59,15 @@ class EventRef(
     to the referenced event.
     """
 
+    __slots__ = (
+        "private",
+        "citation_list",
+        "note_list",
+        "attribute_list",
+        "ref",
+        "__role",
+    )
+
     def __init__(self, source=None):
         """
         Create a new EventRef instance, copying from the source if present.
@@ -153,8 +162,7 @@ class EventRef(
         NoteBase.unserialize(self, note_list)
         AttributeBase.unserialize(self, attribute_list)
         RefBase.unserialize(self, ref)
-        self.__role = EventRoleType()
-        self.__role.unserialize(role)
+        self.__role = EventRoleType.get_shared(*role)
         return self
 
     def get_text_data_list(self):
@@ -261,6 +269,6 @@ class EventRef(
         """
         Set the role according to the given argument.
         """
-        self.__role.set(role)
+        self.__role = EventRoleType(role)
 
     role = property(get_role, set_role, None, "Returns or sets role property")
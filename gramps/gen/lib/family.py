@@ -87,6 +87,20 @@ class Family(
     or the changes will be lost.
     """
 
+    __slots__ = (
+        "citation_list",
+        "note_list",
+        "media_list",
+        "event_ref_list",
+        "attribute_list",
+        "lds_ord_list",
+        "father_handle",
+        "mother_handle",
+        "child_ref_list",
+        "type",
+        "complete",
+    )
+
     def __init__(self):
         """
         Create a new Family instance.
@@ -242,8 +256,7 @@ class Family(
             self.private,
         ) = data
 
-        self.type = FamilyRelType()
-        self.type.unserialize(the_type)
+        self.type = FamilyRelType.get_shared(*the_type)
         self.child_ref_list = [ChildRef().unserialize(cr) for cr in child_ref_list]
         MediaBase.unserialize(self, media_list)
         EventBase.unserialize(self, event_ref_list)
@@ -487,7 +500,7 @@ class Family(
                between the father and mother of the relationship.
         :type relationship_type: tuple
         """
-        self.type.set(relationship_type)
+        self.type = FamilyRelType(relationship_type)
 
     def get_relationship(self):
         """
@@ -57,6 +57,11 @@ class GrampsTypeMeta(type):
     Create the class-specific integer/string maps.
     """
 
+    def __new__(mcs, name, bases, namespace):
+        # The types hold no state besides the slots of GrampsType
+        namespace.setdefault("__slots__", ())
+        return type.__new__(mcs, name, bases, namespace)
+
     def __init__(cls, name, bases, namespace):
         # Helper function to create the maps
         def init_map(data, key_col, data_col, blacklist=None):
@@ -75,6 +80,9 @@ class GrampsTypeMeta(type):
         # Call superclass initialization
         type.__init__(cls, name, bases, namespace)
 
+        # The instances of the standard types that are shared by objects
+        cls._SHARED = {}
+
         # Build the integer/string maps
         if hasattr(cls, "_DATAMAP"):
             cls._I2SMAP = init_map(cls._DATAMAP, 0, 1, cls._BLACKLIST)
@@ -102,6 +110,10 @@ class GrampsType(metaclass=GrampsTypeMeta):
 
     :attribute value: (int) Returns or sets integer value
     :attribute string: (str) Returns or sets string value
+
+    The instances returned by :meth:`get_shared` are shared by all the objects
+    of a loaded tree that use the same standard type, and can not be modified.
+    The objects that hold a type replace it when it is set.
     """
 
     _CUSTOM = 0
@@ -114,6 +126,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
     _I2EMAP: dict[int, str] = {}
     _E2IMAP: dict[str, int] = {}
     _MENU: list[list[Any]] = []
+    _SHARED: dict[int, GrampsType] = {}
     __slots__ = ("__value", "__string")
 
     def __getstate__(self):
@@ -136,6 +149,37 @@ class GrampsType(metaclass=GrampsTypeMeta):
         if value is not None:
             self.set(value)
 
+    @classmethod
+    def get_shared(cls, value, string=""):
+        """
+        Return the type with the given value and custom string.
+
+        Standard types are returned as an instance shared by all the callers,
+        which must not be modified.  A new instance is returned for a custom
+        type.
+        """
+        if value == cls._CUSTOM:
+            return cls((value, string))
+        try:
+            return cls._SHARED[value]
+        except KeyError:
+            pass
+        obj = cls.__new__(cls)
+        obj.__value = value
+        obj.__string = ""
+        return cls._SHARED.setdefault(value, obj)
+
+    def __check_shared(self):
+        """
+        Raise an error if the instance is shared, see :meth:`get_shared`.
+        """
+        value = getattr(self, "_GrampsType__value", None)
+        if self._SHARED.get(value) is self:
+            raise TypeError(
+                "Shared %s can not be modified, set a new instance instead"
+                % self.__class__.__name__
+            )
+
     def get_object_state(self):
         """
         Get the current object state as a dictionary.
@@ -154,6 +198,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
 
         We override this method to handle the `value` and `string` properties.
         """
+        self.__check_shared()
         self.__value = attr_dict["value"]
         if self.__value == self._CUSTOM:
             self.__string = attr_dict["string"]
@@ -162,6 +207,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
 
     @singledispatchmethod
     def set(self, value):
+        self.__check_shared()
         self.__value = self._DEFAULT
         self.__string = ""
 
@@ -173,6 +219,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
     @set.register
     def __set_tuple(self, value: tuple):
         "Set the value/string properties from a tuple."
+        self.__check_shared()
         val, strg = self._DEFAULT, ""
         if value:
             val = value[0]
@@ -184,12 +231,14 @@ class GrampsType(metaclass=GrampsTypeMeta):
     @set.register
     def __set_int(self, value: int):
         "Set the value/string properties from an integer."
+        self.__check_shared()
         self.__value = value
         self.__string = ""
 
     # This method needs to be registered outside of the class.
     def __set_instance(self, value: GrampsType):
         "Set the value/string properties from another grampstype."
+        self.__check_shared()
         self.__value = value.value
         if self.__value == self._CUSTOM:
             self.__string = value.string
@@ -199,6 +248,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
     @set.register
     def __set_str(self, value: str):
         "Set the value/string properties from a string."
+        self.__check_shared()
         self.__value = self._S2IMAP.get(value, self._CUSTOM)
         if self.__value == self._CUSTOM:
             self.__string = value
@@ -210,6 +260,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
         This method sets the type instance based on the untranslated string
         (obtained e.g. from XML).
         """
+        self.__check_shared()
         if value in self._E2IMAP:
             self.__value = self._E2IMAP[value]
             self.__string = ""
@@ -275,6 +326,7 @@ class GrampsType(metaclass=GrampsTypeMeta):
 
     def unserialize(self, data):
         """Convert a serialized tuple of data to an object."""
+        self.__check_shared()
         self.__value, self.__string = data
         if self.__value != self._CUSTOM:
             self.__string = ""
@@ -42,6 +42,8 @@ class LdsOrdBase:
     Base class for lds_ord-aware objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Initialize a LdsOrdBase.
@@ -42,6 +42,8 @@ class MediaBase:
     Base class for storing media references.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Create a new MediaBase, copying from source if not None.
@@ -58,6 +58,24 @@ class Name(SecondaryObject, PrivacyBase, SurnameBase, CitationBase, NoteBase, Da
     object stores one of them
     """
 
+    __slots__ = (
+        "private",
+        "surname_list",
+        "citation_list",
+        "note_list",
+        "date",
+        "first_name",
+        "suffix",
+        "title",
+        "type",
+        "group_as",
+        "sort_as",
+        "display_as",
+        "call",
+        "nick",
+        "famnick",
+    )
+
     DEF = 0  # Default format (determined by gramps-wide prefs)
     LNFN = 1  # last name first name
     FNLN = 2  # first name last name
@@ -99,7 +117,7 @@ class Name(SecondaryObject, PrivacyBase, SurnameBase, CitationBase, NoteBase, Da
                 self.nick,
                 self.famnick,
             ) = data
-            self.type = NameType(name_type)
+            self.type = NameType.get_shared(*name_type)
             SurnameBase.unserialize(self, surname_list)
             PrivacyBase.unserialize(self, privacy)
             CitationBase.unserialize(self, citation_list)
@@ -233,7 +251,7 @@ class Name(SecondaryObject, PrivacyBase, SurnameBase, CitationBase, NoteBase, Da
             self.nick,
             self.famnick,
         ) = data
-        self.type = NameType(name_type)
+        self.type = NameType.get_shared(*name_type)
         PrivacyBase.unserialize(self, privacy)
         SurnameBase.unserialize(self, surname_list)
         CitationBase.unserialize(self, citation_list)
@@ -458,7 +476,7 @@ class Name(SecondaryObject, PrivacyBase, SurnameBase, CitationBase, NoteBase, Da
 
     def set_type(self, the_type):
         """Set the type of the Name instance."""
-        self.type.set(the_type)
+        self.type = NameType(the_type)
 
     def get_type(self):
         """Return the type of the Name instance."""
@@ -65,6 +65,8 @@ class Note(BasicPrimaryObject):
     :cvar FORMATTED: indicates formatted format (respecting whitespace needed)
     """
 
+    __slots__ = ("text", "format", "type")
+
     (FLOWED, FORMATTED) = list(range(2))
 
     def __init__(self, text=""):
@@ -143,8 +145,7 @@ class Note(BasicPrimaryObject):
 
         self.text = StyledText()
         self.text.unserialize(the_text)
-        self.type = NoteType()
-        self.type.unserialize(the_type)
+        self.type = NoteType.get_shared(*the_type)
         TagBase.unserialize(self, tag_list)
         return self
 
@@ -320,7 +321,7 @@ class Note(BasicPrimaryObject):
         :param the_type: descriptive type of the Note
         :type the_type: str
         """
-        self.type.set(the_type)
+        self.type = NoteType(the_type)
 
     def get_type(self):
         """Get descriptive type of the Note.
@@ -47,6 +47,8 @@ class NoteBase:
     as a note_list attribute of the NoteBase object.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Create a new NoteBase, copying from source if not None.
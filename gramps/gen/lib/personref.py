@@ -56,6 +56,8 @@ class PersonRef(SecondaryObject, PrivacyBase, CitationBase, NoteBase, RefBase):
     Examples would be: godparent, friend, etc.
     """
 
+    __slots__ = ("private", "citation_list", "note_list", "ref", "rel")
+
     def __init__(self, source=None):
         PrivacyBase.__init__(self, source)
         CitationBase.__init__(self, source)
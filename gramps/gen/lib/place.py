@@ -58,6 +58,22 @@ class Place(CitationBase, NoteBase, MediaBase, UrlBase, PrimaryObject):
     a collection of images and URLs, a note and a source.
     """
 
+    __slots__ = (
+        "citation_list",
+        "note_list",
+        "media_list",
+        "urls",
+        "long",
+        "lat",
+        "title",
+        "name",
+        "alt_names",
+        "placeref_list",
+        "place_type",
+        "code",
+        "alt_loc",
+    )
+
     def __init__(self, source=None):
         """
         Create a new Place object, copying from the source if present.
@@ -234,8 +250,7 @@ class Place(CitationBase, NoteBase, MediaBase, UrlBase, PrimaryObject):
             self.private,
         ) = data
 
-        self.place_type = PlaceType()
-        self.place_type.unserialize(the_type)
+        self.place_type = PlaceType.get_shared(*the_type)
         self.alt_loc = [Location().unserialize(al) for al in alt_loc]
         self.placeref_list = [PlaceRef().unserialize(pr) for pr in placeref_list]
         self.name = PlaceName().unserialize(name)
@@ -417,7 +432,7 @@ class Place(CitationBase, NoteBase, MediaBase, UrlBase, PrimaryObject):
         :param type: type to assign to the Place
         :type type: PlaceType
         """
-        self.place_type.set(place_type)
+        self.place_type = PlaceType(place_type)
 
     def get_type(self):
         """
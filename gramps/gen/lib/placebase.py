@@ -33,6 +33,8 @@ class PlaceBase:
     Base class for place-aware objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Initialize a PlaceBase.
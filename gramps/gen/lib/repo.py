@@ -50,6 +50,8 @@ _ = glocale.translation.gettext
 class Repository(NoteBase, AddressBase, UrlBase, IndirectCitationBase, PrimaryObject):
     """A location where collections of Sources are found."""
 
+    __slots__ = ("note_list", "address_list", "urls", "type", "name")
+
     def __init__(self):
         """
         Create a new Repository instance.
@@ -146,8 +148,7 @@ class Repository(NoteBase, AddressBase, UrlBase, IndirectCitationBase, PrimaryOb
             self.private,
         ) = data
 
-        self.type = RepositoryType()
-        self.type.unserialize(the_type)
+        self.type = RepositoryType.get_shared(*the_type)
         NoteBase.unserialize(self, note_list)
         AddressBase.unserialize(self, address_list)
         UrlBase.unserialize(self, urls)
@@ -230,7 +231,7 @@ class Repository(NoteBase, AddressBase, UrlBase, IndirectCitationBase, PrimaryOb
         :param the_type: descriptive type of the Repository
         :type the_type: str
         """
-        self.type.set(the_type)
+        self.type = RepositoryType(the_type)
 
     def get_type(self):
         """
@@ -51,6 +51,8 @@ class RepoRef(SecondaryObject, PrivacyBase, NoteBase, RefBase):
     Repository reference class.
     """
 
+    __slots__ = ("private", "note_list", "ref", "call_number", "media_type")
+
     def __init__(self, source=None):
         PrivacyBase.__init__(self, source)
         NoteBase.__init__(self, source)
@@ -79,8 +81,7 @@ class RepoRef(SecondaryObject, PrivacyBase, NoteBase, RefBase):
         Convert a serialized tuple of data to an object.
         """
         (note_list, ref, self.call_number, media_type, privacy) = data
-        self.media_type = SourceMediaType()
-        self.media_type.unserialize(media_type)
+        self.media_type = SourceMediaType.get_shared(*media_type)
         PrivacyBase.unserialize(self, privacy)
         NoteBase.unserialize(self, note_list)
         RefBase.unserialize(self, ref)
@@ -189,4 +190,4 @@ class RepoRef(SecondaryObject, PrivacyBase, NoteBase, RefBase):
         """
         Set the media type.
         """
-        self.media_type.set(media_type)
+        self.media_type = SourceMediaType(media_type)
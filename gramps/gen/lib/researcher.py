@@ -41,6 +41,20 @@ class Researcher(LocationBase):
     Contains the information about the owner of the database.
     """
 
+    __slots__ = (
+        "street",
+        "locality",
+        "city",
+        "county",
+        "state",
+        "country",
+        "postal",
+        "phone",
+        "name",
+        "addr",
+        "email",
+    )
+
     def __init__(self, source=None):
         """
         Initialize the Researcher object, copying from the source if provided.
@@ -163,11 +177,7 @@ class Researcher(LocationBase):
                   of the object.
         :rtype: dict
         """
-        attr_dict = dict(
-            (key, value)
-            for key, value in self.__dict__.items()
-            if not key.startswith("_")
-        )
+        attr_dict = {key: getattr(self, key) for key in Researcher.__slots__}
         attr_dict["_class"] = self.__class__.__name__
         return attr_dict
 
@@ -187,4 +197,6 @@ class Researcher(LocationBase):
                           the object.
         :type attr_dict: dict
         """
-        self.__dict__.update(attr_dict)
+        for key, value in attr_dict.items():
+            if key != "_class":
+                setattr(self, key, value)
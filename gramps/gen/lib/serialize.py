@@ -38,6 +38,7 @@ import logging
 #
 # ------------------------------------------------------------------------
 import gramps.gen.lib as lib
+from .grampstype import GrampsTypeMeta
 
 LOG = logging.getLogger(".serialize")
 
@@ -102,14 +103,52 @@ class DataList(list):
             return value
 
 
-def __object_hook(obj_dict):
-    _class = obj_dict.pop("_class")
-    cls = lib.__dict__[_class]
+def __create_object(cls, obj_dict):
+    """
+    Create an object of the given class from its state.
+
+    The standard types are shared, see
+    :meth:`~.grampstype.GrampsType.get_shared`.
+    """
+    if isinstance(cls, GrampsTypeMeta):
+        return cls.get_shared(obj_dict["value"], obj_dict["string"])
     obj = cls.__new__(cls)
     obj.set_object_state(obj_dict)
     return obj
 
 
+def __object_hook(obj_dict):
+    _class = obj_dict.pop("_class")
+    return __create_object(lib.__dict__[_class], obj_dict)
+
+
+def __build_object(value):
+    """
+    Recursively convert already-parsed JSON data into Gramps objects.
+
+    This performs the same conversion as decoding with `__object_hook`, but
+    walks the data structure directly instead of encoding it to a string and
+    parsing it again.  The given data is not modified.
+    """
+    if isinstance(value, dict):
+        obj_dict = {
+            key: (
+                __build_object(item) if isinstance(item, (dict, list)) else item
+            )
+            for key, item in value.items()
+        }
+        _class = obj_dict.pop("_class", None)
+        if _class is None:
+            return obj_dict
+        return __create_object(lib.__dict__[_class], obj_dict)
+    if isinstance(value, list):
+        return [
+            __build_object(item) if isinstance(item, (dict, list)) else item
+            for item in value
+        ]
+    return value
+
+
 def __default(obj):
     return obj.get_object_state()
 
@@ -162,7 +201,7 @@ def from_dict(dict):
     if dict is not None and "_object" in dict:
         return dict["_object"]
     else:
-        return from_json(json.dumps(dict))
+        return __build_object(dict)
 
 
 class BlobSerializer:
@@ -178,27 +217,34 @@ class BlobSerializer:
 
     @staticmethod
     def data_to_object(obj_class, data):
-        LOG.debug("blob, data_to_object: %s(%r)", obj_class, data[0] if data else data)
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "blob, data_to_object: %s(%r)", obj_class, data[0] if data else data
+            )
         return obj_class.create(data)
 
     @staticmethod
     def string_to_object(obj_class, bytes):
-        LOG.debug("blob, string_to_object: %r...", bytes[:35])
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("blob, string_to_object: %r...", bytes[:35])
         return obj_class.create(pickle.loads(bytes))
 
     @staticmethod
     def string_to_data(bytes):
-        LOG.debug("blob, string_to_data: %r...", bytes[:35])
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("blob, string_to_data: %r...", bytes[:35])
         return pickle.loads(bytes)
 
     @staticmethod
     def object_to_string(obj):
-        LOG.debug("blob, object_to_string: %s...", obj)
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("blob, object_to_string: %s...", obj)
         return pickle.dumps(obj.serialize())
 
     @staticmethod
     def data_to_string(data):
-        LOG.debug("blob, data_to_string: %s...", data[0] if data else data)
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("blob, data_to_string: %s...", data[0] if data else data)
         return pickle.dumps(data)
 
     @staticmethod
@@ -223,33 +269,38 @@ class JSONSerializer:
 
     @staticmethod
     def data_to_object(obj_class, data):
-        LOG.debug(
-            "json, data_to_object: {'_class': %r, ...}",
-            data["_class"] if (data and "_class" in data) else data,
-        )
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "json, data_to_object: {'_class': %r, ...}",
+                data["_class"] if (data and "_class" in data) else data,
+            )
         return from_dict(data)
 
     @staticmethod
     def string_to_object(obj_class, string):
-        LOG.debug("json, string_to_object: %r...", string[:65])
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("json, string_to_object: %r...", string[:65])
         return from_json(string)
 
     @staticmethod
     def string_to_data(string):
-        LOG.debug("json, string_to_data: %r...", string[:65])
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("json, string_to_data: %r...", string[:65])
         return DataDict(json.loads(string))
 
     @staticmethod
     def object_to_string(obj):
-        LOG.debug("json, object_to_string: %s...", obj)
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("json, object_to_string: %s...", obj)
         return to_json(obj)
 
     @staticmethod
     def data_to_string(data):
-        LOG.debug(
-            "json, data_to_string: {'_class': %r, ...}",
-            data["_class"] if (data and "_class" in data) else data,
-        )
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "json, data_to_string: {'_class': %r, ...}",
+                data["_class"] if (data and "_class" in data) else data,
+            )
         return json.dumps(data)
 
     @staticmethod
@@ -82,6 +82,8 @@ class StyledText(BaseObject):
         so if you intend to use a source tag more than once, copy it for use.
     """
 
+    __slots__ = ("_string", "_tags")
+
     def __init__(self, text="", tags=None):
         """Setup initial instance variable values."""
         self._string = text
@@ -54,6 +54,8 @@ class StyledTextTag(BaseObject):
 
     """
 
+    __slots__ = ("name", "value", "ranges")
+
     def __init__(self, name=None, value=None, ranges=None):
         """Setup initial instance variable values.
 
@@ -98,8 +100,7 @@ class StyledTextTag(BaseObject):
         """
         (the_name, self.value, self.ranges) = data
 
-        self.name = StyledTextTagType()
-        self.name.unserialize(the_name)
+        self.name = StyledTextTagType.get_shared(*the_name)
         return self
 
     @classmethod
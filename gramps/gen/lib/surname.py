@@ -49,6 +49,8 @@ class Surname(SecondaryObject):
     A person may have more that one surname in his name
     """
 
+    __slots__ = ("surname", "prefix", "primary", "origintype", "connector")
+
     def __init__(self, source=None, data=None):
         """
         Create a new Surname instance, copying from the source if provided.
@@ -119,7 +121,7 @@ class Surname(SecondaryObject):
             origin_type,
             self.connector,
         ) = data
-        self.origintype = NameOriginType(origin_type)
+        self.origintype = NameOriginType.get_shared(*origin_type)
         return self
 
     def get_text_data_list(self):
@@ -195,7 +197,7 @@ class Surname(SecondaryObject):
 
     def set_origintype(self, the_type):
         """Set the origin type of the Surname instance."""
-        self.origintype.set(the_type)
+        self.origintype = NameOriginType(the_type)
 
     def get_origintype(self):
         """Return the origin type of the Surname instance."""
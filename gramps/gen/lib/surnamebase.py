@@ -44,6 +44,8 @@ class SurnameBase:
     Base class for surname-aware objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Initialize a SurnameBase.
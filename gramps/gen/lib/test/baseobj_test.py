@@ -0,0 +1,145 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the object state of the slotted objects.
+"""
+
+import unittest
+
+from .. import (
+    Address,
+    Attribute,
+    ChildRef,
+    Citation,
+    Date,
+    Event,
+    EventRef,
+    EventType,
+    Family,
+    LdsOrd,
+    Location,
+    Media,
+    MediaRef,
+    Name,
+    Note,
+    Person,
+    PersonRef,
+    Place,
+    PlaceName,
+    PlaceRef,
+    RepoRef,
+    Repository,
+    Researcher,
+    Source,
+    SrcAttribute,
+    StyledText,
+    StyledTextTag,
+    Surname,
+    Tag,
+    Url,
+)
+from ..serialize import from_dict, to_dict
+
+CLASSES = (
+    Address,
+    Attribute,
+    ChildRef,
+    Citation,
+    Date,
+    Event,
+    EventRef,
+    EventType,
+    Family,
+    LdsOrd,
+    Location,
+    Media,
+    MediaRef,
+    Name,
+    Note,
+    Person,
+    PersonRef,
+    Place,
+    PlaceName,
+    PlaceRef,
+    RepoRef,
+    Repository,
+    Researcher,
+    Source,
+    SrcAttribute,
+    StyledText,
+    StyledTextTag,
+    Surname,
+    Tag,
+    Url,
+)
+
+
+class SlotsTest(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for cls in CLASSES:
+            with self.subTest(cls=cls.__name__):
+                self.assertFalse(hasattr(cls(), "__dict__"))
+
+    def test_object_state(self):
+        for cls in CLASSES:
+            with self.subTest(cls=cls.__name__):
+                state = cls().get_object_state()
+                self.assertEqual(state["_class"], cls.__name__)
+                obj = cls.__new__(cls)
+                obj.set_object_state(dict(state))
+                self.assertEqual(obj.get_object_state(), state)
+
+    def test_person_state(self):
+        person = Person()
+        person.set_gramps_id("I0001")
+        person.set_gender(Person.MALE)
+        state = person.get_object_state()
+        self.assertEqual(state["gramps_id"], "I0001")
+        self.assertEqual(state["gender"], Person.MALE)
+        self.assertNotIn("_Person__gender", state)
+        new = Person.__new__(Person)
+        new.set_object_state(state)
+        self.assertEqual(new.serialize(), person.serialize())
+
+    def test_unknown_attribute(self):
+        # Trees imported by old versions kept the position of the people
+        state = dict(Person().get_object_state(), position=[1, 2])
+        person = Person.__new__(Person)
+        person.set_object_state(state)
+        self.assertFalse(hasattr(person, "position"))
+        self.assertEqual(person.serialize(), Person().serialize())
+        person = from_dict(dict(to_dict(Person()), position=[1, 2]))
+        self.assertEqual(person.serialize(), Person().serialize())
+
+    def test_subclass(self):
+        class Extended(Url):
+            pass
+
+        url = Extended()
+        url.set_path("https://gramps-project.org")
+        url.extra = 1
+        state = url.get_object_state()
+        self.assertEqual(state["path"], "https://gramps-project.org")
+        self.assertEqual(state["extra"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,5 +100,32 @@ class Test2(unittest.TestCase):
         self.assertEqual(g, e)
 
 
+# test the instances of the standard types shared by the loaded objects
+class Test3(unittest.TestCase):
+    def test_shared(self):
+        self.gt = GT0.get_shared(2)
+        self.assertIs(GT0.get_shared(2, "ignored"), self.gt)
+        self.assertEqual(self.gt.serialize(), (2, ""))
+        self.assertIsNot(GT2.get_shared(2), self.gt)
+        self.assertRaises(TypeError, self.gt.set, 0)
+        self.assertRaises(TypeError, self.gt.set_from_xml_str, "zz")
+        self.assertRaises(TypeError, self.gt.unserialize, (0, ""))
+        with self.assertRaises(TypeError):
+            self.gt.value = 0
+        self.assertEqual(self.gt.value, 2)
+
+        # a copy can be modified
+        self.ub = GT0(self.gt)
+        self.ub.set(0)
+        self.assertEqual(self.ub.value, 0)
+
+    def test_custom(self):
+        self.gt = GT0.get_shared(3, "custom")
+        self.assertEqual(self.gt.serialize(), (3, "custom"))
+        self.assertIsNot(GT0.get_shared(3, "custom"), self.gt)
+        self.gt.set("other")
+        self.assertEqual(self.gt.string, "other")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -75,6 +75,48 @@ from ..tagbase import TagBase
 from ..urlbase import UrlBase
 
 
+# The mixins declare empty slots, so the tests that use them on their own need
+# subclasses that can hold the attributes.
+class _AddressBase(AddressBase):
+    __slots__ = ("address_list",)
+
+
+class _AttributeBase(AttributeBase):
+    __slots__ = ("attribute_list",)
+
+
+class _CitationBase(CitationBase):
+    __slots__ = ("citation_list",)
+
+
+class _LdsOrdBase(LdsOrdBase):
+    __slots__ = ("lds_ord_list",)
+
+
+class _MediaBase(MediaBase):
+    __slots__ = ("media_list",)
+
+
+class _NoteBase(NoteBase):
+    __slots__ = ("note_list",)
+
+
+class _PrivacyBase(PrivacyBase):
+    __slots__ = ("private",)
+
+
+class _SurnameBase(SurnameBase):
+    __slots__ = ("surname_list",)
+
+
+class _TagBase(TagBase):
+    __slots__ = ("tag_list",)
+
+
+class _UrlBase(UrlBase):
+    __slots__ = ("urls",)
+
+
 class PrivacyBaseTest:
     def test_privacy_merge(self):
         self.assertEqual(self.phoenix.serialize(), self.titanic.serialize())
@@ -146,8 +188,8 @@ class PrivacyCheck(unittest.TestCase):
             (False, True, True),
             (True, True, True),
         )
-        phoenix = PrivacyBase()
-        titanic = PrivacyBase()
+        phoenix = _PrivacyBase()
+        titanic = _PrivacyBase()
         for value1, value2, value_merge in known_values:
             phoenix.set_privacy(value1)
             titanic.set_privacy(value2)
@@ -189,14 +231,14 @@ class UrlCheck(unittest.TestCase, PrivacyBaseTest):
 
 class UrlBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = UrlBase()
-        self.titanic = UrlBase()
+        self.phoenix = _UrlBase()
+        self.titanic = _UrlBase()
         url = Url()
         url.set_path("example.com")
         self.phoenix.add_url(url)
 
     def test_identical(self):
-        ref_url_list = UrlBase(self.phoenix)
+        ref_url_list = _UrlBase(self.phoenix)
         url = Url()
         url.set_path("example.com")
         self.titanic.add_url(url)
@@ -204,7 +246,7 @@ class UrlBaseCheck(unittest.TestCase):
         self.assertEqual(self.phoenix.serialize(), ref_url_list.serialize())
 
     def test_equal(self):
-        ref_url_list = UrlBase(self.phoenix)
+        ref_url_list = _UrlBase(self.phoenix)
         ref_url = ref_url_list.get_url_list()[0]
         ref_url.set_privacy(True)
         url = Url()
@@ -215,7 +257,7 @@ class UrlBaseCheck(unittest.TestCase):
         self.assertEqual(self.phoenix.serialize(), ref_url_list.serialize())
 
     def test_different(self):
-        ref_url_list = UrlBase(self.phoenix)
+        ref_url_list = _UrlBase(self.phoenix)
         url = Url()
         url.set_path("other.com")
         ref_url_list.add_url(url)
@@ -254,9 +296,9 @@ class AddressCheck(unittest.TestCase, PrivacyBaseTest, NoteBaseTest, CitationBas
 
 class AddressBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = AddressBase()
-        self.titanic = AddressBase()
-        self.ref_list = AddressBase()
+        self.phoenix = _AddressBase()
+        self.titanic = _AddressBase()
+        self.ref_list = _AddressBase()
         address = Address()
         address.set_city("Amsterdam")
         self.phoenix.add_address(address)
@@ -283,7 +325,7 @@ class AddressBaseCheck(unittest.TestCase):
         address = Address()
         address.set_country("Netherlands")
         self.titanic.add_address(address)
-        self.ref_list = AddressBase(self.phoenix)
+        self.ref_list = _AddressBase(self.phoenix)
         self.ref_list.add_address(address)
         self.phoenix._merge_address_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -320,9 +362,9 @@ class AttributeCheck(
 
 class AttributeBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = AttributeBase()
-        self.titanic = AttributeBase()
-        self.ref_list = AttributeBase()
+        self.phoenix = _AttributeBase()
+        self.titanic = _AttributeBase()
+        self.ref_list = _AttributeBase()
         attr = Attribute()
         attr.set_type(AttributeType.AGE)
         attr.set_value(10)
@@ -353,7 +395,7 @@ class AttributeBaseCheck(unittest.TestCase):
         attr.set_type(AttributeType.AGE)
         attr.set_value(12)
         self.titanic.add_attribute(attr)
-        self.ref_list = AttributeBase(self.phoenix)
+        self.ref_list = _AttributeBase(self.phoenix)
         self.ref_list.add_attribute(attr)
         self.phoenix._merge_attribute_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -798,9 +840,9 @@ class LdsordCheck(unittest.TestCase, PrivacyBaseTest, NoteBaseTest, CitationBase
 
 class LdsordBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = LdsOrdBase()
-        self.titanic = LdsOrdBase()
-        self.ref_list = LdsOrdBase()
+        self.phoenix = _LdsOrdBase()
+        self.titanic = _LdsOrdBase()
+        self.ref_list = _LdsOrdBase()
         ldsord = LdsOrd()
         ldsord.set_temple("London, England")
         self.phoenix.add_lds_ord(ldsord)
@@ -826,7 +868,7 @@ class LdsordBaseCheck(unittest.TestCase):
         ldsord = LdsOrd()
         ldsord.set_temple("Baton Rouge, Louisiana")
         self.titanic.add_lds_ord(ldsord)
-        self.ref_list = LdsOrdBase(self.phoenix)
+        self.ref_list = _LdsOrdBase(self.phoenix)
         self.ref_list.add_lds_ord(ldsord)
         self.phoenix._merge_lds_ord_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -834,9 +876,9 @@ class LdsordBaseCheck(unittest.TestCase):
 
 class MediaBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = MediaBase()
-        self.titanic = MediaBase()
-        self.ref_list = MediaBase()
+        self.phoenix = _MediaBase()
+        self.titanic = _MediaBase()
+        self.ref_list = _MediaBase()
         mediaref = MediaRef()
         mediaref.set_reference_handle("123456")
         mediaref.set_rectangle("10 10 90 90")
@@ -1103,20 +1145,20 @@ class NoteCheck(unittest.TestCase, PrivacyBaseTest):
 
 class NoteBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = NoteBase()
-        self.titanic = NoteBase()
+        self.phoenix = _NoteBase()
+        self.titanic = _NoteBase()
         note = Note("hello world")
         note.set_handle("123456")
         self.phoenix.add_note(note.get_handle())
 
     def test_identical(self):
-        ref_note_list = NoteBase(self.phoenix)
+        ref_note_list = _NoteBase(self.phoenix)
         self.titanic.add_note(self.phoenix.get_note_list()[0])
         self.phoenix._merge_note_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), ref_note_list.serialize())
 
     def test_different(self):
-        ref_note_list = NoteBase(self.phoenix)
+        ref_note_list = _NoteBase(self.phoenix)
         note = Note("note other")
         note.set_handle("654321")
         self.titanic.add_note(note.get_handle())
@@ -1127,7 +1169,7 @@ class NoteBaseCheck(unittest.TestCase):
     def test_replace_nonew(self):
         note = Note("note other")
         note.set_handle("654321")
-        ref_note_list = NoteBase()
+        ref_note_list = _NoteBase()
         ref_note_list.add_note(note.get_handle())
         self.phoenix.replace_note_references("123456", "654321")
         self.assertEqual(self.phoenix.serialize(), ref_note_list.serialize())
@@ -1139,14 +1181,14 @@ class NoteBaseCheck(unittest.TestCase):
         note2.set_handle("234567")
         self.phoenix.add_note(note2.get_handle())
         self.phoenix.add_note(note.get_handle())
-        ref_note_list = NoteBase()
+        ref_note_list = _NoteBase()
         ref_note_list.add_note(note2.get_handle())
         ref_note_list.add_note(note.get_handle())
         self.phoenix.replace_note_references("123456", "654321")
         self.assertEqual(self.phoenix.serialize(), ref_note_list.serialize())
 
     def test_replace_child(self):
-        ref_note_list = NoteBase()
+        ref_note_list = _NoteBase()
         note = Note("")
         note.set_handle("123456")
         ref_note_list.add_note(note.get_handle())
@@ -1158,7 +1200,7 @@ class NoteBaseCheck(unittest.TestCase):
         note.set_handle("654321")
         self.phoenix.add_note(note.get_handle())
         self.phoenix.remove_note_references(["123456", "654321"])
-        ref_note_list = NoteBase()
+        ref_note_list = _NoteBase()
         self.assertEqual(self.phoenix.serialize(), ref_note_list.serialize())
 
 
@@ -1871,12 +1913,12 @@ class SourceCheck(unittest.TestCase, PrivacyBaseTest, NoteBaseTest, MediaBaseTes
 
 class CitationBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = CitationBase()
+        self.phoenix = _CitationBase()
         citation = Citation()
         citation.set_reference_handle("123456")
         self.phoenix.add_citation(citation.handle)
-        self.titanic = CitationBase()
-        self.obj_list = CitationBase()
+        self.titanic = _CitationBase()
+        self.obj_list = _CitationBase()
 
     def test_replace_nonew(self):
         citation = Citation()
@@ -2010,12 +2052,12 @@ class SurnameCheck(unittest.TestCase):
 
 class SurnameBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = SurnameBase()
+        self.phoenix = _SurnameBase()
         surname = Surname()
         surname.set_surname("Oranje")
         self.phoenix.add_surname(surname)
-        self.titanic = SurnameBase()
-        self.ref_list = SurnameBase()
+        self.titanic = _SurnameBase()
+        self.ref_list = _SurnameBase()
 
     def test_identical(self):
         surname = Surname()
@@ -2029,7 +2071,7 @@ class SurnameBaseCheck(unittest.TestCase):
         surname = Surname()
         surname.set_surname("Biesterfelt")
         self.titanic.add_surname(surname)
-        self.ref_list = SurnameBase(self.phoenix)
+        self.ref_list = _SurnameBase(self.phoenix)
         self.ref_list.add_surname(surname)
         self.phoenix._merge_surname_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -2037,13 +2079,13 @@ class SurnameBaseCheck(unittest.TestCase):
 
 class TagBaseCheck(unittest.TestCase):
     def setUp(self):
-        self.phoenix = TagBase()
+        self.phoenix = _TagBase()
         tag_handle = "123456"
         self.phoenix.add_tag(tag_handle)
-        self.titanic = TagBase()
+        self.titanic = _TagBase()
 
     def test_identical(self):
-        self.ref_list = TagBase(self.phoenix)
+        self.ref_list = _TagBase(self.phoenix)
         self.titanic.add_tag(self.phoenix.get_tag_list()[0])
         self.phoenix._merge_tag_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -2052,7 +2094,7 @@ class TagBaseCheck(unittest.TestCase):
         self.titanic.set_tag_list([])
         tag_handle = "654321"
         self.titanic.add_tag(tag_handle)
-        self.ref_list = TagBase(self.phoenix)
+        self.ref_list = _TagBase(self.phoenix)
         self.ref_list.add_tag(tag_handle)
         self.phoenix._merge_tag_list(self.titanic)
         self.assertEqual(self.phoenix.serialize(), self.ref_list.serialize())
@@ -29,6 +29,7 @@ from ...user import User
 from .. import (
     Citation,
     Event,
+    EventType,
     Family,
     Media,
     Note,
@@ -38,7 +39,7 @@ from .. import (
     Source,
     Tag,
 )
-from ..serialize import from_json, to_json
+from ..serialize import from_dict, from_json, to_dict, to_json
 
 TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
 EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
@@ -50,6 +51,13 @@ class BaseCheck:
         obj = from_json(data)
         self.assertEqual(self.object.serialize(), obj.serialize())
 
+    def test_from_dict(self):
+        data = to_dict(self.object)
+        obj = from_dict(data)
+        self.assertEqual(self.object.serialize(), obj.serialize())
+        # The dict must not be consumed by the conversion:
+        self.assertEqual(data, to_dict(self.object))
+
 
 class PersonCheck(unittest.TestCase, BaseCheck):
     def setUp(self):
@@ -111,6 +119,21 @@ class TagCheck(unittest.TestCase, BaseCheck):
         self.object = self.cls()
 
 
+class SharedTypeCheck(unittest.TestCase):
+    def test_shared_type(self):
+        event = Event()
+        event.set_type(EventType.BIRTH)
+        data = to_json(event)
+        event1 = from_json(data)
+        event2 = from_dict(to_dict(event))
+        self.assertIs(event1.get_type(), event2.get_type())
+        # Setting a type does not change the other events:
+        event1.set_type(EventType.DEATH)
+        self.assertEqual(event1.get_type(), EventType.DEATH)
+        self.assertEqual(event2.get_type(), EventType.BIRTH)
+        self.assertEqual(from_json(data).get_type(), EventType.BIRTH)
+
+
 class DatabaseCheck(unittest.TestCase):
     maxDiff = None
 
@@ -128,6 +151,13 @@ def generate_cases(obj, data):
     name = "test_serialize_%s_%s" % (obj.__class__.__name__, obj.handle)
     setattr(DatabaseCheck, name, test)
 
+    def test_from_dict(self):
+        obj3 = from_dict(dict(data))
+        self.assertEqual(obj.serialize(), obj3.serialize())
+
+    name = "test_from_dict_%s_%s" % (obj.__class__.__name__, obj.handle)
+    setattr(DatabaseCheck, name, test_from_dict)
+
     def test_data(self):
         class_name = obj.__class__.__name__
         assert isinstance(data, dict), "Ensure that the data is a dict"
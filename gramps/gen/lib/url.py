@@ -57,6 +57,8 @@ class Url(SecondaryObject, PrivacyBase):
     allowing gramps to store information about internet resources.
     """
 
+    __slots__ = ("private", "path", "desc", "type")
+
     def __init__(self, source=None):
         """Create a new URL instance, copying from the source if present."""
         PrivacyBase.__init__(self, source)
@@ -74,7 +76,7 @@ class Url(SecondaryObject, PrivacyBase):
 
     def unserialize(self, data):
         (self.private, self.path, self.desc, type_value) = data
-        self.type.unserialize(type_value)
+        self.type = UrlType.get_shared(*type_value)
         return self
 
     @classmethod
@@ -156,7 +158,7 @@ class Url(SecondaryObject, PrivacyBase):
         :param the_type: descriptive type of the Url
         :type the_type: str
         """
-        self.type.set(the_type)
+        self.type = UrlType(the_type)
 
     def get_type(self):
         """
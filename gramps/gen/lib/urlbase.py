@@ -41,6 +41,8 @@ class UrlBase:
     Base class for url-aware objects.
     """
 
+    __slots__ = ()
+
     def __init__(self, source=None):
         """
         Initialize an UrlBase.
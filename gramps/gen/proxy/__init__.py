@@ -20,10 +20,18 @@
 #
 # gen/proxy/__init__.py
 
-__all__ = ["filter", "living", "private", "proxybase", "referencedbyselection"]
+__all__ = [
+    "filter",
+    "living",
+    "materialized",
+    "private",
+    "proxybase",
+    "referencedbyselection",
+]
 
 from .filter import FilterProxyDb
 from .living import LivingProxyDb
 from .private import PrivateProxyDb
 from .referencedbyselection import ReferencedBySelectionProxyDb
 from .cache import CacheProxyDb
+from .materialized import MaterializedProxyDb
@@ -22,7 +22,10 @@
 Proxy class for the Gramps databases. Caches lookups from handles.
 """
 
-from ..utils.lru import LRU
+from ..config import config
+from ..utils.lru import LRUCache
+
+_MISSING = object()
 
 
 class CacheProxyDb:
@@ -33,19 +36,28 @@ class CacheProxyDb:
     places, and not where caches are altered.
     """
 
-    def __init__(self, database):
+    def __init__(self, database, count=None, size=None, budgets=None):
         """
         CacheProxy will cache items based on their handle.
 
         Assumes all handles (regardless of type) are unique.
         Database is called self.db for consistency with other
         proxies.
+
+        The cache holds at most count objects.  If size is given, the
+        estimated memory of the objects is also bounded to size bytes, and
+        budgets can bound the memory of each object type, e.g.
+        {"Person": 2**26}.  The limits that are not given are taken from
+        the database.proxy-cache-* preferences.
         """
+        if count is None:
+            count = config.get("database.proxy-cache-size")
+        if size is None:
+            size = config.get("database.proxy-cache-memory")
+        if budgets is None:
+            budgets = config.get("database.proxy-cache-budgets")
         self.db = database
-        # Memory allocation is power of 2 where slots has to fit.
-        # LRU uses one extra slot in its work, so set max to 2^17-1
-        # otherwise we are just wasting memory
-        self.cache_handle = LRU(131071)
+        self.cache_handle = LRUCache(count, size, budgets)
 
     def __del__(self):
         self.cache_handle.clear()
@@ -67,92 +79,180 @@ class CacheProxyDb:
         else:
             self.cache_handle.clear()
 
+    def get_cache_statistics(self):
+        """
+        Return a dictionary with the number of cached objects, their
+        estimated memory, and the number of hits, misses and evictions.
+        """
+        return self.cache_handle.get_statistics()
+
+    def _get_from_handle(self, get_func, handle):
+        """
+        Gets an item from cache if it exists, otherwise fetches it
+        from the database and caches it.
+        """
+        obj = self.cache_handle.get(handle, _MISSING)
+        if obj is _MISSING:
+            obj = self.cache_handle[handle] = get_func(handle)
+        return obj
+
     def get_person_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_person_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_person_from_handle, handle)
 
     def get_event_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_event_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_event_from_handle, handle)
 
     def get_family_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_family_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_family_from_handle, handle)
 
     def get_repository_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_repository_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_repository_from_handle, handle)
 
     def get_place_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_place_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_place_from_handle, handle)
 
     def get_citation_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_citation_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_citation_from_handle, handle)
 
     def get_source_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_source_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_source_from_handle, handle)
 
     def get_note_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_note_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_note_from_handle, handle)
 
     def get_media_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_media_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_media_from_handle, handle)
 
     def get_tag_from_handle(self, handle):
         """
         Gets item from cache if it exists. Converts
         handles to string, for uniformity.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_tag_from_handle(handle)
-        return self.cache_handle[handle]
+        return self._get_from_handle(self.db.get_tag_from_handle, handle)
+
+    def _get_from_handles(self, get_func, handles):
+        """
+        Gets items from cache where they exist, and fetches the
+        remaining ones from the database in a single call.
+        """
+        handles = [handle for handle in dict.fromkeys(handles) if handle]
+        objects = {}
+        missing = []
+        for handle in handles:
+            obj = self.cache_handle.get(handle, _MISSING)
+            if obj is _MISSING:
+                missing.append(handle)
+            else:
+                objects[handle] = obj
+        if missing:
+            for obj in get_func(missing):
+                self.cache_handle[obj.handle] = objects[obj.handle] = obj
+        return [
+            objects[handle] for handle in handles if objects.get(handle) is not None
+        ]
+
+    def get_citations_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_citations_from_handles, handles)
+
+    def get_events_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_events_from_handles, handles)
+
+    def get_families_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_families_from_handles, handles)
+
+    def get_media_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_media_from_handles, handles)
+
+    def get_notes_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_notes_from_handles, handles)
+
+    def get_people_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_people_from_handles, handles)
+
+    def get_places_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_places_from_handles, handles)
+
+    def get_repositories_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_repositories_from_handles, handles)
+
+    def get_sources_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_sources_from_handles, handles)
+
+    def get_tags_from_handles(self, handles):
+        """
+        Gets items from cache if they exist, fetching the
+        others in bulk.
+        """
+        return self._get_from_handles(self.db.get_tags_from_handles, handles)
@@ -258,8 +258,9 @@ class LivingProxyDb(ProxyDbBase):
         """
         person_handle = person.get_handle()
         unfil_person = self.get_unfiltered_person(person_handle)
+        # The estimates of the unfiltered people are kept for the database
         return probably_alive(
-            unfil_person, self.db, self.current_date, self.years_after_death
+            unfil_person, self.basedb, self.current_date, self.years_after_death
         )
 
     def __remove_living_from_family(self, family):
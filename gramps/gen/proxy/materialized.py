@@ -0,0 +1,473 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Proxy class for the Gramps databases. Evaluates a stack of proxies once.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Gramps libraries
+#
+# -------------------------------------------------------------------------
+from .proxybase import ProxyDbBase
+
+
+# -------------------------------------------------------------------------
+#
+# MaterializedProxyDb
+#
+# -------------------------------------------------------------------------
+class MaterializedProxyDb(ProxyDbBase):
+    """
+    A proxy to a stack of proxies, which evaluates them once.
+
+    The handles that the proxies include are collected the first time an
+    object type is used, and each object is taken from the proxies at most
+    once, so that the include checks and the cleanup of the objects that
+    the proxies do are not repeated on every access.
+
+    The objects are shared between callers, and the database must not
+    change while the proxy is in use.
+    """
+
+    def __init__(self, dbase):
+        """
+        Create a new MaterializedProxyDb instance.
+
+        :param dbase: The database or proxy to be evaluated
+        :type dbase: DbBase
+        """
+        ProxyDbBase.__init__(self, dbase)
+        self.__objects = {}
+
+    def __get_objects(self, name):
+        """
+        Return a dictionary of the included handles of an object type, in
+        the order of the proxied database, mapped to their object or to None
+        if the object hasn't been fetched yet.
+        """
+        objects = self.__objects.get(name)
+        if objects is None:
+            handles = getattr(self.db, "iter_%s_handles" % name)()
+            objects = self.__objects[name] = dict.fromkeys(handles)
+        return objects
+
+    def __get_object(self, name, handle):
+        """
+        Return the object of an included handle, or None.
+        """
+        objects = self.__get_objects(name)
+        obj = objects.get(handle)
+        if obj is None and handle in objects:
+            obj = getattr(self.db, "get_%s_from_handle" % name)(handle)
+            objects[handle] = obj
+        return obj
+
+    def __iter_objects(self, name, method):
+        """
+        Return an iterator over the included objects of an object type.
+
+        If the type hasn't been used yet, all objects are taken from the
+        proxied database in a single pass.
+        """
+        if name not in self.__objects:
+            self.__objects[name] = {obj.handle: obj for obj in method()}
+        return (self.__get_object(name, handle) for handle in self.__objects[name])
+
+    def include_person(self, handle):
+        """
+        Return True if the Person is included by the proxied database.
+        """
+        return handle in self.__get_objects("person")
+
+    def include_family(self, handle):
+        """
+        Return True if the Family is included by the proxied database.
+        """
+        return handle in self.__get_objects("family")
+
+    def include_event(self, handle):
+        """
+        Return True if the Event is included by the proxied database.
+        """
+        return handle in self.__get_objects("event")
+
+    def include_source(self, handle):
+        """
+        Return True if the Source is included by the proxied database.
+        """
+        return handle in self.__get_objects("source")
+
+    def include_citation(self, handle):
+        """
+        Return True if the Citation is included by the proxied database.
+        """
+        return handle in self.__get_objects("citation")
+
+    def include_place(self, handle):
+        """
+        Return True if the Place is included by the proxied database.
+        """
+        return handle in self.__get_objects("place")
+
+    def include_media(self, handle):
+        """
+        Return True if the Media is included by the proxied database.
+        """
+        return handle in self.__get_objects("media")
+
+    def include_repository(self, handle):
+        """
+        Return True if the Repository is included by the proxied database.
+        """
+        return handle in self.__get_objects("repository")
+
+    def include_note(self, handle):
+        """
+        Return True if the Note is included by the proxied database.
+        """
+        return handle in self.__get_objects("note")
+
+    def include_tag(self, handle):
+        """
+        Return True if the Tag is included by the proxied database.
+        """
+        return handle in self.__get_objects("tag")
+
+    def get_person_from_handle(self, handle):
+        """
+        Finds a Person in the database from the passed handle.
+        If no such Person exists, None is returned.
+        """
+        return self.__get_object("person", handle)
+
+    def get_family_from_handle(self, handle):
+        """
+        Finds a Family in the database from the passed handle.
+        If no such Family exists, None is returned.
+        """
+        return self.__get_object("family", handle)
+
+    def get_event_from_handle(self, handle):
+        """
+        Finds a Event in the database from the passed handle.
+        If no such Event exists, None is returned.
+        """
+        return self.__get_object("event", handle)
+
+    def get_source_from_handle(self, handle):
+        """
+        Finds a Source in the database from the passed handle.
+        If no such Source exists, None is returned.
+        """
+        return self.__get_object("source", handle)
+
+    def get_citation_from_handle(self, handle):
+        """
+        Finds a Citation in the database from the passed handle.
+        If no such Citation exists, None is returned.
+        """
+        return self.__get_object("citation", handle)
+
+    def get_place_from_handle(self, handle):
+        """
+        Finds a Place in the database from the passed handle.
+        If no such Place exists, None is returned.
+        """
+        return self.__get_object("place", handle)
+
+    def get_media_from_handle(self, handle):
+        """
+        Finds a Media in the database from the passed handle.
+        If no such Media exists, None is returned.
+        """
+        return self.__get_object("media", handle)
+
+    def get_repository_from_handle(self, handle):
+        """
+        Finds a Repository in the database from the passed handle.
+        If no such Repository exists, None is returned.
+        """
+        return self.__get_object("repository", handle)
+
+    def get_note_from_handle(self, handle):
+        """
+        Finds a Note in the database from the passed handle.
+        If no such Note exists, None is returned.
+        """
+        return self.__get_object("note", handle)
+
+    def get_tag_from_handle(self, handle):
+        """
+        Finds a Tag in the database from the passed handle.
+        If no such Tag exists, None is returned.
+        """
+        return self.__get_object("tag", handle)
+
+    def has_person_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Person database.
+        """
+        return handle in self.__get_objects("person")
+
+    def has_family_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Family database.
+        """
+        return handle in self.__get_objects("family")
+
+    def has_event_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Event database.
+        """
+        return handle in self.__get_objects("event")
+
+    def has_source_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Source database.
+        """
+        return handle in self.__get_objects("source")
+
+    def has_citation_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Citation database.
+        """
+        return handle in self.__get_objects("citation")
+
+    def has_place_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Place database.
+        """
+        return handle in self.__get_objects("place")
+
+    def has_media_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Media database.
+        """
+        return handle in self.__get_objects("media")
+
+    def has_repository_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Repository database.
+        """
+        return handle in self.__get_objects("repository")
+
+    def has_note_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Note database.
+        """
+        return handle in self.__get_objects("note")
+
+    def has_tag_handle(self, handle):
+        """
+        Returns True if the handle exists in the current Tag database.
+        """
+        return handle in self.__get_objects("tag")
+
+    def iter_person_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Person in
+        the database.
+        """
+        return iter(self.__get_objects("person"))
+
+    def iter_family_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Family in
+        the database.
+        """
+        return iter(self.__get_objects("family"))
+
+    def iter_event_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Event in
+        the database.
+        """
+        return iter(self.__get_objects("event"))
+
+    def iter_source_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Source in
+        the database.
+        """
+        return iter(self.__get_objects("source"))
+
+    def iter_citation_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Citation in
+        the database.
+        """
+        return iter(self.__get_objects("citation"))
+
+    def iter_place_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Place in
+        the database.
+        """
+        return iter(self.__get_objects("place"))
+
+    def iter_media_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Media in
+        the database.
+        """
+        return iter(self.__get_objects("media"))
+
+    def iter_repository_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Repository in
+        the database.
+        """
+        return iter(self.__get_objects("repository"))
+
+    def iter_note_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Note in
+        the database.
+        """
+        return iter(self.__get_objects("note"))
+
+    def iter_tag_handles(self):
+        """
+        Return an iterator over database handles, one handle for each Tag in
+        the database.
+        """
+        return iter(self.__get_objects("tag"))
+
+    def iter_people(self):
+        """
+        Return an iterator over Person objects in the database
+        """
+        return self.__iter_objects("person", self.db.iter_people)
+
+    def iter_families(self):
+        """
+        Return an iterator over Family objects in the database
+        """
+        return self.__iter_objects("family", self.db.iter_families)
+
+    def iter_events(self):
+        """
+        Return an iterator over Event objects in the database
+        """
+        return self.__iter_objects("event", self.db.iter_events)
+
+    def iter_sources(self):
+        """
+        Return an iterator over Source objects in the database
+        """
+        return self.__iter_objects("source", self.db.iter_sources)
+
+    def iter_citations(self):
+        """
+        Return an iterator over Citation objects in the database
+        """
+        return self.__iter_objects("citation", self.db.iter_citations)
+
+    def iter_places(self):
+        """
+        Return an iterator over Place objects in the database
+        """
+        return self.__iter_objects("place", self.db.iter_places)
+
+    def iter_media(self):
+        """
+        Return an iterator over Media objects in the database
+        """
+        return self.__iter_objects("media", self.db.iter_media)
+
+    def iter_repositories(self):
+        """
+        Return an iterator over Repository objects in the database
+        """
+        return self.__iter_objects("repository", self.db.iter_repositories)
+
+    def iter_notes(self):
+        """
+        Return an iterator over Note objects in the database
+        """
+        return self.__iter_objects("note", self.db.iter_notes)
+
+    def iter_tags(self):
+        """
+        Return an iterator over Tag objects in the database
+        """
+        return self.__iter_objects("tag", self.db.iter_tags)
+
+    def get_number_of_people(self):
+        """
+        Return the number of people currently in the database.
+        """
+        return len(self.__get_objects("person"))
+
+    def get_number_of_families(self):
+        """
+        Return the number of families currently in the database.
+        """
+        return len(self.__get_objects("family"))
+
+    def get_number_of_events(self):
+        """
+        Return the number of events currently in the database.
+        """
+        return len(self.__get_objects("event"))
+
+    def get_number_of_sources(self):
+        """
+        Return the number of sources currently in the database.
+        """
+        return len(self.__get_objects("source"))
+
+    def get_number_of_citations(self):
+        """
+        Return the number of citations currently in the database.
+        """
+        return len(self.__get_objects("citation"))
+
+    def get_number_of_places(self):
+        """
+        Return the number of places currently in the database.
+        """
+        return len(self.__get_objects("place"))
+
+    def get_number_of_media(self):
+        """
+        Return the number of media currently in the database.
+        """
+        return len(self.__get_objects("media"))
+
+    def get_number_of_repositories(self):
+        """
+        Return the number of repositories currently in the database.
+        """
+        return len(self.__get_objects("repository"))
+
+    def get_number_of_notes(self):
+        """
+        Return the number of notes currently in the database.
+        """
+        return len(self.__get_objects("note"))
+
+    def get_number_of_tags(self):
+        """
+        Return the number of tags currently in the database.
+        """
+        return len(self.__get_objects("tag"))
@@ -561,6 +561,91 @@ class ProxyDbBase(DbReadBase):
         """
         return self.gfilter(self.include_tag, self.db.get_tag_from_handle(handle))
 
+    def __get_from_handles(self, name, plural, predicate, handles):
+        """
+        Return the objects for the given handles, in handle order.
+
+        If the proxy does not change how single objects are fetched, the
+        objects are fetched in bulk from the underlying database and
+        filtered with the predicate. Otherwise each object is fetched
+        through the proxy's own get_*_from_handle method.
+        """
+        single = "get_%s_from_handle" % name
+        if getattr(type(self), single) is not getattr(ProxyDbBase, single):
+            return DbReadBase._get_from_handles_singly(
+                self, getattr(self, single), handles
+            )
+        bulk = getattr(self.db, "get_%s_from_handles" % plural)
+        return [obj for obj in bulk(handles) if self.gfilter(predicate, obj)]
+
+    def get_citations_from_handles(self, handles):
+        """
+        Return a list of Citation objects for the given handles.
+        """
+        return self.__get_from_handles(
+            "citation", "citations", self.include_citation, handles
+        )
+
+    def get_events_from_handles(self, handles):
+        """
+        Return a list of Event objects for the given handles.
+        """
+        return self.__get_from_handles("event", "events", self.include_event, handles)
+
+    def get_families_from_handles(self, handles):
+        """
+        Return a list of Family objects for the given handles.
+        """
+        return self.__get_from_handles(
+            "family", "families", self.include_family, handles
+        )
+
+    def get_media_from_handles(self, handles):
+        """
+        Return a list of Media objects for the given handles.
+        """
+        return self.__get_from_handles("media", "media", self.include_media, handles)
+
+    def get_notes_from_handles(self, handles):
+        """
+        Return a list of Note objects for the given handles.
+        """
+        return self.__get_from_handles("note", "notes", self.include_note, handles)
+
+    def get_people_from_handles(self, handles):
+        """
+        Return a list of Person objects for the given handles.
+        """
+        return self.__get_from_handles("person", "people", self.include_person, handles)
+
+    def get_places_from_handles(self, handles):
+        """
+        Return a list of Place objects for the given handles.
+        """
+        return self.__get_from_handles("place", "places", self.include_place, handles)
+
+    def get_repositories_from_handles(self, handles):
+        """
+        Return a list of Repository objects for the given handles.
+        """
+        return self.__get_from_handles(
+            "repository", "repositories", self.include_repository, handles
+        )
+
+    def get_sources_from_handles(self, handles):
+        """
+        Return a list of Source objects for the given handles.
+        """
+        return self.__get_from_handles(
+            "source", "sources", self.include_source, handles
+        )
+
+    def get_tags_from_handles(self, handles):
+        """
+        Return a list of Tag objects for the given handles.
+        """
+        return self.__get_from_handles("tag", "tags", self.include_tag, handles)
+
     def get_person_from_gramps_id(self, val):
         """
         Finds a Person in the database from the passed Gramps ID.
@@ -0,0 +1,94 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+
+"""
+Unittest for the cache proxy.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Standard python modules
+#
+# -------------------------------------------------------------------------
+import unittest
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ...config import config
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import Person
+from .. import CacheProxyDb
+
+
+class CacheProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.handles = []
+        with DbTxn("Add people", self.db) as trans:
+            for dummy in range(3):
+                person = Person()
+                self.db.add_person(person, trans)
+                self.handles.append(person.handle)
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_lookups(self):
+        proxy = CacheProxyDb(self.db, count=2)
+        first = proxy.get_person_from_handle(self.handles[0])
+        self.assertIs(proxy.get_person_from_handle(self.handles[0]), first)
+        people = proxy.get_people_from_handles(self.handles)
+        self.assertEqual([person.handle for person in people], self.handles)
+        stats = proxy.get_cache_statistics()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_budgets(self):
+        proxy = CacheProxyDb(self.db, budgets={"Person": 1})
+        for handle in self.handles:
+            proxy.get_person_from_handle(handle)
+        stats = proxy.get_cache_statistics()
+        self.assertEqual(stats["entries"], 1)
+        self.assertGreater(stats["memory"], 0)
+        proxy.clear_cache()
+        self.assertEqual(proxy.get_cache_statistics()["memory"], 0)
+
+    def test_config(self):
+        count = config.get("database.proxy-cache-size")
+        config.set("database.proxy-cache-size", 1)
+        try:
+            proxy = CacheProxyDb(self.db)
+        finally:
+            config.set("database.proxy-cache-size", count)
+        for handle in self.handles:
+            proxy.get_person_from_handle(handle)
+        self.assertEqual(proxy.get_cache_statistics()["entries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
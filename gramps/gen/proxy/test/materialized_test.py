@@ -0,0 +1,105 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the materialized proxy.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Standard python modules
+#
+# -------------------------------------------------------------------------
+import os
+import unittest
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ...const import DATA_DIR
+from ...db.utils import import_as_dict
+from ...user import User
+from .. import LivingProxyDb, MaterializedProxyDb, PrivateProxyDb
+
+TEST_DIR = os.path.abspath(os.path.join(DATA_DIR, "tests"))
+EXAMPLE = os.path.join(TEST_DIR, "example.gramps")
+
+OBJECT_TYPES = [
+    ("person", "people"),
+    ("family", "families"),
+    ("event", "events"),
+    ("source", "sources"),
+    ("citation", "citations"),
+    ("place", "places"),
+    ("media", "media"),
+    ("repository", "repositories"),
+    ("note", "notes"),
+    ("tag", "tags"),
+]
+
+
+class MaterializedProxyTest(unittest.TestCase):
+    """
+    Compare a materialized stack of proxies with the stack itself.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = import_as_dict(EXAMPLE, User())
+        cls.proxy = LivingProxyDb(
+            PrivateProxyDb(cls.db), LivingProxyDb.MODE_INCLUDE_LAST_NAME_ONLY
+        )
+
+    def test_objects(self):
+        materialized = MaterializedProxyDb(self.proxy)
+        for name, plural in OBJECT_TYPES:
+            handles = list(getattr(self.proxy, "iter_%s_handles" % name)())
+            self.assertEqual(
+                list(getattr(materialized, "iter_%s_handles" % name)()), handles
+            )
+            self.assertEqual(
+                getattr(materialized, "get_number_of_%s" % plural)(), len(handles)
+            )
+            get_object = getattr(self.proxy, "get_%s_from_handle" % name)
+            for obj in getattr(materialized, "iter_%s" % plural)():
+                self.assertEqual(obj.serialize(), get_object(obj.handle).serialize())
+
+    def test_cache(self):
+        materialized = MaterializedProxyDb(self.proxy)
+        handle = next(self.proxy.iter_person_handles())
+        person = materialized.get_person_from_handle(handle)
+        self.assertIs(materialized.get_person_from_handle(handle), person)
+        self.assertIs(next(materialized.iter_people()), person)
+
+    def test_excluded(self):
+        proxy = LivingProxyDb(self.db, LivingProxyDb.MODE_EXCLUDE_ALL)
+        materialized = MaterializedProxyDb(proxy)
+        living = set(self.db.iter_person_handles()) - set(proxy.iter_person_handles())
+        self.assertTrue(living)
+        for handle in living:
+            self.assertFalse(materialized.include_person(handle))
+            self.assertFalse(materialized.has_person_handle(handle))
+            self.assertIsNone(materialized.get_person_from_handle(handle))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,7 +31,10 @@ privacy in reports and exports.
 # Standard python modules
 #
 # -------------------------------------------------------------------------
+from __future__ import annotations
+
 import logging
+import weakref
 
 # -------------------------------------------------------------------------
 #
@@ -44,6 +47,7 @@ from ..lib.person import Person
 from ..errors import DatabaseError
 from ..const import GRAMPS_LOCALE as glocale
 from ..proxy.proxybase import ProxyDbBase
+from .callback import Callback
 
 LOG = logging.getLogger(".gen.utils.alive")
 
@@ -70,6 +74,93 @@ except ImportError:
     _AVG_GENERATION_GAP = 20
     _MIN_GENERATION_YEARS = 13
 
+# The database signals after which the cached life spans must be recomputed
+SIGNALS = [
+    "person-add",
+    "person-update",
+    "person-delete",
+    "person-rebuild",
+    "family-add",
+    "family-update",
+    "family-delete",
+    "family-rebuild",
+    "event-add",
+    "event-update",
+    "event-delete",
+    "event-rebuild",
+]
+
+_CACHES: weakref.WeakKeyDictionary[Callback, LifeSpanCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_life_span_cache(db):
+    """
+    Return the life span cache of a database, or None if the database
+    doesn't emit signals, so that the cache can't be kept up to date.
+    """
+    if not isinstance(db, Callback):
+        return None
+    cache = _CACHES.get(db)
+    if cache is None:
+        cache = LifeSpanCache()
+        cache.connect_db_signals(db)
+        _CACHES[db] = cache
+    return cache
+
+
+# -------------------------------------------------------------------------
+#
+# LifeSpanCache class
+#
+# -------------------------------------------------------------------------
+class LifeSpanCache:
+    """
+    The recorded dates and the estimated life spans of the people of a
+    database.
+
+    The estimates of a person look at the recorded dates of many relatives,
+    and the same people are estimated over and over again by proxies and
+    filters, so both are computed once and kept until the people, families
+    or events of the database change.
+
+    The estimates are kept per database or proxy that the people were taken
+    from, since a proxy can hide some of the events of a person.
+    """
+
+    def __init__(self):
+        self.dates = {}
+        self.ranges = weakref.WeakKeyDictionary()
+
+    def connect_db_signals(self, db):
+        """
+        Clear the cache when the people, families or events of the database
+        change.
+        """
+        for name in SIGNALS:
+            db.connect(name, self._datachange_callback)
+
+    def _datachange_callback(self, handle_list=None):
+        self.clear()
+
+    def clear(self):
+        """
+        Forget all dates and estimates.
+        """
+        self.dates.clear()
+        self.ranges.clear()
+
+    def get_ranges(self, db):
+        """
+        Return the dictionary of the estimates for the people of a database
+        or proxy, keyed by handle and estimation parameters.
+        """
+        ranges = self.ranges.get(db)
+        if ranges is None:
+            ranges = self.ranges[db] = {}
+        return ranges
+
 
 # -------------------------------------------------------------------------
 #
@@ -88,6 +179,7 @@ class ProbablyAlive:
         max_age_prob_alive=None,
         avg_generation_gap=None,
         min_generation_years=None,
+        cache=None,
     ):
         self.db = db
         if max_sib_age_diff is None:
@@ -103,6 +195,8 @@ class ProbablyAlive:
         self.AVG_GENERATION_GAP = avg_generation_gap
         self.MIN_GENERATION_YEARS = min_generation_years
         self.pset = set()
+        # recorded dates of the relatives, keyed by handle
+        self.dates = {} if cache is None else cache.dates
 
     def probably_alive_range(self, person, is_spouse=False, immediate_fam_only=False):
         """
@@ -162,6 +256,8 @@ class ProbablyAlive:
             if isinstance(class_or_handle, Person):
                 thisperson = class_or_handle
             elif isinstance(class_or_handle, str):
+                if class_or_handle in self.dates:
+                    return self.dates[class_or_handle]
                 thisperson = self.db.get_person_from_handle(class_or_handle)
             else:
                 thisperson = None
@@ -237,14 +333,17 @@ class ProbablyAlive:
                             birth_date = birth_date_fb
                             explain_birth = _("date fallback")
                             break
-            if DEBUGLEVEL > 3:
+            if DEBUGLEVEL > 3 and LOG.isEnabledFor(logging.DEBUG):
                 LOG.debug(
                     "           << get_person_bd for [%s], birth %s, death %s",
                     thisperson.get_gramps_id(),
                     birth_date,
                     death_date,
                 )
-            return (birth_date, death_date, death_found, explain_birth, explain_death)
+            result = (birth_date, death_date, death_found, explain_birth, explain_death)
+            if isinstance(class_or_handle, str):
+                self.dates[class_or_handle] = result
+            return result
 
         birth_date, death_date, known_to_be_dead, explain_birth_min, explain_death = (
             get_person_bd(person)
@@ -290,11 +389,12 @@ class ProbablyAlive:
                 if family is None:
                     continue
                 if parents is not None and family_handle != parenth_p1:
-                    LOG.debug(
-                        "      skipping family %s but parents is %s.",
-                        family.get_gramps_id(),
-                        parents.get_gramps_id(),
-                    )
+                    if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+                        LOG.debug(
+                            "      skipping family %s but parents is %s.",
+                            family.get_gramps_id(),
+                            parents.get_gramps_id(),
+                        )
                     continue
                 for child_ref in family.get_child_ref_list():
                     child_handle = child_ref.ref
@@ -453,7 +553,7 @@ class ProbablyAlive:
                     mother_handle = family.get_mother_handle()
                     father_handle = family.get_father_handle()
                     if mother_handle is None or father_handle is None:
-                        if DEBUGLEVEL > 1:
+                        if DEBUGLEVEL > 1 and LOG.isEnabledFor(logging.DEBUG):
                             LOG.debug(
                                 "         single parent family: [%s]",
                                 family.get_gramps_id(),
@@ -471,7 +571,7 @@ class ProbablyAlive:
                             is_spouse=True,
                             immediate_fam_only=True if passnum == 1 else False,
                         )
-                        if DEBUGLEVEL > 2:
+                        if DEBUGLEVEL > 2 and LOG.isEnabledFor(logging.DEBUG):
                             LOG.debug(
                                 "            found spouse [%s], returned b:%s, d:%s, because:%s",
                                 spouse.get_gramps_id(),
@@ -581,12 +681,13 @@ class ProbablyAlive:
 
             no_valid_descendant = (None, None, None, None, None, None)
             if person.handle in self.pset:
-                LOG.debug(
-                    "....... person %s skipped - already seen in descendants test",
-                    person.get_gramps_id(),
-                )
+                if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug(
+                        "....... person %s skipped - already seen in descendants test",
+                        person.get_gramps_id(),
+                    )
                 return no_valid_descendant
-            if DEBUGLEVEL > 2:
+            if DEBUGLEVEL > 2 and LOG.isEnabledFor(logging.DEBUG):
                 LOG.debug(
                     "     %s recursing into person [%s] %s, gen %s",
                     "..." * generation,
@@ -707,7 +808,7 @@ class ProbablyAlive:
                 # if these dates are important then the users should be making realistic estimates
                 # themselves.  We'll just use averages...
                 meanbirth = (bmin + bmax) / 2
-                if DEBUGLEVEL > 2:
+                if DEBUGLEVEL > 2 and LOG.isEnabledFor(logging.DEBUG):
                     LOG.debug(
                         "     == desc for %s returned bmin:%s, bmax:%s, ngens:%s, dmin:%s, dmax:%s, who:%s",
                         person.get_gramps_id(),
@@ -751,7 +852,10 @@ class ProbablyAlive:
                 return (date1, date2, explain, other)
             return (None, None, "", None)
 
-        LOG.debug("    ------- checking descendants of [%s]", person.get_gramps_id())
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "    ------- checking descendants of [%s]", person.get_gramps_id()
+            )
         date1, date2, explain, other = None, None, "", None
         try:
             date1, date2, explain, other = estimate_bd_range_from_descendants(person)
@@ -778,10 +882,11 @@ class ProbablyAlive:
             """
             range_not_found = (None, None, "", None, None)
             if person.handle in self.pset:
-                LOG.debug(
-                    "....... person %s skipped - already seen in ancestor test",
-                    person.get_gramps_id(),
-                )
+                if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug(
+                        "....... person %s skipped - already seen in ancestor test",
+                        person.get_gramps_id(),
+                    )
                 return range_not_found
             self.pset.add(person.handle)
 
@@ -910,7 +1015,8 @@ class ProbablyAlive:
             return range_not_found
 
         if parenth_p1:
-            LOG.debug("    ------ checking ancestors %s", person.get_gramps_id())
+            if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("    ------ checking ancestors %s", person.get_gramps_id())
             try:
                 date1, date2, explain, other, gen = estimate_bd_range_from_ancestors(
                     person, int(self.AVG_GENERATION_GAP), 1
@@ -966,11 +1072,12 @@ def probably_alive(
             if None then default to the setting in user config
     :param avg_generation_gap: average generation gap, in years
     """
-    LOG.debug(
-        " *** probably_alive() called for [%s] %s: ",
-        person.get_gramps_id(),
-        person.get_primary_name().get_gedcom_name(),
-    )
+    if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug(
+            " *** probably_alive() called for [%s] %s: ",
+            person.get_gramps_id(),
+            person.get_primary_name().get_gedcom_name(),
+        )
     # First, get the probable birth and death ranges for
     # this person from the real database:
     birth, death, explain, relative = probably_alive_range(
@@ -981,7 +1088,11 @@ def probably_alive(
     elif not current_date.is_valid():
         current_date = Today()
 
-    if not explain.startswith("DIRECT"):
+    if (
+        __debug__
+        and LOG.isEnabledFor(logging.DEBUG)
+        and not explain.startswith("DIRECT")
+    ):
         if relative is None:
             rel_id = "nobody"
         else:
@@ -996,20 +1107,22 @@ def probably_alive(
         )
     if not birth and not death:
         # no evidence, must consider alive
-        LOG.debug(
-            "      [%s] %s: decided alive - no evidence",
-            person.get_gramps_id(),
-            person.get_primary_name().get_gedcom_name(),
-        )
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "      [%s] %s: decided alive - no evidence",
+                person.get_gramps_id(),
+                person.get_primary_name().get_gedcom_name(),
+            )
         return (True, None, None, _("no evidence"), None) if return_range else True
     if not birth or not death:
         # insufficient evidence, must consider alive
-        LOG.debug(
-            "   LOGIC ERROR -  [%s] %s: only %s found; decided alive",
-            person.get_gramps_id(),
-            person.get_primary_name().get_gedcom_name(),
-            "birth" if birth else "death",
-        )
+        if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "   LOGIC ERROR -  [%s] %s: only %s found; decided alive",
+                person.get_gramps_id(),
+                person.get_primary_name().get_gedcom_name(),
+                "birth" if birth else "death",
+            )
         return (True, None, None, _("no evidence"), None) if return_range else True
     # must have dates from here:
     if limit:
@@ -1018,7 +1131,7 @@ def probably_alive(
     # ---true if  current_date >= birth(min)   and  true if current_date < death
     # these include true if current_date is within the estimated range
     result = current_date.match(birth, ">=") and current_date.match(death, "<")
-    if DEBUGLEVEL > 1:
+    if DEBUGLEVEL > 1 and LOG.isEnabledFor(logging.DEBUG):
         if not explain.startswith("DIRECT"):
             (bthmin, bthmax) = birth.get_start_stop_range()
             (dthmin, dthmax) = death.get_start_stop_range()
@@ -1053,11 +1166,26 @@ def probably_alive_range(
     basedb = db
     while isinstance(basedb, ProxyDbBase):
         basedb = basedb.db
+    cache = get_life_span_cache(basedb)
     # Now, we create a wrapper for doing work:
     pbac = ProbablyAlive(
-        basedb, max_sib_age_diff, max_age_prob_alive, avg_generation_gap
+        basedb, max_sib_age_diff, max_age_prob_alive, avg_generation_gap, cache=cache
+    )
+    if cache is None or person is None:
+        return pbac.probably_alive_range(person)
+    # The estimate depends on the events of the person that the db shows
+    ranges = cache.get_ranges(db)
+    key = (
+        person.handle,
+        pbac.MAX_SIB_AGE_DIFF,
+        pbac.MAX_AGE_PROB_ALIVE,
+        pbac.AVG_GENERATION_GAP,
+        pbac.MIN_GENERATION_YEARS,
     )
-    return pbac.probably_alive_range(person)
+    result = ranges.get(key)
+    if result is None:
+        result = ranges[key] = pbac.probably_alive_range(person)
+    return result
 
 
 def update_constants():
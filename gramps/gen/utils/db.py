@@ -376,11 +376,9 @@ def find_children(db, person):
     Return the list of all children's IDs for a person.
     """
     children = set()
-    for family_handle in person.get_family_handle_list():
-        family = db.get_family_from_handle(family_handle)
-        if family:
-            for child_ref in family.get_child_ref_list():
-                children.add(child_ref.ref)
+    for family in db.get_families_from_handles(person.get_family_handle_list()):
+        for child_ref in family.get_child_ref_list():
+            children.add(child_ref.ref)
     return list(children)
 
 
@@ -394,8 +392,7 @@ def find_parents(db, person):
     Return the unique list of all parents' IDs for a person.
     """
     parents = set()
-    for family_handle in person.get_parent_family_handle_list():
-        family = db.get_family_from_handle(family_handle)
+    for family in db.get_families_from_handles(person.get_parent_family_handle_list()):
         father_handle = family.get_father_handle()
         if father_handle:
             parents.add(father_handle)
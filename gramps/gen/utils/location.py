@@ -33,27 +33,52 @@ def get_location_list(db, place, date=None, lang=""):
     """
     Return a list of place names for display.
     """
+    return [
+        (name, item.get_type())
+        for item, name in get_location_chain(db, place, date, lang)
+    ]
+
+
+def get_location_chain(db, place, date=None, lang=""):
+    """
+    Return the places of the location list of a place, with their names for
+    display, as a list of (place, name) tuples.
+    """
     if date is None:
-        date = __get_latest_date(place)
+        date = get_location_date(place)
     visited = [place.handle]
-    lines = [(__get_name(place, date, lang), place.get_type())]
+    lines = []
     while True:
-        handle = None
-        for placeref in place.get_placeref_list():
-            ref_date = placeref.get_date_object()
-            if ref_date.is_empty() or date.match_exact(ref_date):
-                handle = placeref.ref
-                break
+        name, handle = get_location_step(place, date, lang)
+        lines.append((place, name))
         if handle is None or handle in visited:
             break
         place = db.get_place_from_handle(handle)
         if place is None:
             break
         visited.append(handle)
-        lines.append((__get_name(place, date, lang), place.get_type()))
     return lines
 
 
+def get_location_date(place):
+    """
+    Return the date of the location list of a place when none is given.
+    """
+    return __get_latest_date(place)
+
+
+def get_location_step(place, date, lang=""):
+    """
+    Return the name of a place for display at a date, and the handle of the
+    place enclosing it at that date, or None.
+    """
+    for placeref in place.get_placeref_list():
+        ref_date = placeref.get_date_object()
+        if ref_date.is_empty() or date.match_exact(ref_date):
+            return __get_name(place, date, lang), placeref.ref
+    return __get_name(place, date, lang), None
+
+
 def __get_name(place, date, lang):
     endonym = None
     for place_name in place.get_all_names():
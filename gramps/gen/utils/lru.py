@@ -25,163 +25,244 @@
 Least recently used algorithm
 """
 
+# -------------------------------------------------------------------------
+#
+# Python modules
+#
+# -------------------------------------------------------------------------
+from collections import OrderedDict
+from sys import getsizeof
+
+_ATOMIC = (str, bytes, int, float, complex, bool, type(None))
+_SLOTS: dict[type, tuple[str, ...]] = {}
 
-class Node:
+
+def _get_slots(cls):
     """
-    Node to be stored in the LRU structure
+    Return the names of the slots of a class and its bases, with the private
+    names mangled.
     """
+    try:
+        return _SLOTS[cls]
+    except KeyError:
+        pass
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_%s%s" % (klass.__name__.lstrip("_"), name)
+            names.append(name)
+    _SLOTS[cls] = names = tuple(names)
+    return names
 
-    def __init__(self, prev, value):
-        self.prev = prev
-        self.value = value
-        self.next = None
 
+def estimate_size(obj):
+    """
+    Return an estimate of the memory used by an object and everything it
+    holds, in bytes.
 
-class LRU:
+    Containers, the slots of objects such as those of gramps.gen.lib, and
+    instance dictionaries are followed.  An object reached several times is
+    counted once.
     """
-    Implementation of a length-limited O(1) LRU cache
+    size = 0
+    seen = set()
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += getsizeof(obj)
+        if isinstance(obj, _ATOMIC):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            for name in _get_slots(obj.__class__):
+                stack.append(getattr(obj, name, None))
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+    return size
+
+
+class LRUCache:
     """
+    Implementation of an O(1) LRU cache bounded by the number of entries
+    and by the estimated memory of the values.
 
-    def __init__(self, count):
+    Values can be given their own memory budget by kind, which is the class
+    name of the value.  A value of a kind with a budget only evicts values
+    of the same kind, so that a large number of one kind of object does not
+    flush the others from the cache.  The total memory and the number of
+    entries are bounded for all kinds together.
+    """
+
+    def __init__(self, count=0, size=0, budgets=None, sizeof=estimate_size):
         """
-        Set count to 0 or 1 to disable.
+        :param count: The maximum number of entries, 0 for no limit.
+        :type count: int
+        :param size: The maximum estimated memory of the values in bytes, 0
+                     for no limit.
+        :type size: int
+        :param budgets: The maximum estimated memory in bytes for each kind
+                        of value, e.g. {"Person": 2**26}.
+        :type budgets: dict
+        :param sizeof: The function that estimates the memory of a value.
+        :type sizeof: callable
         """
         self.count = count
-        self.data = {}
-        self.first = None
-        self.last = None
+        self.size = size
+        self.budgets = budgets or {}
+        self.sizeof = sizeof
+        # The values are only measured when there is a memory limit
+        self.__measure = bool(size or self.budgets)
+        self.__data = OrderedDict()
+        # The keys of the kinds with a budget, in the same order as __data
+        self.__kinds = {kind: OrderedDict() for kind in self.budgets}
+        self.__usage = dict.fromkeys(self.budgets, 0)
+        self.__total = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    def __contains__(self, obj):
+    def __contains__(self, key):
         """
-        Return True if the object is contained in the LRU
+        Return True if the key is cached.
         """
-        return obj in self.data
+        return key in self.__data
 
-    def __getitem__(self, obj):
+    def __len__(self):
         """
-        Return item associated with Obj
+        Return the number of entries.
         """
-        return self.data[obj].value[1]
+        return len(self.__data)
 
-    def __setitem__(self, obj, val):
+    def __getitem__(self, key):
         """
-        Set the item in the LRU, removing an old entry if needed
+        Return the value of a key, raising KeyError if it is not cached.
         """
-        if self.count <= 1:  # Disabled
-            return
-        if obj in self.data:
-            del self[obj]
-        nobj = Node(self.last, (obj, val))
-        if self.first is None:
-            self.first = nobj
-        if self.last:
-            self.last.next = nobj
-        self.last = nobj
-        self.data[obj] = nobj
-        if len(self.data) > self.count:
-            if self.first == self.last:
-                self.first = None
-                self.last = None
-                return
-            lnk = self.first
-            lnk.next.prev = None
-            self.first = lnk.next
-            lnk.next = None
-            if lnk.value[0] in self.data:
-                del self.data[lnk.value[0]]
-            del lnk
+        try:
+            value, dummy, kind = self.__data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self.__data.move_to_end(key)
+        if kind in self.__kinds:
+            self.__kinds[kind].move_to_end(key)
+        return value
 
-    def __delitem__(self, obj):
+    def get(self, key, default=None):
         """
-        Delete the object from the LRU
+        Return the value of a key, or default if it is not cached.
         """
-        nobj = self.data[obj]
-        if nobj.prev:
-            nobj.prev.next = nobj.next
-        else:
-            self.first = nobj.next
-        if nobj.next:
-            nobj.next.prev = nobj.prev
-        else:
-            self.last = nobj.prev
-        del self.data[obj]
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
-    def __iter__(self):
+    def __setitem__(self, key, value):
         """
-        Iterate over the LRU
+        Store the value of a key, evicting the least recently used entries
+        if a limit is exceeded.
         """
-        cur = self.first
-        while cur is not None:
-            cur2 = cur.next
-            yield cur.value[1]
-            cur = cur2
-        raise StopIteration
+        if key in self.__data:
+            self.__remove(key)
+        kind = value.__class__.__name__
+        nbytes = self.sizeof(value) if self.__measure else 0
+        self.__data[key] = (value, nbytes, kind)
+        self.__total += nbytes
+        if kind in self.__kinds:
+            self.__kinds[kind][key] = None
+            self.__usage[kind] += nbytes
+            keys = self.__kinds[kind]
+            while self.__usage[kind] > self.budgets[kind] and len(keys) > 1:
+                self.__evict(next(iter(keys)))
+        while (self.count and len(self.__data) > self.count) or (
+            self.size and self.__total > self.size and len(self.__data) > 1
+        ):
+            self.__evict(next(iter(self.__data)))
 
-    def iteritems(self):
+    def __delitem__(self, key):
         """
-        Return items in the LRU using a generator
+        Remove a key, raising KeyError if it is not cached.
         """
-        cur = self.first
-        while cur is not None:
-            cur2 = cur.next
-            yield cur.value
-            cur = cur2
-        raise StopIteration
+        self.__remove(key)
 
-    def iterkeys(self):
+    def __remove(self, key):
         """
-        Return keys in the LRU using a generator
+        Remove a key and account for the memory of its value.
         """
-        return iter(self.data)
+        dummy, nbytes, kind = self.__data.pop(key)
+        self.__total -= nbytes
+        if kind in self.__kinds:
+            del self.__kinds[kind][key]
+            self.__usage[kind] -= nbytes
 
-    def itervalues(self):
+    def __evict(self, key):
         """
-        Return items and keys in the LRU using a generator
+        Remove a key to make room for a new entry.
         """
-        for data in self.items():
-            yield data[1]
+        self.__remove(key)
+        self.evictions += 1
+
+    def pop(self, key, default=None):
+        """
+        Remove a key and return its value, or default if it is not cached.
+        """
+        if key not in self.__data:
+            return default
+        value = self.__data[key][0]
+        self.__remove(key)
+        return value
 
     def keys(self):
         """
-        Return all keys
+        Return all keys, from the least to the most recently used.
         """
-        return [data[0] for data in self.items()]
+        return list(self.__data)
 
     def values(self):
         """
-        Return all values
+        Return all values, from the least to the most recently used.
+        """
+        return [entry[0] for entry in self.__data.values()]
+
+    def clear(self):
+        """
+        Empty the cache.  The statistics are kept.
         """
-        return [data[1] for data in self.items()]
+        self.__data.clear()
+        for keys in self.__kinds.values():
+            keys.clear()
+        self.__usage = dict.fromkeys(self.budgets, 0)
+        self.__total = 0
 
-    def items(self):
+    def get_memory(self, kind=None):
         """
-        Return all items
+        Return the estimated memory of the cached values in bytes, for one
+        kind with a budget or for all of them.
         """
-        return [data[0] for data in self.items()]
+        if kind is None:
+            return self.__total
+        return self.__usage[kind]
 
-    def clear(self):
+    def get_statistics(self):
+        """
+        Return a dictionary with the number of entries, their estimated
+        memory, and the number of hits, misses and evictions.
         """
-        Empties LRU
-        """
-        # Step through the doubly linked list, setting prev and next to None.
-        # This ensures that each node is unreachable and therefore eligible for
-        # garbage collection. "del" is also called for each node, but it is
-        # unclear whether this actually has any effect, of just removes the
-        # binding to nobj
-        nobj = self.first
-        # The references first and last are removed so that the nodes are not
-        # reachable from these
-        self.first = None
-        self.last = None
-        # The references from self.data are removed
-        self.data.clear()
-        while nobj is not None and nobj.next is not None:
-            # each node except the last is processed
-            nobj.next.prev = None
-            nextobj = nobj.next
-            nobj.next = None
-            del nobj
-            nobj = nextobj
-        if nobj is not None:
-            # The last node is processed
-            del nobj
+        return {
+            "entries": len(self.__data),
+            "memory": self.__total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,461 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+In-memory index of the parent and child links between people.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Python modules
+#
+# -------------------------------------------------------------------------
+from __future__ import annotations
+
+import weakref
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ..errors import HandleError
+from ..lib.serialize import DataDict
+from .callback import Callback
+
+# The database signals after which a pedigree graph must be rebuilt
+SIGNALS = [
+    "person-add",
+    "person-update",
+    "person-delete",
+    "person-rebuild",
+    "family-add",
+    "family-update",
+    "family-delete",
+    "family-rebuild",
+]
+
+_GRAPHS: weakref.WeakKeyDictionary[Callback, PedigreeGraph] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_pedigree_graph(db):
+    """
+    Return the pedigree graph of a database.
+
+    The graph is built when it is first needed, and shared until the people
+    or families of the database change. A database that doesn't emit
+    signals, such as a proxy, gets a graph reading the links through the
+    database as the traversals reach them.
+    """
+    if not isinstance(db, Callback):
+        return ProxyPedigreeGraph(db)
+    graph = _GRAPHS.get(db)
+    if graph is None:
+        graph = PedigreeGraph()
+        graph.connect_db_signals(db)
+        _GRAPHS[db] = graph
+    if graph.dirty:
+        graph.build(db)
+    return graph
+
+
+def _iter_data(cursor, get_object):
+    """
+    Iterate over the raw data of a cursor, wrapped in a DataDict, or over
+    the objects if the cursor doesn't return dictionaries.
+    """
+    with cursor as cur:
+        for handle, data in cur:
+            if isinstance(data, dict):
+                yield handle, data if isinstance(data, DataDict) else DataDict(data)
+            else:
+                yield handle, get_object(handle)
+
+
+def _get_object(get_object, handle):
+    """
+    Return an object of the database, or None if it is not found.
+    """
+    try:
+        return get_object(handle)
+    except HandleError:
+        return None
+
+
+# -------------------------------------------------------------------------
+#
+# PedigreeGraph
+#
+# -------------------------------------------------------------------------
+class PedigreeGraph:
+    """
+    The parent and child links between the people of a database.
+
+    People and families are numbered, and the links are stored as tuples
+    of these numbers, so that traversals don't need to fetch any objects.
+    The children of a family are the people that have it in their list of
+    parent families.
+    """
+
+    def __init__(self):
+        self.dirty = True
+        self.person_handles = []
+        self.person_index = {}
+        self.family_handles = []
+        self.parent_families = []
+        self.families = []
+        self.family_parents = []
+        self.family_children = []
+
+    def connect_db_signals(self, db):
+        """
+        Mark the graph as dirty when the people or families of the database
+        change.
+        """
+        for name in SIGNALS:
+            db.connect(name, self._datachange_callback)
+
+    def _datachange_callback(self, handle_list=None):
+        self.dirty = True
+
+    def build(self, db):
+        """
+        Build the graph from the people and families of the database.
+        """
+        family_handles = []
+        family_index = {}
+        family_parents = []
+        for handle, family in _iter_data(
+            db.get_family_cursor(), db.get_family_from_handle
+        ):
+            if family is None:
+                continue
+            family_index[handle] = len(family_handles)
+            family_handles.append(handle)
+            family_parents.append((family.father_handle, family.mother_handle))
+
+        person_handles = []
+        person_index = {}
+        parent_families = []
+        families = []
+        for handle, person in _iter_data(
+            db.get_person_cursor(), db.get_person_from_handle
+        ):
+            if person is None:
+                continue
+            person_index[handle] = len(person_handles)
+            person_handles.append(handle)
+            parent_families.append(
+                tuple(
+                    family_index[family_handle]
+                    for family_handle in person.parent_family_list
+                    if family_handle in family_index
+                )
+            )
+            families.append(
+                tuple(
+                    family_index[family_handle]
+                    for family_handle in person.family_list
+                    if family_handle in family_index
+                )
+            )
+
+        family_children = [[] for dummy in family_handles]
+        for index, person_families in enumerate(parent_families):
+            for family in person_families:
+                family_children[family].append(index)
+
+        self.person_handles = person_handles
+        self.person_index = person_index
+        self.family_handles = family_handles
+        self.parent_families = parent_families
+        self.families = families
+        self.family_parents = [
+            tuple(
+                person_index[parent_handle]
+                for parent_handle in parents
+                if parent_handle in person_index
+            )
+            for parents in family_parents
+        ]
+        self.family_children = [tuple(children) for children in family_children]
+        self.dirty = False
+
+    def _get_indexes(self, handles):
+        return [
+            self.person_index[handle]
+            for handle in handles
+            if handle in self.person_index
+        ]
+
+    def _get_parent_families(self, index):
+        return self.parent_families[index]
+
+    def _get_families(self, index):
+        return self.families[index]
+
+    def _get_family_parents(self, family):
+        return self.family_parents[family]
+
+    def _get_family_children(self, family):
+        return self.family_children[family]
+
+    def get_parents(self, index, main_parents=True):
+        """
+        Return the numbers of the parents of a person.
+
+        If main_parents is True, only the parents in the main parent family
+        of the person are returned.
+        """
+        families = self._get_parent_families(index)
+        if main_parents:
+            families = families[:1]
+        return [
+            parent for family in families for parent in self._get_family_parents(family)
+        ]
+
+    def get_children(self, index):
+        """
+        Return the numbers of the children of a person.
+        """
+        return [
+            child
+            for family in self._get_families(index)
+            for child in self._get_family_children(family)
+        ]
+
+    def _iter_bfs(self, handles, get_next, max_gen, inclusive=True):
+        """
+        Yield the handle and generation of the given people (generation 0)
+        and of the people reached from them, breadth-first. Each person is
+        yielded once, with the smallest generation.
+
+        If inclusive is False, the given people are only yielded if they are
+        reached from one of the others.
+        """
+        queue = list(dict.fromkeys(self._get_indexes(handles)))
+        gen = 0
+        if not inclusive:
+            queue = list(
+                dict.fromkeys(other for index in queue for other in get_next(index))
+            )
+            gen = 1
+        seen = set(queue)
+        while queue:
+            for index in queue:
+                yield self.person_handles[index], gen
+            gen += 1
+            if max_gen is not None and gen > max_gen:
+                return
+            next_queue = []
+            for index in queue:
+                for other in get_next(index):
+                    if other not in seen:
+                        seen.add(other)
+                        next_queue.append(other)
+            queue = next_queue
+
+    def _iter_deep(self, handles, get_next, min_gen):
+        """
+        Yield the handles of the people that are reached from the given
+        people by a path of at least min_gen steps.
+        """
+        queue = set(self._get_indexes(handles))
+        for dummy in range(min_gen):
+            queue = set(other for index in queue for other in get_next(index))
+        seen = set()
+        queue = list(queue)
+        while queue:
+            index = queue.pop()
+            if index in seen:
+                continue
+            seen.add(index)
+            yield self.person_handles[index]
+            queue.extend(get_next(index))
+
+    def iter_ancestors(self, handles, max_gen=None, main_parents=True, inclusive=True):
+        """
+        Yield the handle and generation of the given people (generation 0)
+        and of their ancestors, breadth-first, up to max_gen generations.
+        """
+        return self._iter_bfs(
+            handles,
+            lambda index: self.get_parents(index, main_parents),
+            max_gen,
+            inclusive,
+        )
+
+    def iter_descendants(self, handles, max_gen=None, inclusive=True):
+        """
+        Yield the handle and generation of the given people (generation 0)
+        and of their descendants, breadth-first, up to max_gen generations.
+        """
+        return self._iter_bfs(handles, self.get_children, max_gen, inclusive)
+
+    def iter_deep_ancestors(self, handles, min_gen, main_parents=True):
+        """
+        Yield the handles of the ancestors of the given people that are at
+        least min_gen generations away along some line.
+        """
+        return self._iter_deep(
+            handles, lambda index: self.get_parents(index, main_parents), min_gen
+        )
+
+    def iter_deep_descendants(self, handles, min_gen):
+        """
+        Yield the handles of the descendants of the given people that are at
+        least min_gen generations away along some line.
+        """
+        return self._iter_deep(handles, self.get_children, min_gen)
+
+    def iter_relatives(self, handles):
+        """
+        Yield the handles of the given people and of everybody related to
+        them by any chain of parents, children, siblings and spouses.
+        """
+
+        def get_relatives(index):
+            return [
+                other
+                for family in self._get_parent_families(index)
+                + self._get_families(index)
+                for other in self._get_family_parents(family)
+                + self._get_family_children(family)
+            ]
+
+        return (handle for handle, gen in self._iter_bfs(handles, get_relatives, None))
+
+    def iter_common_ancestry(self, handles):
+        """
+        Yield the handles of the people that have a common ancestor with one
+        of the given people.
+
+        Every person counts as their own ancestor, and a parent family
+        without parents counts as a common ancestor of its descendants.
+        """
+        ancestors = set()
+        roots = set()
+        for handle, gen in self.iter_ancestors(handles, main_parents=False):
+            index = self.person_index[handle]
+            ancestors.add(index)
+            for family in self._get_parent_families(index):
+                if not self._get_family_parents(family):
+                    roots.update(self._get_family_children(family))
+        roots.update(ancestors)
+        return (
+            handle
+            for handle, gen in self._iter_bfs(
+                (self.person_handles[index] for index in roots),
+                self.get_children,
+                None,
+            )
+        )
+
+
+# -------------------------------------------------------------------------
+#
+# ProxyPedigreeGraph
+#
+# -------------------------------------------------------------------------
+class ProxyPedigreeGraph(PedigreeGraph):
+    """
+    The parent and child links between the people of a database that
+    doesn't emit signals, such as a proxy.
+
+    The people and families are read from the database when a traversal
+    reaches them, so that only the people and links seen through the proxy
+    are followed, without building the graph of the whole database.
+    """
+
+    def __init__(self, db):
+        PedigreeGraph.__init__(self)
+        self.db = db
+        self.dirty = False
+        self.family_index = {}
+        self.family_links = []
+
+    def _get_person_index(self, handle):
+        """
+        Return the number of a person, or None if the person is not in the
+        database.
+        """
+        if handle in self.person_index:
+            return self.person_index[handle]
+        index = None
+        person = _get_object(self.db.get_person_from_handle, handle)
+        if person is not None:
+            index = len(self.person_handles)
+            self.person_handles.append(handle)
+            self.parent_families.append(
+                self._get_family_indexes(person.parent_family_list)
+            )
+            self.families.append(self._get_family_indexes(person.family_list))
+        self.person_index[handle] = index
+        return index
+
+    def _get_family_indexes(self, handles):
+        """
+        Return the numbers of the families that are in the database.
+        """
+        indexes = []
+        for handle in handles:
+            if handle not in self.family_index:
+                index = None
+                family = _get_object(self.db.get_family_from_handle, handle)
+                if family is not None:
+                    index = len(self.family_handles)
+                    self.family_handles.append(handle)
+                    self.family_parents.append(None)
+                    self.family_children.append(None)
+                    self.family_links.append(
+                        (
+                            (family.father_handle, family.mother_handle),
+                            [child_ref.ref for child_ref in family.child_ref_list],
+                        )
+                    )
+                self.family_index[handle] = index
+            if self.family_index[handle] is not None:
+                indexes.append(self.family_index[handle])
+        return tuple(indexes)
+
+    def _get_indexes(self, handles):
+        return [
+            index for index in map(self._get_person_index, handles) if index is not None
+        ]
+
+    def _get_family_parents(self, family):
+        if self.family_parents[family] is None:
+            self.family_parents[family] = tuple(
+                self._get_indexes(
+                    handle for handle in self.family_links[family][0] if handle
+                )
+            )
+        return self.family_parents[family]
+
+    def _get_family_children(self, family):
+        if self.family_children[family] is None:
+            self.family_children[family] = tuple(
+                index
+                for index in self._get_indexes(self.family_links[family][1])
+                if family in self.parent_families[index]
+            )
+        return self.family_children[family]
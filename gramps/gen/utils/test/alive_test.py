@@ -0,0 +1,136 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the cached life span estimates.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Standard python modules
+#
+# -------------------------------------------------------------------------
+import unittest
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import ChildRef, Date, Event, EventRef, EventType, Family, Person
+from ...proxy import LivingProxyDb, PrivateProxyDb
+from ..alive import get_life_span_cache, probably_alive
+
+
+class LifeSpanCacheTest(unittest.TestCase):
+    """
+    Tests of the life span cache, with a father born in 1800 and a child
+    without any events.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn("Add people", self.db) as trans:
+            self.father = Person()
+            self.db.add_person(self.father, trans)
+            self.add_event(self.father, EventType.BIRTH, 1800, trans)
+            self.child = Person()
+            self.db.add_person(self.child, trans)
+            family = Family()
+            family.set_father_handle(self.father.handle)
+            child_ref = ChildRef()
+            child_ref.ref = self.child.handle
+            family.add_child_ref(child_ref)
+            self.db.add_family(family, trans)
+            self.father.add_family_handle(family.handle)
+            self.db.commit_person(self.father, trans)
+            self.child.add_parent_family_handle(family.handle)
+            self.db.commit_person(self.child, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_event(self, person, event_type, year, trans):
+        event = Event()
+        event.set_type(event_type)
+        date = Date()
+        date.set_yr_mon_day(year, 1, 1)
+        event.set_date_object(date)
+        self.db.add_event(event, trans)
+        event_ref = EventRef()
+        event_ref.ref = event.handle
+        person.add_event_ref(event_ref)
+        if event_type == EventType.BIRTH:
+            person.set_birth_ref(event_ref)
+        self.db.commit_person(person, trans)
+
+    def test_cache(self):
+        cache = get_life_span_cache(self.db)
+        self.assertIs(get_life_span_cache(self.db), cache)
+        self.assertFalse(probably_alive(self.child, self.db))
+        self.assertIn(self.father.handle, cache.dates)
+        ranges = cache.get_ranges(self.db)
+        self.assertEqual(len(ranges), 1)
+        self.assertFalse(probably_alive(self.child, self.db))
+        self.assertEqual(len(ranges), 1)
+
+    def test_proxy(self):
+        cache = get_life_span_cache(self.db)
+        private = PrivateProxyDb(self.db)
+        proxy = LivingProxyDb(private, LivingProxyDb.MODE_EXCLUDE_ALL)
+        self.assertIsNotNone(proxy.get_person_from_handle(self.child.handle))
+        # The proxy estimates the unfiltered people
+        self.assertEqual(len(cache.get_ranges(private)), 0)
+        self.assertEqual(len(cache.get_ranges(self.db)), 1)
+
+    def test_private_death(self):
+        with DbTxn("Add person", self.db) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            self.add_event(person, EventType.DEATH, 2005, trans)
+            death_ref = person.get_event_ref_list()[0]
+            death_ref.set_privacy(True)
+            person.set_death_ref(death_ref)
+            self.db.commit_person(person, trans)
+        private = PrivateProxyDb(self.db)
+        self.assertTrue(
+            probably_alive(private.get_person_from_handle(person.handle), private)
+        )
+        # The private death is known to the living proxy
+        proxy = LivingProxyDb(private, LivingProxyDb.MODE_EXCLUDE_ALL)
+        self.assertIsNotNone(proxy.get_person_from_handle(person.handle))
+
+    def test_invalidate(self):
+        cache = get_life_span_cache(self.db)
+        self.assertFalse(probably_alive(self.child, self.db))
+        with DbTxn("Move birth", self.db) as trans:
+            father = self.db.get_person_from_handle(self.father.handle)
+            birth = self.db.get_event_from_handle(father.get_birth_ref().ref)
+            birth.get_date_object().set_yr_mon_day(1990, 1, 1)
+            self.db.commit_event(birth, trans)
+        self.assertEqual(cache.dates, {})
+        self.assertTrue(probably_alive(self.child, self.db))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+
+"""
+Unittest for the memory-bounded LRU cache.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Standard python modules
+#
+# -------------------------------------------------------------------------
+import unittest
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ...lib import Event, Person
+from ..lru import LRUCache, estimate_size
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_count(self):
+        cache = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        self.assertEqual(cache["a"], 1)
+        cache["c"] = 3
+        self.assertEqual(cache.keys(), ["a", "c"])
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_statistics(self):
+        cache = LRUCache(10)
+        cache["a"] = None
+        self.assertIsNone(cache.get("a", 0))
+        self.assertEqual(cache.get("b", 0), 0)
+        with self.assertRaises(KeyError):
+            cache["c"]
+        stats = cache.get_statistics()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["evictions"], 0)
+
+    def test_size(self):
+        cache = LRUCache(size=250, sizeof=lambda value: 100)
+        for key in "abc":
+            cache[key] = key
+        self.assertEqual(cache.keys(), ["b", "c"])
+        self.assertEqual(cache.get_memory(), 200)
+        cache["c"] = "c"
+        self.assertEqual(cache.get_memory(), 200)
+        self.assertEqual(cache.pop("b"), "b")
+        self.assertEqual(cache.get_memory(), 100)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_memory(), 0)
+
+    def test_large_value(self):
+        cache = LRUCache(size=10, sizeof=lambda value: 100)
+        cache["a"] = "a"
+        self.assertEqual(cache.keys(), ["a"])
+        cache["b"] = "b"
+        self.assertEqual(cache.keys(), ["b"])
+
+    def test_budgets(self):
+        cache = LRUCache(budgets={"Person": 250}, sizeof=lambda value: 100)
+        events = [Event() for dummy in range(3)]
+        for index, event in enumerate(events):
+            cache["e%d" % index] = event
+        for index in range(3):
+            cache["p%d" % index] = Person()
+        self.assertEqual(cache.keys(), ["e0", "e1", "e2", "p1", "p2"])
+        self.assertEqual(cache.get_memory("Person"), 200)
+        self.assertEqual(cache.get_memory(), 500)
+        self.assertIs(cache["e0"], events[0])
+        del cache["p1"]
+        self.assertEqual(cache.get_memory("Person"), 100)
+
+    def test_estimate_size(self):
+        person = Person()
+        empty = estimate_size(person)
+        self.assertGreater(empty, 0)
+        person.set_gramps_id("I" * 1000)
+        self.assertGreaterEqual(estimate_size(person), empty + 1000)
+        shared = ["x" * 1000]
+        self.assertLess(estimate_size([shared, shared]), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
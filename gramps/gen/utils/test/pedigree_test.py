@@ -0,0 +1,206 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the pedigree graph.
+"""
+
+# -------------------------------------------------------------------------
+#
+# Standard python modules
+#
+# -------------------------------------------------------------------------
+import unittest
+
+# -------------------------------------------------------------------------
+#
+# Gramps modules
+#
+# -------------------------------------------------------------------------
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import ChildRef, Family, Person
+from ...proxy import PrivateProxyDb
+from ..pedigree import get_pedigree_graph
+
+
+class PedigreeGraphTest(unittest.TestCase):
+    """
+    Tests of the pedigree graph.
+
+    The tree is::
+
+        grandfather + grandmother        (no parents) + (no parents)
+                  |                                  |
+             +----+----+                        +----+----+
+           father   uncle + mother            sister   brother
+             |
+           child
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn("Add people", self.db) as trans:
+            for name in (
+                "grandfather",
+                "grandmother",
+                "father",
+                "uncle",
+                "mother",
+                "child",
+                "sister",
+                "brother",
+                "stranger",
+            ):
+                person = Person()
+                self.db.add_person(person, trans)
+                setattr(self, name, person.handle)
+            self.add_family("grandfather", "grandmother", ["father", "uncle"], trans)
+            self.add_family("father", "mother", ["child"], trans)
+            self.add_family(None, None, ["sister", "brother"], trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_family(self, father, mother, children, trans):
+        family = Family()
+        self.db.add_family(family, trans)
+        for attr, name in (("father_handle", father), ("mother_handle", mother)):
+            if name:
+                person = self.db.get_person_from_handle(getattr(self, name))
+                person.add_family_handle(family.handle)
+                self.db.commit_person(person, trans)
+                setattr(family, attr, person.handle)
+        for name in children:
+            person = self.db.get_person_from_handle(getattr(self, name))
+            person.add_parent_family_handle(family.handle)
+            self.db.commit_person(person, trans)
+            child_ref = ChildRef()
+            child_ref.ref = person.handle
+            family.add_child_ref(child_ref)
+        self.db.commit_family(family, trans)
+        return family
+
+    def test_ancestors(self):
+        graph = get_pedigree_graph(self.db)
+        self.assertEqual(
+            dict(graph.iter_ancestors([self.child])),
+            {
+                self.child: 0,
+                self.father: 1,
+                self.mother: 1,
+                self.grandfather: 2,
+                self.grandmother: 2,
+            },
+        )
+        self.assertEqual(
+            set(dict(graph.iter_ancestors([self.child], 1))),
+            {self.child, self.father, self.mother},
+        )
+        self.assertEqual(
+            set(dict(graph.iter_ancestors([self.child, self.father], inclusive=False))),
+            {self.father, self.mother, self.grandfather, self.grandmother},
+        )
+        self.assertEqual(
+            set(graph.iter_deep_ancestors([self.child], 2)),
+            {self.grandfather, self.grandmother},
+        )
+
+    def test_descendants(self):
+        graph = get_pedigree_graph(self.db)
+        self.assertEqual(
+            dict(graph.iter_descendants([self.grandmother], inclusive=False)),
+            {self.father: 1, self.uncle: 1, self.child: 2},
+        )
+        self.assertEqual(
+            set(graph.iter_deep_descendants([self.grandmother], 2)), {self.child}
+        )
+
+    def test_relatives(self):
+        graph = get_pedigree_graph(self.db)
+        self.assertEqual(
+            set(graph.iter_relatives([self.mother])),
+            {
+                self.grandfather,
+                self.grandmother,
+                self.father,
+                self.uncle,
+                self.mother,
+                self.child,
+            },
+        )
+
+    def test_common_ancestry(self):
+        graph = get_pedigree_graph(self.db)
+        self.assertEqual(
+            set(graph.iter_common_ancestry([self.uncle])),
+            {
+                self.grandfather,
+                self.grandmother,
+                self.father,
+                self.uncle,
+                self.child,
+            },
+        )
+        self.assertEqual(
+            set(graph.iter_common_ancestry([self.sister])),
+            {self.sister, self.brother},
+        )
+        self.assertEqual(
+            set(graph.iter_common_ancestry([self.stranger])), {self.stranger}
+        )
+
+    def test_invalidate(self):
+        graph = get_pedigree_graph(self.db)
+        self.assertIs(get_pedigree_graph(self.db), graph)
+        with DbTxn("Add family", self.db) as trans:
+            self.add_family("stranger", None, ["sister"], trans)
+        self.assertTrue(graph.dirty)
+        self.assertIs(get_pedigree_graph(self.db), graph)
+        self.assertEqual(
+            set(dict(graph.iter_ancestors([self.sister], main_parents=False))),
+            {self.sister, self.stranger},
+        )
+
+    def test_proxy(self):
+        father = self.db.get_person_from_handle(self.father)
+        father.set_privacy(True)
+        with DbTxn("Edit father", self.db) as trans:
+            self.db.commit_person(father, trans)
+        graph = get_pedigree_graph(PrivateProxyDb(self.db))
+        self.assertEqual(
+            dict(graph.iter_ancestors([self.child])),
+            {self.child: 0, self.mother: 1},
+        )
+        self.assertEqual(
+            set(dict(graph.iter_descendants([self.grandmother]))),
+            {self.grandmother, self.uncle},
+        )
+        # Only the people reached are read
+        self.assertNotIn(self.stranger, graph.person_index)
+        self.assertEqual(
+            set(graph.iter_common_ancestry([self.sister])),
+            {self.sister, self.brother},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
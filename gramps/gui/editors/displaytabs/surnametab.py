@@ -203,7 +203,7 @@ class SurnameTab(EmbeddedList):
             surn.set_prefix(self.model.get_value(node, 0))
             surn.set_surname(self.model.get_value(node, 1))
             surn.set_connector(self.model.get_value(node, 2))
-            surn.get_origintype().set(self.model.get_value(node, 3))
+            surn.set_origintype(self.model.get_value(node, 3))
             surn.set_primary(self.model.get_value(node, 4))
             new_list += [surn]
         return new_list
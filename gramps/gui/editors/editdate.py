@@ -275,7 +275,7 @@ class EditDate(ManagedWindow):
             )
             # didn't throw yet?
             self.validated_date = dat
-            LOG.debug("validated_date set to: {0}".format(dat.__dict__))
+            LOG.debug("validated_date set to: {0}".format(dat.get_object_state()))
             self.ok_button.set_sensitive(1)
             self.calendar_box.set_sensitive(1)
             return True
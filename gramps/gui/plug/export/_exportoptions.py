@@ -47,7 +47,9 @@ from gramps.gen.proxy import (
     LivingProxyDb,
     FilterProxyDb,
     ReferencedBySelectionProxyDb,
+    MaterializedProxyDb,
 )
+from gramps.gen.proxy.proxybase import ProxyDbBase
 
 # -------------------------------------------------------------------------
 #
@@ -618,6 +620,9 @@ class WriterOptionBox:
                         "{number_of} Person", "{number_of} People", people_count
                     ).format(number_of=people_count)
                 )
+        if isinstance(dbase, ProxyDbBase):
+            # evaluate the proxies once for the whole export
+            dbase = MaterializedProxyDb(dbase)
         return dbase
 
     def apply_proxy(self, proxy_name, dbase, progress=None):
@@ -25,17 +25,18 @@
 # Gramps modules
 #
 # -------------------------------------------------------------------------
-from gramps.gen.utils.lru import LRU
+from gramps.gen.utils.lru import LRUCache
 from gramps.gen.config import config
 
 
 class BaseModel:
-    # LRU cache size
+    # LRU cache size, and the estimated memory of the cached rows in bytes
     _CACHE_SIZE = config.get("interface.treemodel-cache-size")
+    _CACHE_MEMORY = config.get("interface.treemodel-cache-memory")
 
     def __init__(self):
-        self.lru_data = LRU(BaseModel._CACHE_SIZE)
-        self.lru_path = LRU(BaseModel._CACHE_SIZE)
+        self.lru_data = LRUCache(BaseModel._CACHE_SIZE, BaseModel._CACHE_MEMORY)
+        self.lru_path = LRUCache(BaseModel._CACHE_SIZE)
 
     def destroy(self):
         """
@@ -50,8 +51,7 @@ class BaseModel:
         changed.
         """
         if handle:
-            if handle in self.lru_data:
-                del self.lru_data[handle]
+            self.lru_data.pop(handle)
         else:
             self.lru_data.clear()
         # Invalidates all paths
@@ -62,9 +62,10 @@ class BaseModel:
         Get the value of a "col". col may be a number (position in a model)
         or a name (special value used by view).
         """
-        if handle in self.lru_data and col in self.lru_data[handle]:
+        row = self.lru_data.get(handle)
+        if row is not None and col in row:
             # print("hit", handle, col)
-            return (True, self.lru_data[handle][col])
+            return (True, row[col])
         # print("MISS", handle, col)
         return (False, None)
 
@@ -73,10 +74,13 @@ class BaseModel:
         Set the data associated with handle + col.
         """
         if not self._in_build:
-            if self.lru_data.count > 0:
-                if handle not in self.lru_data:
-                    self.lru_data[handle] = {}
-                self.lru_data[handle][col] = data
+            if BaseModel._CACHE_SIZE > 0:
+                row = self.lru_data.get(handle)
+                if row is None:
+                    row = {}
+                row[col] = data
+                # Store the row again to make it the most recently used
+                self.lru_data[handle] = row
 
     ## Cached Path's for TreeView:
     def get_cached_path(self, handle):
@@ -91,7 +95,7 @@ class BaseModel:
         """
         Set the Gtk iter path value.
         """
-        if not self._in_build:
+        if not self._in_build and BaseModel._CACHE_SIZE > 0:
             self.lru_path[handle] = path
 
     def clear_path_cache(self):
@@ -59,6 +59,9 @@ class CitationListModel(CitationBaseModel, FlatBaseModel):
     Flat citation model.  (Original code in CitationBaseModel).
     """
 
+    class_name = "Citation"
+    sort_fields = {0: "page", 1: "gramps_id"}
+
     def __init__(
         self,
         db,
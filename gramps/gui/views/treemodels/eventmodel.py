@@ -59,6 +59,9 @@ INVALID_DATE_FORMAT = config.get("preferences.invalid-date-format")
 #
 # -------------------------------------------------------------------------
 class EventModel(FlatBaseModel):
+    class_name = "Event"
+    sort_fields = {0: "description", 1: "gramps_id"}
+
     def __init__(
         self,
         db,
@@ -69,6 +72,9 @@ class EventModel(FlatBaseModel):
         skip=set(),
         sort_map=None,
     ):
+        # The view can show the places of all the events, whose titles are
+        # computed in one pass over the place tree
+        place_displayer.precompute(db, -1)
         self.gen_cursor = db.get_event_cursor
         self.map = db.get_raw_event_data
 
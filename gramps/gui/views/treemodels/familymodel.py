@@ -58,6 +58,9 @@ invalid_date_format = config.get("preferences.invalid-date-format")
 #
 # -------------------------------------------------------------------------
 class FamilyModel(FlatBaseModel):
+    class_name = "Family"
+    sort_fields = {0: "gramps_id"}
+
     def __init__(
         self,
         db,
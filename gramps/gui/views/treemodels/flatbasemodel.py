@@ -449,6 +449,12 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             so as to have localized sort
     """
 
+    # Inheriting classes can set the primary class of the rows, and map the
+    # model columns whose sort values are stored by the database to the
+    # name of the field
+    class_name: str | None = None
+    sort_fields: dict[int, str] = {}
+
     def __init__(
         self,
         db,
@@ -484,6 +490,7 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         # get the function that maps data to sort_keys
         self.sort_func = lambda x: glocale.sort_key(self.smap[col](x))
         self.sort_col = scol
+        self.sort_field = self.sort_fields.get(col)
         self.skip = skip
         self._in_build = False
 
@@ -573,6 +580,15 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         be shown.
         This list is sorted ascending, via localized string sort.
         """
+        if self.sort_field:
+            # read the values of the sort column without loading the objects
+            values = self.db.get_field_values(self.class_name, self.sort_field)
+            if values is not None:
+                srt_keys = [
+                    (glocale.sort_key(value), handle) for value, handle in values
+                ]
+                srt_keys.sort()
+                return srt_keys
         # use cursor as a context manager
         with self.gen_cursor() as cursor:
             # loop over database and store the sort field, and the handle
@@ -56,6 +56,9 @@ from .flatbasemodel import FlatBaseModel
 #
 # -------------------------------------------------------------------------
 class MediaModel(FlatBaseModel):
+    class_name = "Media"
+    sort_fields = {0: "desc", 1: "gramps_id", 3: "path"}
+
     def __init__(
         self,
         db,
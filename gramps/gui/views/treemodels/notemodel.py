@@ -55,6 +55,9 @@ from gramps.gen.lib import Note, NoteType, StyledText
 class NoteModel(FlatBaseModel):
     """ """
 
+    class_name = "Note"
+    sort_fields = {1: "gramps_id"}
+
     def __init__(
         self,
         db,
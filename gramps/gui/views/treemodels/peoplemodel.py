@@ -561,6 +561,11 @@ class PersonListModel(PeopleBaseModel, FlatBaseModel):
     Listed people model.
     """
 
+    class_name = "Person"
+    # The database stores the sorted name of each person in the current name
+    # format, and reads the people again only when that format has changed
+    sort_fields = {0: "sort_name", 1: "gramps_id"}
+
     def __init__(
         self,
         db,
@@ -639,6 +644,48 @@ class PersonTreeModel(PeopleBaseModel, TreeBaseModel):
     def column_header(self, node):
         return node.name if node.name else no_surname
 
+    def get_lazy_groups(self):
+        """
+        See TreeBaseModel. The groups are found from the surnames that the
+        database counts, and the group of each person is checked when the
+        group is loaded.
+        """
+        counts = self.db.get_surname_counts()
+        if counts is None:
+            return None
+        mapping = {
+            surname: self.db.get_name_group_mapping(surname)
+            for surname in self.db.get_name_group_keys()
+        }
+        groups = {}
+        for surname, dummy in counts:
+            groups.setdefault(mapping.get(surname, surname), []).append(surname)
+        return groups
+
+    def iter_group_rows(self, surnames):
+        """
+        See TreeBaseModel.
+        """
+        return self.db.iter_raw_person_data_by_surname(surnames)
+
+    def get_row_group(self, data):
+        """
+        See TreeBaseModel.
+        """
+        return name_displayer.name_grouping_data(self.db, data["primary_name"])
+
+    def get_row_groups(self, handle):
+        """
+        See TreeBaseModel. A person is counted under their first surname,
+        which can differ from the group they are shown in.
+        """
+        data = self.map(handle)
+        if not data:
+            return []
+        surname_list = data["primary_name"]["surname_list"]
+        surname = surname_list[0]["surname"] if surname_list else ""
+        return [self.get_row_group(data), self.db.get_name_group_mapping(surname)]
+
     def add_row(self, handle, data):
         """
         Add nodes to the node map for a single person.
@@ -646,10 +693,7 @@ class PersonTreeModel(PeopleBaseModel, TreeBaseModel):
         handle      The handle of the gramps object.
         data        The object data.
         """
-        ngn = name_displayer.name_grouping_data
-
-        name_data = data["primary_name"]
-        group_name = ngn(self.db, name_data)
+        group_name = self.get_row_group(data)
         sort_key = self.sort_func(data)
 
         # if group_name not in self.group_list:
@@ -72,6 +72,9 @@ _ = glocale.translation.gettext
 # -------------------------------------------------------------------------
 class PlaceBaseModel:
     def __init__(self, db):
+        # The view shows the titles of all the places, which are computed in
+        # one pass over the place tree
+        place_displayer.precompute(db, -1)
         self.gen_cursor = db.get_place_cursor
         self.map = db.get_raw_place_data
         self.fmap = [
@@ -275,6 +278,9 @@ class PlaceListModel(PlaceBaseModel, FlatBaseModel):
     Flat place model.  (Original code in PlaceBaseModel).
     """
 
+    class_name = "Place"
+    sort_fields = {1: "gramps_id"}
+
     def __init__(
         self,
         db,
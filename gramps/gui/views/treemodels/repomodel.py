@@ -53,6 +53,9 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #
 # -------------------------------------------------------------------------
 class RepositoryModel(FlatBaseModel):
+    class_name = "Repository"
+    sort_fields = {0: "name", 1: "gramps_id"}
+
     def __init__(
         self,
         db,
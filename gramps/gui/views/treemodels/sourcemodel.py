@@ -51,6 +51,9 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #
 # -------------------------------------------------------------------------
 class SourceModel(FlatBaseModel):
+    class_name = "Source"
+    sort_fields = {1: "gramps_id"}
+
     def __init__(
         self,
         db,
@@ -42,6 +42,7 @@ _LOG = logging.getLogger(".gui.treebasemodel")
 # GTK modules
 #
 # -------------------------------------------------------------------------
+from gi.repository import GLib
 from gi.repository import GObject
 from gi.repository import Gtk
 
@@ -290,6 +291,11 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
     has_secondary  :  If True, the model contains two Gramps object types.
                       The suffix '2' is appended to variables relating to the
                       secondary object type.
+
+    Models with one group level can load their groups lazily, see
+    get_lazy_groups. Without a search or filter, only the group nodes are
+    then built, and the rows of a group are added when it is first expanded
+    or when one of its rows is selected.
     """
 
     def __init__(
@@ -335,6 +341,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.tree = {}
         self.nodemap = NodeMap()
         self.handle2node = {}
+        self.lazy_groups = {}
+        self.__lazy = False
 
         # GTK3 We leak ref, yes??
         # self.set_property("leak_references", False)
@@ -420,12 +428,16 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         """
         Return the number of rows displayed.
         """
+        if self.__lazy:
+            return self.number_items()
         return self.__displayed
 
     def total(self):
         """
         Return the total number of rows without a filter or search condition.
         """
+        if self.__lazy:
+            return self.number_items()
         return self.__total
 
     def color_column(self):
@@ -441,6 +453,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.clear_cache()
         self.tree.clear()
         self.handle2node.clear()
+        self.lazy_groups.clear()
+        self.__lazy = False
         self.stamp += 1
         self.nodemap.clear()
         # start with creating the new iters
@@ -545,6 +559,16 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.__total = 0
         self.__displayed = 0
 
+        if not (dfilter or skip or self.has_secondary):
+            groups = self.get_lazy_groups()
+            if groups is not None:
+                _LOG.debug("rebuild lazy groups")
+                for group, key in groups.items():
+                    self.add_node(None, group, group, None, add_parent=False)
+                    self.lazy_groups[group] = key
+                self.__lazy = True
+                return
+
         items = self.number_items()
         _LOG.debug("rebuild search primary")
         self.__rebuild_search(dfilter, skip, items, self.gen_cursor, self.add_row)
@@ -641,6 +665,79 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
 
         status_ppl.end()
 
+    def get_lazy_groups(self):
+        """
+        Return a dictionary with a key for each group of the model, that
+        iter_group_rows uses to find the rows of the group, or None if the
+        groups can't be found without reading every row.
+
+        Models that load their groups lazily must also implement
+        iter_group_rows, get_row_group and get_row_groups.
+        """
+        return None
+
+    def iter_group_rows(self, key):
+        """
+        Return an iterator over the (handle, data) pairs of the rows of a
+        lazy group. Rows that belong to another group can be included.
+        """
+        raise NotImplementedError
+
+    def get_row_group(self, data):
+        """
+        Return the group of a row.
+        """
+        raise NotImplementedError
+
+    def get_row_groups(self, handle):
+        """
+        Return the lazy groups that must be loaded to find the row of a
+        handle.
+        """
+        raise NotImplementedError
+
+    def _load_group(self, node):
+        """
+        Add the rows of a lazy group.
+
+        The view doesn't know about the rows of a group that wasn't loaded,
+        so they are added without signals. Rows that belong to a group that
+        was already loaded are added later with the usual signals, as the
+        model can be asked for the rows by the view.
+        """
+        key = self.lazy_groups.pop(node.ref, None)
+        if key is None:
+            return
+        cput = perf_counter()
+        deferred = []
+        self._in_build = True
+        for handle, data in self.iter_group_rows(key):
+            if handle in self.handle2node:
+                continue
+            group = self.get_row_group(data)
+            if group == node.ref or group in self.lazy_groups:
+                self.add_row(handle, data)
+            else:
+                deferred.append(handle)
+        self._in_build = False
+        if deferred:
+            GLib.idle_add(self._add_deferred_rows, deferred)
+        _LOG.debug(
+            self.__class__.__name__
+            + " _load_group "
+            + str(perf_counter() - cput)
+            + " sec"
+        )
+
+    def _add_deferred_rows(self, handles):
+        """
+        Add the rows that a lazy group found for another group.
+        """
+        if self.db is not None and self.db.is_open():
+            for handle in handles:
+                self.add_row_by_handle(handle)
+        return False
+
     def add_node(
         self, parent, child, sortkey, handle, add_parent=True, secondary=False
     ):
@@ -660,6 +757,9 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
                     parent as a top group with no handle
         """
         self.clear_path_cache()
+        if parent in self.lazy_groups and not self._in_build:
+            # the row is added when the group is loaded
+            return
         if add_parent and not (parent in self.tree):
             # add parent to self.tree as a node with no handle, as the first
             # group level
@@ -855,6 +955,9 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         assert isinstance(handle, str)
         self.clear_cache(handle)
         if self._get_node(handle) is None:
+            if self.__lazy:
+                # the row can have moved to a group that was loaded
+                self.add_row_by_handle(handle)
             return  # row not currently displayed
 
         self.dont_change_active = True
@@ -901,6 +1004,16 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         visible
         """
         node = self._get_node(handle)
+        if node is None and self.lazy_groups:
+            groups = self.get_row_groups(handle)
+            for group in groups:
+                if group in self.lazy_groups:
+                    self._load_group(self.tree[group])
+            node = self._get_node(handle)
+            if node is None and groups:
+                # the row was deferred by _load_group
+                self.add_row_by_handle(handle)
+                node = self._get_node(handle)
         if node is None:
             return None
         return self._get_iter(node)
@@ -1009,6 +1122,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             pathlist = path.get_indices()
         for index in pathlist:
             _index = (-index - 1) if self.__reverse else index
+            if node.ref in self.lazy_groups:
+                self._load_group(node)
             try:
                 if len(node.children[_index]) > 0:
                     node = self.nodemap.node(node.children[_index][1])
@@ -1096,6 +1211,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             nodeid = id(self.tree[None])
         else:
             nodeparent = self.get_node_from_iter(iterparent)
+            if nodeparent.ref in self.lazy_groups:
+                self._load_group(nodeparent)
             if nodeparent.children:
                 nodeid = nodeparent.children[-1 if self.__reverse else 0][1]
             else:
@@ -1107,6 +1224,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Find if the given node has any children.
         """
         node = self.get_node_from_iter(iter)
+        if node.ref in self.lazy_groups:
+            return True
         return True if node.children else False
 
     def do_iter_n_children(self, iter):
@@ -1117,6 +1236,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             node = self.tree[None]
         else:
             node = self.get_node_from_iter(iter)
+            if node.ref in self.lazy_groups:
+                self._load_group(node)
         return len(node.children)
 
     def do_iter_nth_child(self, iterparent, index):
@@ -1127,6 +1248,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             node = self.tree[None]
         else:
             node = self.get_node_from_iter(iterparent)
+            if node.ref in self.lazy_groups:
+                self._load_group(node)
         if node.children:
             if len(node.children) > index:
                 _index = (-index - 1) if self.__reverse else index
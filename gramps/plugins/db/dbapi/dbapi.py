@@ -31,6 +31,8 @@ Database API interface
 import logging
 import json
 import time
+from collections import defaultdict
+from contextlib import contextmanager
 
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 
@@ -40,15 +42,20 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #
 # ------------------------------------------------------------------------
 from gramps.gen.db.dbconst import (
+    ARRAYSIZE,
+    CLASS_TO_KEY_MAP,
     DBLOGNAME,
     KEY_TO_CLASS_MAP,
     KEY_TO_NAME_MAP,
+    PERSON_KEY,
     REFERENCE_KEY,
+    TAG_KEY,
     TXNADD,
     TXNDEL,
     TXNUPD,
 )
 from gramps.gen.db.generic import DbGeneric
+from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.lib import (
     Citation,
     Event,
@@ -68,6 +75,35 @@ from gramps.gen.updatecallback import UpdateCallback
 LOG = logging.getLogger(".dbapi")
 _LOG = logging.getLogger(DBLOGNAME)
 
+# Maximum number of handles bound in a single "WHERE handle IN (...)"
+# query; SQLite limits the number of host parameters to 999 by default.
+HANDLE_CHUNK_SIZE = 500
+
+REFERENCE_INSERT = (
+    "INSERT INTO reference "
+    "(obj_handle, obj_class, ref_handle, ref_class) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+# Secondary indexes on the reference table, mapped to their column.
+REFERENCE_INDEXES = {
+    "reference_ref_handle": "ref_handle",
+    "reference_obj_handle": "obj_handle",
+}
+
+# Secondary indexes that are not used for lookups while importing, mapped
+# to their definition. They are dropped while a bulk load is active.
+BULK_LOAD_INDEXES = {
+    "person_surname": "person(surname)",
+    "person_given_name": "person(given_name)",
+    "source_title": "source(title)",
+    "citation_page": "citation(page)",
+    "media_desc": "media(desc)",
+    "place_title": "place(title)",
+    "place_enclosed_by": "place(enclosed_by)",
+    "reference_ref_handle": f"reference({REFERENCE_INDEXES['reference_ref_handle']})",
+}
+
 
 # -------------------------------------------------------------------------
 #
@@ -79,9 +115,21 @@ class DBAPI(DbGeneric):
     Database backends class for DB-API 2.0 databases
     """
 
+    def __init__(self, directory=None):
+        # Handles of the objects whose references are written when the
+        # active bulk load ends, keyed by object type
+        self._bulk_references = None
+        super().__init__(directory)
+
     def _initialize(self, directory, username, password):
         raise NotImplementedError
 
+    def reopen(self):
+        # Closing the connection inherited from the parent process could
+        # roll back or write to the database, so it is kept open.
+        self.__parent_dbapi = self.dbapi
+        super().reopen()
+
     def use_json_data(self):
         """
         A DBAPI level method for testing if the
@@ -99,6 +147,14 @@ class DBAPI(DbGeneric):
         if not self.dbapi.column_exists(table_name, "json_data"):
             self.dbapi.execute("ALTER TABLE %s ADD COLUMN json_data TEXT;" % table_name)
 
+    def upgrade_table_for_sort_name(self):
+        """
+        A DBAPI level method for upgrading the person table
+        adding a sort_name column.
+        """
+        if not self.dbapi.column_exists("person", "sort_name"):
+            self.dbapi.execute("ALTER TABLE person ADD COLUMN sort_name TEXT;")
+
     def _schema_exists(self):
         """
         Check to see if the schema exists.
@@ -121,6 +177,7 @@ class DBAPI(DbGeneric):
             "handle VARCHAR(50) PRIMARY KEY NOT NULL, "
             "given_name TEXT, "
             "surname TEXT, "
+            "sort_name TEXT, "
             "json_data TEXT"
             ")"
         )
@@ -275,6 +332,7 @@ class DBAPI(DbGeneric):
         """
         if self.transaction is None:
             self.dbapi.rollback()
+            self._id_index.clear()
 
     def _collation(self, locale):
         """
@@ -356,6 +414,8 @@ class DBAPI(DbGeneric):
         Executed after a batch operation abort.
         """
         self.dbapi.rollback()
+        self._cache.clear()
+        self._id_index.clear()
         self.transaction = None
         transaction.clear()
         transaction.first = None
@@ -451,6 +511,64 @@ class DBAPI(DbGeneric):
             self.dbapi.execute("SELECT handle FROM person")
         return [row[0] for row in self.dbapi.fetchall()]
 
+    def get_field_values(self, class_name, field):
+        """
+        Return a list of (value, handle) pairs, with the value of a secondary
+        column for each object of a primary class, or None if the field is
+        not a secondary column.
+        """
+        if class_name not in CLASS_TO_KEY_MAP:
+            return None
+        cls = self._get_table_func(class_name, "class_func")
+        fields = [name for name, schema_type, max_length in cls.get_secondary_fields()]
+        if class_name == "Person":
+            fields += ["given_name", "surname", "sort_name"]
+        if field not in fields:
+            return None
+        if field == "sort_name" and not self._update_sort_names():
+            return None
+        self.dbapi.execute(f"SELECT {field}, handle FROM {class_name.lower()}")
+        return self.dbapi.fetchall()
+
+    def get_surname_counts(self):
+        """
+        Return a list of (surname, count) pairs, with the number of people
+        for each surname, or None if some people are not grouped by their
+        first surname.
+        """
+        if not self._groups_by_surname():
+            return None
+        self.dbapi.execute("SELECT surname, COUNT(*) FROM person GROUP BY surname")
+        return self.dbapi.fetchall()
+
+    def _groups_by_surname(self):
+        """
+        Return True if every person is grouped by the first surname of their
+        primary name, which is the surname column of the person table.
+
+        That is not so for a person with a group name, or whose first surname
+        is not the primary one. The generic DBAPI can't tell without loading
+        every person.
+        """
+        return False
+
+    def iter_raw_person_data_by_surname(self, surnames):
+        """
+        Return an iterator over (handle, raw data) pairs of the people that
+        have one of the surnames.
+        """
+        surnames = list(surnames)
+        for start in range(0, len(surnames), HANDLE_CHUNK_SIZE):
+            chunk = surnames[start : start + HANDLE_CHUNK_SIZE]
+            marks = ", ".join(["?"] * len(chunk))
+            self.dbapi.execute(
+                f"SELECT handle, {self.serializer.data_field} FROM person "
+                f"WHERE surname IN ({marks})",
+                chunk,
+            )
+            for handle, data in self.dbapi.fetchall():
+                yield (handle, self.serializer.string_to_data(data))
+
     def get_family_handles(self, sort_handles=False, locale=glocale):
         """
         Return a list of database handles, one handle for each Family in
@@ -666,21 +784,21 @@ class DBAPI(DbGeneric):
         old_data = None
         obj.change = int(change_time or time.time())
         table = KEY_TO_NAME_MAP[obj_key]
+        self._cache.invalidate(obj_key, obj.handle)
 
-        if self._has_handle(obj_key, obj.handle):
+        if not trans.batch or obj_key == PERSON_KEY:
+            # The old data is needed for undo and to update the person
+            # statistics, otherwise don't bother reading it.
             old_data = self._get_raw_data(obj_key, obj.handle)
-            # update the object:
-            self.dbapi.execute(
-                f"UPDATE {table} SET {self.serializer.data_field} = ? WHERE handle = ?",
-                [self.serializer.object_to_string(obj), obj.handle],
-            )
-        else:
-            # Insert the object:
-            self.dbapi.execute(
-                f"INSERT INTO {table} (handle, {self.serializer.data_field}) VALUES (?, ?)",
-                [obj.handle, self.serializer.object_to_string(obj)],
-            )
-        self._update_secondary_values(obj)
+        columns, values = self._get_secondary_values(obj)
+        self._upsert(
+            table,
+            [self.serializer.data_field] + columns,
+            [obj.handle, self.serializer.object_to_string(obj)]
+            + self._sql_cast_list(values),
+        )
+        if obj_key != TAG_KEY:
+            self._id_index.update(obj_key, obj.handle, obj.gramps_id)
         self._update_backlinks(obj, trans)
         if not trans.batch:
             if old_data:
@@ -697,94 +815,102 @@ class DBAPI(DbGeneric):
         """
         table = KEY_TO_NAME_MAP[obj_key]
         handle = data["handle"]
+        self._cache.invalidate(obj_key, handle)
+        self._upsert(
+            table,
+            [self.serializer.data_field],
+            [handle, self.serializer.data_to_string(data)],
+        )
+        if obj_key != TAG_KEY:
+            self._id_index.update(obj_key, handle, data["gramps_id"])
 
-        if self._has_handle(obj_key, handle):
-            # update the object:
-            self.dbapi.execute(
-                f"UPDATE {table} SET {self.serializer.data_field} = ? WHERE handle = ?",
-                [self.serializer.data_to_string(data), handle],
-            )
-        else:
-            # Insert the object:
-            self.dbapi.execute(
-                f"INSERT INTO {table} (handle, {self.serializer.data_field}) VALUES (?, ?)",
-                [handle, self.serializer.data_to_string(data)],
-            )
+    def _upsert(self, table, columns, values):
+        """
+        Insert a row, or update the row with the same handle, in a single
+        statement.
+
+        :param table: name of the table.
+        :type table: str
+        :param columns: names of the columns to set, besides the handle.
+        :type columns: list
+        :param values: the handle, followed by the values of the columns.
+        :type values: list
+        """
+        marks = ", ".join(["?"] * len(values))
+        sets = ", ".join(f"{column} = excluded.{column}" for column in columns)
+        self.dbapi.execute(
+            f"INSERT INTO {table} (handle, {', '.join(columns)}) VALUES ({marks}) "
+            f"ON CONFLICT(handle) DO UPDATE SET {sets}",
+            values,
+        )
 
     def _update_backlinks(self, obj, transaction):
-        if not transaction.batch:
-            # Find existing references
-            self.dbapi.execute(
-                "SELECT ref_class, ref_handle FROM reference WHERE obj_handle = ?",
-                [obj.handle],
-            )
-            existing_references = set(self.dbapi.fetchall())
-
-            # Once we have the list of rows that already have a reference
-            # we need to compare it with the list of objects that are
-            # still references from the primary object.
-            current_references = set(obj.get_referenced_handles_recursively())
-            no_longer_required_references = existing_references.difference(
-                current_references
-            )
-            new_references = current_references.difference(existing_references)
+        if self._bulk_references is not None and transaction.batch:
+            # Written when the bulk load ends
+            obj_key = CLASS_TO_KEY_MAP[obj.__class__.__name__]
+            self._bulk_references[obj_key].add(obj.handle)
+            return
 
-            # Delete the existing references
-            self.dbapi.execute(
-                "DELETE FROM reference WHERE obj_handle = ?", [obj.handle]
+        # Find existing references
+        self.dbapi.execute(
+            "SELECT ref_class, ref_handle FROM reference WHERE obj_handle = ?",
+            [obj.handle],
+        )
+        existing_references = set(self.dbapi.fetchall())
+
+        # Once we have the list of rows that already have a reference
+        # we need to compare it with the list of objects that are
+        # still references from the primary object.
+        current_references = set(obj.get_referenced_handles_recursively())
+        no_longer_required_references = existing_references.difference(
+            current_references
+        )
+        new_references = current_references.difference(existing_references)
+
+        # Only write the rows that changed
+        obj_class_name = obj.__class__.__name__
+        if no_longer_required_references:
+            self.dbapi.executemany(
+                "DELETE FROM reference "
+                "WHERE obj_handle = ? AND ref_class = ? AND ref_handle = ?",
+                [
+                    (obj.handle, ref_class_name, ref_handle)
+                    for ref_class_name, ref_handle in no_longer_required_references
+                ],
+            )
+        if new_references:
+            self.dbapi.executemany(
+                REFERENCE_INSERT,
+                [
+                    (obj.handle, obj_class_name, ref_handle, ref_class_name)
+                    for ref_class_name, ref_handle in new_references
+                ],
             )
 
-            # Now, add the current ones
-            for ref_class_name, ref_handle in current_references:
-                self.dbapi.execute(
-                    "INSERT INTO reference "
-                    "(obj_handle, obj_class, ref_handle, ref_class) "
-                    "VALUES(?, ?, ?, ?)",
-                    [obj.handle, obj.__class__.__name__, ref_handle, ref_class_name],
-                )
-
+        if not transaction.batch:
             # Add new references to the transaction
             for ref_class_name, ref_handle in new_references:
                 key = (obj.handle, ref_handle)
-                data = (obj.handle, obj.__class__.__name__, ref_handle, ref_class_name)
+                data = (obj.handle, obj_class_name, ref_handle, ref_class_name)
                 transaction.add(REFERENCE_KEY, TXNADD, key, None, data)
 
             # Add old references to the transaction
             for ref_class_name, ref_handle in no_longer_required_references:
                 key = (obj.handle, ref_handle)
-                old_data = (
-                    obj.handle,
-                    obj.__class__.__name__,
-                    ref_handle,
-                    ref_class_name,
-                )
+                old_data = (obj.handle, obj_class_name, ref_handle, ref_class_name)
                 transaction.add(REFERENCE_KEY, TXNDEL, key, old_data, None)
-        else:  # batch mode
-            current_references = set(obj.get_referenced_handles_recursively())
-
-            # Delete the existing references
-            self.dbapi.execute(
-                "DELETE FROM reference WHERE obj_handle = ?", [obj.handle]
-            )
-
-            # Now, add the current ones
-            for ref_class_name, ref_handle in current_references:
-                self.dbapi.execute(
-                    "INSERT INTO reference "
-                    "(obj_handle, obj_class, ref_handle, ref_class) "
-                    "VALUES(?, ?, ?, ?)",
-                    [obj.handle, obj.__class__.__name__, ref_handle, ref_class_name],
-                )
 
     def _do_remove(self, handle, transaction, obj_key):
         if self.readonly or not handle:
             return
+        self._cache.invalidate(obj_key, handle)
         if self._has_handle(obj_key, handle):
             data = self._get_raw_data(obj_key, handle)
             obj_class = KEY_TO_CLASS_MAP[obj_key]
             self._remove_backlinks(obj_class, handle, transaction)
             table = KEY_TO_NAME_MAP[obj_key]
             self.dbapi.execute(f"DELETE FROM {table} WHERE handle = ?", [handle])
+            self._id_index.remove(obj_key, handle)
             if not transaction.batch:
                 transaction.add(obj_key, TXNDEL, handle, data, None)
 
@@ -833,6 +959,11 @@ class DBAPI(DbGeneric):
             if (include_classes is None) or (row[0] in include_classes):
                 yield (row[0], row[1])
 
+    def find_handles_where(self, class_name, where, values):
+        table = class_name.lower()
+        self.dbapi.execute(f"SELECT handle FROM {table} WHERE {where}", values)
+        return [row[0] for row in self.dbapi.fetchall()]
+
     def find_initial_person(self):
         """
         Returns first person in the database
@@ -872,6 +1003,22 @@ class DBAPI(DbGeneric):
                     yield (row[0], self.serializer.string_to_data(row[1]))
                 rows = cursor.fetchmany()
 
+    def _iter_objects(self, class_):
+        """
+        Iterate over items in a class.
+
+        The stored strings are decoded directly into objects, without
+        building the intermediate raw data.
+        """
+        table = class_.__name__.lower()
+        with self.dbapi.cursor() as cursor:
+            cursor.execute(f"SELECT {self.serializer.data_field} FROM {table}")
+            rows = cursor.fetchmany()
+            while rows:
+                for row in rows:
+                    yield self.serializer.string_to_object(class_, row[0])
+                rows = cursor.fetchmany()
+
     def _iter_raw_place_tree_data(self):
         """
         Return an iterator over raw data in the place hierarchy.
@@ -891,9 +1038,14 @@ class DBAPI(DbGeneric):
     def reindex_reference_map(self, callback):
         """
         Reindex all primary records in the database.
+
+        The reference indexes are dropped while the table is reloaded and
+        recreated afterwards, and the rows are written in batches.
         """
         self._txn_begin()
         self.dbapi.execute("DELETE FROM reference")
+        for index in REFERENCE_INDEXES:
+            self.dbapi.execute(f"DROP INDEX IF EXISTS {index}")
         total = 0
         for tbl in (
             "people",
@@ -911,39 +1063,104 @@ class DBAPI(DbGeneric):
         UpdateCallback.__init__(self, callback)
         self.set_total(total)
         primary_table = (
-            (self.get_person_cursor, Person),
-            (self.get_family_cursor, Family),
-            (self.get_event_cursor, Event),
-            (self.get_place_cursor, Place),
-            (self.get_source_cursor, Source),
-            (self.get_citation_cursor, Citation),
-            (self.get_media_cursor, Media),
-            (self.get_repository_cursor, Repository),
-            (self.get_note_cursor, Note),
-            (self.get_tag_cursor, Tag),
+            Person,
+            Family,
+            Event,
+            Place,
+            Source,
+            Citation,
+            Media,
+            Repository,
+            Note,
+            Tag,
         )
-        # Now we use the functions and classes defined above
-        # to loop through each of the primary object tables.
-        for cursor_func, class_func in primary_table:
+        # Now we use the classes defined above to loop through each of
+        # the primary object tables.
+        for class_func in primary_table:
             logging.info("Rebuilding %s reference map", class_func.__name__)
-            with cursor_func() as cursor:
-                for _, val in cursor:
-                    obj = self.serializer.data_to_object(class_func, val)
-                    references = set(obj.get_referenced_handles_recursively())
-                    # handle addition of new references
-                    for ref_class_name, ref_handle in references:
-                        self.dbapi.execute(
-                            "INSERT INTO reference "
-                            "(obj_handle, obj_class, ref_handle, ref_class) "
-                            "VALUES (?, ?, ?, ?)",
-                            [
-                                obj.handle,
-                                obj.__class__.__name__,
-                                ref_handle,
-                                ref_class_name,
-                            ],
-                        )
-                    self.update()
+            self._insert_references(self._iter_objects(class_func), self.update)
+        for index, column in REFERENCE_INDEXES.items():
+            self.dbapi.execute(f"CREATE INDEX {index} ON reference({column})")
+        self._txn_commit()
+
+    def _insert_references(self, objects, callback=None):
+        """
+        Insert the reference rows of the given objects, in batches.
+
+        :param objects: the primary objects whose references are written.
+        :type objects: iterable
+        :param callback: function called after each object.
+        :type callback: function
+        """
+        rows = []
+        for obj in objects:
+            obj_class_name = obj.__class__.__name__
+            for ref_class_name, ref_handle in set(
+                obj.get_referenced_handles_recursively()
+            ):
+                rows.append((obj.handle, obj_class_name, ref_handle, ref_class_name))
+            if len(rows) >= ARRAYSIZE:
+                self.dbapi.executemany(REFERENCE_INSERT, rows)
+                rows = []
+            if callback:
+                callback()
+        if rows:
+            self.dbapi.executemany(REFERENCE_INSERT, rows)
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Context manager for loading many objects in batch transactions.
+
+        While it is active, the secondary indexes that are not needed for
+        lookups are dropped, and the reference rows of objects committed in
+        batch transactions are not written. Both are rebuilt in bulk when
+        the context manager exits. It should be entered outside of any
+        transaction.
+        """
+        if self._bulk_references is not None:
+            yield self
+            return
+        self._bulk_load_begin()
+        try:
+            yield self
+        finally:
+            self._bulk_load_end()
+
+    def _bulk_load_begin(self):
+        """
+        Start a bulk load.
+        """
+        _LOG.debug("    DBAPI %s bulk load begin", hex(id(self)))
+        self._txn_begin()
+        for index in BULK_LOAD_INDEXES:
+            self.dbapi.execute(f"DROP INDEX IF EXISTS {index}")
+        self._txn_commit()
+        self._bulk_references = defaultdict(set)
+
+    def _bulk_load_end(self):
+        """
+        End a bulk load, writing the deferred references and recreating
+        the dropped indexes.
+        """
+        _LOG.debug("    DBAPI %s bulk load end", hex(id(self)))
+        bulk_references, self._bulk_references = self._bulk_references, None
+        self._txn_begin()
+        for obj_key, handles in bulk_references.items():
+            handles = list(handles)
+            obj_class = self._get_table_func(KEY_TO_CLASS_MAP[obj_key], "class_func")
+            self.dbapi.executemany(
+                "DELETE FROM reference WHERE obj_handle = ?",
+                [(handle,) for handle in handles],
+            )
+            self._insert_references(
+                obj
+                for _, obj in self._iter_objects_from_handles(
+                    obj_key, obj_class, handles
+                )
+            )
+        for index, definition in BULK_LOAD_INDEXES.items():
+            self.dbapi.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {definition}")
         self._txn_commit()
 
     def rebuild_secondary(self, callback=None):
@@ -988,7 +1205,11 @@ class DBAPI(DbGeneric):
                 obj = self.method("get_%s_from_handle", obj_type)(handle)
                 self._update_secondary_values(obj)
                 self.update()
+        self._set_metadata(
+            "sort-name-format", name_displayer.get_sort_format_key(), use_txn=False
+        )
         self._txn_commit()
+        self._id_index.clear()
 
         # Next, rebuild stats:
         gstats = self.get_gender_stats()
@@ -1000,15 +1221,18 @@ class DBAPI(DbGeneric):
         return self.dbapi.fetchone() is not None
 
     def _has_gramps_id(self, obj_key, gramps_id):
-        table = KEY_TO_NAME_MAP[obj_key]
-        self.dbapi.execute(f"SELECT 1 FROM {table} WHERE gramps_id = ?", [gramps_id])
-        return self.dbapi.fetchone() is not None
+        return self._id_index.has_gramps_id(obj_key, gramps_id)
 
     def _get_gramps_ids(self, obj_key):
         table = KEY_TO_NAME_MAP[obj_key]
         self.dbapi.execute(f"SELECT gramps_id FROM {table}")
         return [row[0] for row in self.dbapi.fetchall()]
 
+    def _iter_gramps_ids(self, obj_key):
+        table = KEY_TO_NAME_MAP[obj_key]
+        self.dbapi.execute(f"SELECT handle, gramps_id FROM {table}")
+        return self.dbapi.fetchall()
+
     def _get_raw_data(self, obj_key, handle):
         table = KEY_TO_NAME_MAP[obj_key]
         self.dbapi.execute(
@@ -1020,17 +1244,47 @@ class DBAPI(DbGeneric):
             return self.serializer.string_to_data(row[0])
         return None
 
-    def _get_raw_from_id_data(self, obj_key, gramps_id):
+    def _get_object(self, obj_key, obj_class, handle):
         table = KEY_TO_NAME_MAP[obj_key]
         self.dbapi.execute(
-            f"SELECT {self.serializer.data_field} FROM {table} WHERE gramps_id = ?",
-            [gramps_id],
+            f"SELECT {self.serializer.data_field} FROM {table} WHERE handle = ?",
+            [handle],
         )
         row = self.dbapi.fetchone()
         if row:
-            return self.serializer.string_to_data(row[0])
+            return self.serializer.string_to_object(obj_class, row[0])
         return None
 
+    def _iter_rows_from_handles(self, obj_key, handles):
+        """
+        Iterate over (handle, data_field) rows for the given handles,
+        querying them in chunks.
+        """
+        table = KEY_TO_NAME_MAP[obj_key]
+        for start in range(0, len(handles), HANDLE_CHUNK_SIZE):
+            chunk = handles[start : start + HANDLE_CHUNK_SIZE]
+            marks = ", ".join(["?"] * len(chunk))
+            self.dbapi.execute(
+                f"SELECT handle, {self.serializer.data_field} FROM {table} "
+                f"WHERE handle IN ({marks})",
+                chunk,
+            )
+            yield from self.dbapi.fetchall()
+
+    def _iter_raw_data_from_handles(self, obj_key, handles):
+        for handle, data in self._iter_rows_from_handles(obj_key, list(handles)):
+            yield (handle, self.serializer.string_to_data(data))
+
+    def _iter_objects_from_handles(self, obj_key, obj_class, handles):
+        for handle, data in self._iter_rows_from_handles(obj_key, list(handles)):
+            yield (handle, self.serializer.string_to_object(obj_class, data))
+
+    def _get_raw_from_id_data(self, obj_key, gramps_id):
+        handle = self._id_index.get_handle(obj_key, gramps_id)
+        if handle is None:
+            return None
+        return self._get_raw_data_copy(obj_key, handle)
+
     def get_gender_stats(self):
         """
         Returns a dictionary of
@@ -1080,6 +1334,7 @@ class DBAPI(DbGeneric):
         table = cls.lower()
         if data is None:
             self.dbapi.execute(f"DELETE FROM {table} WHERE handle = ?", [handle])
+            self._id_index.remove(obj_key, handle)
         else:
             if self._has_handle(obj_key, handle):
                 self.dbapi.execute(
@@ -1093,6 +1348,8 @@ class DBAPI(DbGeneric):
                 )
             obj = from_dict(data)
             self._update_secondary_values(obj)
+            if obj_key != TAG_KEY:
+                self._id_index.update(obj_key, handle, obj.gramps_id)
 
     def get_surname_list(self):
         """
@@ -1144,34 +1401,71 @@ class DBAPI(DbGeneric):
                         f"ALTER TABLE {table_name} ADD COLUMN {field} {sql_type}"
                     )
 
-    def _update_secondary_values(self, obj):
+    def _get_secondary_values(self, obj):
         """
-        Given a primary object update its secondary field values
-        in the database.
-        Does not commit.
+        Given a primary object return the lists of its secondary column
+        names and values.
         """
         table = obj.__class__.__name__
-        fields = [field[0] for field in obj.get_secondary_fields()]
-        sets = []
-        values = []
-        for field in fields:
-            sets.append(f"{field} = ?")
-            values.append(getattr(obj, field))
+        columns = [
+            field[0] for field in obj.get_secondary_fields() if field[0] != "handle"
+        ]
+        values = [getattr(obj, field) for field in columns]
 
         # Derived fields
         if table == "Person":
-            given_name, surname = self._get_person_data(obj)
-            sets.append("given_name = ?")
-            values.append(given_name)
-            sets.append("surname = ?")
-            values.append(surname)
+            given_name, surname, sort_name = self._get_person_data(obj)
+            columns += ["given_name", "surname", "sort_name"]
+            values += [given_name, surname, sort_name]
+            self._check_sort_name_format()
         if table == "Place":
             handle = self._get_place_data(obj)
-            sets.append("enclosed_by = ?")
+            columns.append("enclosed_by")
             values.append(handle)
+        return columns, values
+
+    def _check_sort_name_format(self):
+        """
+        The stored sorted names of the people are only valid in the name
+        format that is recorded for them. When a person is written in another
+        format, the record is cleared, so that the names are updated before
+        they are read again.
+        """
+        key = self._get_metadata("sort-name-format", "")
+        if key and key != name_displayer.get_sort_format_key():
+            self._set_metadata("sort-name-format", "", use_txn=False)
 
+    def _update_sort_names(self):
+        """
+        Update the stored sorted names of the people if they are not in the
+        current name format. Return False if they are not, and the database
+        can't be written.
+        """
+        key = name_displayer.get_sort_format_key()
+        if self._get_metadata("sort-name-format", "") == key:
+            return True
+        if self.readonly:
+            return False
+        rows = [
+            [name_displayer.raw_sorted_name(data["primary_name"]), handle]
+            for handle, data in self._iter_raw_data(PERSON_KEY)
+        ]
+        self._txn_begin()
+        self.dbapi.executemany("UPDATE person SET sort_name = ? WHERE handle = ?", rows)
+        self._set_metadata("sort-name-format", key, use_txn=False)
+        self._txn_commit()
+        return True
+
+    def _update_secondary_values(self, obj):
+        """
+        Given a primary object update its secondary field values
+        in the database.
+        Does not commit.
+        """
+        columns, values = self._get_secondary_values(obj)
         if len(values) > 0:
-            table_name = table.lower()
+            sets = [f"{column} = ?" for column in columns]
+            table_name = obj.__class__.__name__.lower()
             self.dbapi.execute(
                 f'UPDATE {table_name} SET {", ".join(sets)} where handle = ?',
                 self._sql_cast_list(values) + [obj.handle],
@@ -32,6 +32,7 @@ import logging
 import os
 import re
 import sqlite3
+from pathlib import Path
 
 # -------------------------------------------------------------------------
 #
@@ -46,6 +47,15 @@ _ = glocale.translation.gettext
 
 sqlite3.paramstyle = "qmark"
 
+# Pragmas used while a bulk load is active. The data written during a bulk
+# load is not journalled, so a crash can corrupt the database.
+BULK_LOAD_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -262144,
+    "temp_store": "MEMORY",
+}
+
 
 # -------------------------------------------------------------------------
 #
@@ -75,7 +85,52 @@ class SQLite(DBAPI):
             path_to_db = ":memory:"
         else:
             path_to_db = os.path.join(directory, "sqlite.db")
-        self.dbapi = Connection(path_to_db)
+        if self.readonly and path_to_db != ":memory:":
+            uri = Path(path_to_db).absolute().as_uri() + "?mode=ro"
+            self.dbapi = Connection(uri, uri=True)
+        else:
+            self.dbapi = Connection(path_to_db)
+
+    def find_handles_where(self, class_name, where, values):
+        """
+        Return the handles of the objects that match an SQL WHERE clause.
+
+        The query can use an index, so the rows are ordered by their rowid,
+        in which the cursor of the objects scans the table.
+        """
+        table = class_name.lower()
+        self.dbapi.execute(
+            f"SELECT handle FROM {table} WHERE {where} ORDER BY rowid", values
+        )
+        return [row[0] for row in self.dbapi.fetchall()]
+
+    def _groups_by_surname(self):
+        """
+        See DBAPI. The JSON data of the people is searched for a group name,
+        or a first surname that is not the primary one.
+        """
+        if self.serializer.data_field != "json_data":
+            return False
+        self.dbapi.execute(
+            "SELECT 1 FROM person "
+            "WHERE json_extract(json_data, '$.primary_name.group_as') != '' "
+            "OR json_extract(json_data, '$.primary_name.surname_list[0].primary') "
+            "= 0 LIMIT 1"
+        )
+        return self.dbapi.fetchone() is None
+
+    def _bulk_load_begin(self):
+        self.__pragmas = {}
+        for pragma, value in BULK_LOAD_PRAGMAS.items():
+            self.dbapi.execute(f"PRAGMA {pragma}")
+            self.__pragmas[pragma] = self.dbapi.fetchone()[0]
+            self.dbapi.execute(f"PRAGMA {pragma} = {value}")
+        super()._bulk_load_begin()
+
+    def _bulk_load_end(self):
+        super()._bulk_load_end()
+        for pragma, value in self.__pragmas.items():
+            self.dbapi.execute(f"PRAGMA {pragma} = {value}")
 
 
 # -------------------------------------------------------------------------
@@ -138,6 +193,18 @@ class Connection:
         self.log.debug(args)
         self.__cursor.execute(*args, **kwargs)
 
+    def executemany(self, sql, seq_of_parameters):
+        """
+        Executes an SQL statement once for each set of parameters.
+
+        :param sql: the SQL statement to execute.
+        :type sql: str
+        :param seq_of_parameters: the parameters for each execution.
+        :type seq_of_parameters: iterable
+        """
+        self.log.debug(sql)
+        self.__cursor.executemany(sql, seq_of_parameters)
+
     def fetchone(self):
         """
         Fetches the next row of a query result set, returning a single sequence,
@@ -24,15 +24,19 @@
 #
 # -------------------------------------------------------------------------
 import unittest
+from unittest import mock
 
 # -------------------------------------------------------------------------
 #
 # Gramps modules
 #
 # -------------------------------------------------------------------------
-from gramps.gen.db import DbTxn
+from gramps.gen.db import DbTxn, generic
 from gramps.gen.db.utils import make_database
+from gramps.gen.display.name import displayer as name_displayer
+from gramps.gen.errors import HandleError
 from gramps.gen.lib import (
+    Name,
     Person,
     Family,
     Event,
@@ -354,6 +358,33 @@ class DbRandomTest(unittest.TestCase):
             "Note", self.db.get_note_gramps_ids, self.db.get_number_of_notes
         )
 
+    ################################################################
+    #
+    # Test get_field_values method
+    #
+    ################################################################
+
+    def test_get_field_values(self):
+        for obj_type in ("Person", "Event", "Citation"):
+            values = self.db.get_field_values(obj_type, "gramps_id")
+            self.assertEqual(
+                sorted(values), sorted(zip(self.gids[obj_type], self.handles[obj_type]))
+            )
+
+    def test_get_surname_counts(self):
+        self.assertEqual(
+            self.db.get_surname_counts(), [("", len(self.handles["Person"]))]
+        )
+        handles = [
+            handle for handle, data in self.db.iter_raw_person_data_by_surname([""])
+        ]
+        self.assertEqual(sorted(handles), sorted(self.handles["Person"]))
+        self.assertEqual(list(self.db.iter_raw_person_data_by_surname(["X"])), [])
+
+    def test_get_field_values_unknown(self):
+        self.assertIsNone(self.db.get_field_values("Person", "nickname"))
+        self.assertIsNone(self.db.get_field_values("Researcher", "name"))
+
     ################################################################
     #
     # Test get_*_from_handle methods
@@ -418,6 +449,44 @@ class DbRandomTest(unittest.TestCase):
             Tag, self.db.get_tag_handles, self.db.get_tag_from_handle
         )
 
+    ################################################################
+    #
+    # Test get_*_from_handles methods
+    #
+    ################################################################
+
+    def __get_from_handles_test(self, obj_class, handles_func, get_func):
+        handles = list(reversed(handles_func()))
+        objects = get_func(handles + ["nonexistent", None] + handles[:1])
+        self.assertEqual([obj.handle for obj in objects], handles)
+        for obj in objects:
+            self.assertIsInstance(obj, obj_class)
+
+    def test_get_people_from_handles(self):
+        self.__get_from_handles_test(
+            Person, self.db.get_person_handles, self.db.get_people_from_handles
+        )
+
+    def test_get_families_from_handles(self):
+        self.__get_from_handles_test(
+            Family, self.db.get_family_handles, self.db.get_families_from_handles
+        )
+
+    def test_get_events_from_handles(self):
+        self.__get_from_handles_test(
+            Event, self.db.get_event_handles, self.db.get_events_from_handles
+        )
+
+    def test_get_notes_from_handles(self):
+        self.__get_from_handles_test(
+            Note, self.db.get_note_handles, self.db.get_notes_from_handles
+        )
+
+    def test_get_tags_from_handles(self):
+        self.__get_from_handles_test(
+            Tag, self.db.get_tag_handles, self.db.get_tags_from_handles
+        )
+
     ################################################################
     #
     # Test get_*_from_gramps_id methods
@@ -883,6 +952,63 @@ class DbPersonTest(unittest.TestCase):
         for surname in surname_list:
             self.assertIn(surname, self.all_surnames)
 
+    def test_surname_counts(self):
+        counts = self.db.get_surname_counts()
+        self.assertEqual(
+            sorted(counts), [(surname, 2) for surname in sorted(set(self.all_surnames))]
+        )
+
+    def test_sort_names(self):
+        values = self.db.get_field_values("Person", "sort_name")
+        self.assertEqual(len(values), len(self.all_surnames))
+        for value, handle in values:
+            person = self.db.get_person_from_handle(handle)
+            self.assertEqual(value, name_displayer.sorted(person))
+
+    def test_sort_names_format(self):
+        self.db.get_field_values("Person", "sort_name")
+        default = name_displayer.get_default_format()
+        name_displayer.set_default_format(Name.FNLN)
+        try:
+            values = sorted(self.db.get_field_values("Person", "sort_name"))
+        finally:
+            name_displayer.set_default_format(default)
+        self.assertEqual(values[0][0], "John Allen")
+
+    def test_sort_names_commit(self):
+        values = sorted(self.db.get_field_values("Person", "sort_name"))
+        self.assertEqual(values[0][0], "Allen, John")
+        person = self.db.get_person_from_handle(values[0][1])
+        default = name_displayer.get_default_format()
+        name_displayer.set_default_format(Name.FNLN)
+        try:
+            with DbTxn("Edit person", self.db) as trans:
+                self.db.commit_person(person, trans)
+        finally:
+            name_displayer.set_default_format(default)
+        self.assertEqual(
+            sorted(self.db.get_field_values("Person", "sort_name")), values
+        )
+
+    def test_surname_counts_group_as(self):
+        handle = self.db.get_person_handles()[0]
+        person = self.db.get_person_from_handle(handle)
+        person.primary_name.set_group_as("Zane")
+        with DbTxn("Group person", self.db) as trans:
+            self.db.commit_person(person, trans)
+        self.assertIsNone(self.db.get_surname_counts())
+
+    def test_surname_counts_primary(self):
+        handle = self.db.get_person_handles()[0]
+        person = self.db.get_person_from_handle(handle)
+        person.primary_name.get_primary_surname().set_primary(False)
+        surname = Surname()
+        surname.set_surname("Zane")
+        person.primary_name.add_surname(surname)
+        with DbTxn("Add surname", self.db) as trans:
+            self.db.commit_person(person, trans)
+        self.assertIsNone(self.db.get_surname_counts())
+
     ################################################################
     #
     # Test gender stats
@@ -899,5 +1025,336 @@ class DbPersonTest(unittest.TestCase):
         self.assertEqual(saved["Mary"], (1, 3, 1))
 
 
+# -------------------------------------------------------------------------
+#
+# DbCacheTest class
+#
+# -------------------------------------------------------------------------
+class DbCacheTest(unittest.TestCase):
+    """
+    Tests for the object cache.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.db.set_cache_size(10)
+        with DbTxn("Add test person", self.db) as trans:
+            person = Person()
+            person.primary_name.first_name = "John"
+            self.handle = self.db.add_person(person, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def __stats(self):
+        return self.db.get_cache_statistics()["person"]
+
+    def test_hits(self):
+        self.db.get_person_from_handle(self.handle)
+        self.db.get_person_from_handle(self.handle)
+        self.db.get_raw_person_data(self.handle)
+        stats = self.__stats()
+        self.assertEqual(
+            (stats["size"], stats["entries"], stats["hits"], stats["misses"]),
+            (10, 1, 2, 1),
+        )
+
+    def test_memory(self):
+        with DbTxn("Add test person", self.db) as trans:
+            handle = self.db.add_person(Person(), trans)
+        self.db.set_cache_size(10, memory=1)
+        self.db.get_person_from_handle(self.handle)
+        self.db.get_person_from_handle(handle)
+        stats = self.__stats()
+        self.assertEqual((stats["entries"], stats["evictions"]), (1, 1))
+        self.assertGreater(stats["memory"], 0)
+
+    def test_objects_are_not_shared(self):
+        person1 = self.db.get_person_from_handle(self.handle)
+        person1.primary_name.first_name = "Fred"
+        person2 = self.db.get_person_from_handle(self.handle)
+        self.assertEqual(person2.primary_name.first_name, "John")
+        data = self.db.get_raw_person_data(self.handle)
+        self.assertEqual(data.primary_name.first_name, "John")
+        data["gramps_id"] = "X"
+        data["primary_name"]["first_name"] = "Fred"
+        person3 = self.db.get_person_from_handle(self.handle)
+        self.assertNotEqual(person3.gramps_id, "X")
+        self.assertEqual(person3.primary_name.first_name, "John")
+        data = self.db.get_raw_person_data(self.handle)
+        self.assertEqual(data["primary_name"]["first_name"], "John")
+
+    def test_commit(self):
+        person = self.db.get_person_from_handle(self.handle)
+        person.primary_name.first_name = "Fred"
+        with DbTxn("Edit test person", self.db) as trans:
+            self.db.commit_person(person, trans)
+        person = self.db.get_person_from_handle(self.handle)
+        self.assertEqual(person.primary_name.first_name, "Fred")
+
+    def test_remove(self):
+        self.db.get_person_from_handle(self.handle)
+        with DbTxn("Remove test person", self.db) as trans:
+            self.db.remove_person(self.handle, trans)
+        self.assertIsNone(self.db.get_raw_person_data(self.handle))
+        with self.assertRaises(HandleError):
+            self.db.get_person_from_handle(self.handle)
+
+    def test_undo_redo(self):
+        person = self.db.get_person_from_handle(self.handle)
+        person.primary_name.first_name = "Fred"
+        with DbTxn("Edit test person", self.db) as trans:
+            self.db.commit_person(person, trans)
+        self.db.get_person_from_handle(self.handle)
+        self.db.undo()
+        person = self.db.get_person_from_handle(self.handle)
+        self.assertEqual(person.primary_name.first_name, "John")
+        self.db.redo()
+        person = self.db.get_person_from_handle(self.handle)
+        self.assertEqual(person.primary_name.first_name, "Fred")
+
+    def test_bulk_fetch(self):
+        self.db.get_person_from_handle(self.handle)
+        people = self.db.get_people_from_handles([self.handle, "nonexistent"])
+        self.assertEqual([person.handle for person in people], [self.handle])
+        stats = self.__stats()
+        self.assertEqual((stats["entries"], stats["hits"], stats["misses"]), (1, 1, 2))
+
+    def test_disabled(self):
+        self.db.set_cache_size(0)
+        self.db.get_person_from_handle(self.handle)
+        self.assertEqual(self.db.get_cache_statistics(), {})
+
+
+class DbReferenceTest(unittest.TestCase):
+    """
+    Tests for the reference table maintenance.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn("Add test objects", self.db) as trans:
+            self.tag1 = self.db.add_tag(Tag(), trans)
+            self.tag2 = self.db.add_tag(Tag(), trans)
+            person = Person()
+            person.add_tag(self.tag1)
+            self.handle = self.db.add_person(person, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def __backlinks(self, handle):
+        return list(self.db.find_backlink_handles(handle))
+
+    def test_update(self):
+        person = self.db.get_person_from_handle(self.handle)
+        person.set_tag_list([self.tag2])
+        with DbTxn("Edit test person", self.db) as trans:
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.__backlinks(self.tag1), [])
+        self.assertEqual(self.__backlinks(self.tag2), [("Person", self.handle)])
+        self.db.undo()
+        self.assertEqual(self.__backlinks(self.tag1), [("Person", self.handle)])
+        self.assertEqual(self.__backlinks(self.tag2), [])
+
+    def test_reindex(self):
+        self.db.reindex_reference_map(None)
+        self.assertEqual(self.__backlinks(self.tag1), [("Person", self.handle)])
+        self.assertEqual(self.__backlinks(self.tag2), [])
+
+
+class DbCommitTest(unittest.TestCase):
+    """
+    Tests for committing objects.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        with DbTxn("Add test person", self.db) as trans:
+            person = Person()
+            person.set_gramps_id("I0001")
+            self.handle = self.db.add_person(person, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def __commit(self, gramps_id, batch):
+        person = self.db.get_person_from_handle(self.handle)
+        person.set_gramps_id(gramps_id)
+        with DbTxn("Edit test person", self.db, batch=batch) as trans:
+            self.db.commit_person(person, trans)
+
+    def test_update(self):
+        self.__commit("I0002", False)
+        self.assertFalse(self.db.has_person_gramps_id("I0001"))
+        person = self.db.get_person_from_gramps_id("I0002")
+        self.assertEqual(person.handle, self.handle)
+        self.assertEqual(self.db.get_number_of_people(), 1)
+        self.db.undo()
+        self.assertTrue(self.db.has_person_gramps_id("I0001"))
+
+    def test_batch_update(self):
+        self.__commit("I0002", True)
+        person = self.db.get_person_from_gramps_id("I0002")
+        self.assertEqual(person.handle, self.handle)
+        self.assertEqual(self.db.get_number_of_people(), 1)
+
+
+class DbGrampsIdTest(unittest.TestCase):
+    """
+    Tests for the Gramps ID index.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.db.set_person_id_prefix("I%04d")
+        with DbTxn("Add test people", self.db) as trans:
+            self.handles = []
+            for gramps_id in ("I0000", "I0001", "I0003"):
+                person = Person()
+                person.set_gramps_id(gramps_id)
+                self.handles.append(self.db.add_person(person, trans))
+
+    def tearDown(self):
+        self.db.close()
+
+    def __ids(self):
+        return {
+            gramps_id
+            for gramps_id in ("I0000", "I0001", "I0002", "I0003")
+            if self.db.has_person_gramps_id(gramps_id)
+        }
+
+    def test_find_next(self):
+        self.assertEqual(self.db.find_next_person_gramps_id(), "I0002")
+        self.assertEqual(self.db.find_next_person_gramps_id(), "I0004")
+
+    def test_remove(self):
+        self.assertEqual(self.__ids(), {"I0000", "I0001", "I0003"})
+        with DbTxn("Remove test person", self.db) as trans:
+            self.db.remove_person(self.handles[1], trans)
+        self.assertEqual(self.__ids(), {"I0000", "I0003"})
+        self.assertIsNone(self.db.get_person_from_gramps_id("I0001"))
+        self.db.undo()
+        self.assertEqual(self.__ids(), {"I0000", "I0001", "I0003"})
+        person = self.db.get_person_from_gramps_id("I0001")
+        self.assertEqual(person.handle, self.handles[1])
+
+    def test_abort(self):
+        self.assertEqual(self.__ids(), {"I0000", "I0001", "I0003"})
+        with self.assertRaises(ValueError):
+            with DbTxn("Add test person", self.db) as trans:
+                person = Person()
+                person.set_gramps_id("I0002")
+                self.db.add_person(person, trans)
+                self.assertTrue(self.db.has_person_gramps_id("I0002"))
+                raise ValueError
+        self.assertEqual(self.__ids(), {"I0000", "I0001", "I0003"})
+
+    def test_duplicate(self):
+        self.assertEqual(self.__ids(), {"I0000", "I0001", "I0003"})
+        person = self.db.get_person_from_handle(self.handles[0])
+        person.set_gramps_id("I0001")
+        with DbTxn("Edit test person", self.db) as trans:
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.__ids(), {"I0001", "I0003"})
+        with DbTxn("Remove test person", self.db) as trans:
+            self.db.remove_person(self.handles[1], trans)
+        person = self.db.get_person_from_gramps_id("I0001")
+        self.assertEqual(person.handle, self.handles[0])
+
+
+class DbUndoJournalTest(unittest.TestCase):
+    """
+    Tests for the journal of the undo/redo handler.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+
+    def tearDown(self):
+        self.db.close()
+
+    def __names(self):
+        return [person.primary_name.first_name for person in self.db.iter_people()]
+
+    def test_journal(self):
+        undodb = self.db.get_undodb()
+        for index in range(10):
+            self.assertEqual(undodb.append(b"entry %d" % index), index)
+        undodb[2] = b"changed"
+        self.assertEqual(len(undodb), 10)
+        self.assertEqual(undodb[2], b"changed")
+        self.assertEqual(undodb[-1], b"entry 9")
+        with self.assertRaises(IndexError):
+            undodb[10]
+
+    @mock.patch.object(generic, "UNDO_WINDOW", 2)
+    def test_undo_redo(self):
+        names = ["John", "Fred", "Jim", "Bill", "Tom"]
+        with DbTxn("Add test person", self.db) as trans:
+            person = Person()
+            person.primary_name.first_name = names[0]
+            handle = self.db.add_person(person, trans)
+        for name in names[1:]:
+            person = self.db.get_person_from_handle(handle)
+            person.primary_name.first_name = name
+            with DbTxn("Edit test person", self.db) as trans:
+                self.db.commit_person(person, trans)
+        # Most of the entries are only in the journal
+        journal = self.db.get_undodb().undodb
+        (count,) = journal.execute("SELECT count(*) FROM undo").fetchone()
+        self.assertGreater(count, 2)
+        for name in reversed(names[:-1]):
+            self.db.undo()
+            self.assertEqual(self.__names(), [name])
+        self.db.undo()
+        self.assertEqual(self.__names(), [])
+        for name in names:
+            self.db.redo()
+            self.assertEqual(self.__names(), [name])
+
+
+class DbBulkLoadTest(unittest.TestCase):
+    """
+    Tests for the bulk load mode.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+
+    def tearDown(self):
+        self.db.close()
+
+    def __indexes(self):
+        self.db.dbapi.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        return {row[0] for row in self.db.dbapi.fetchall()}
+
+    def test_bulk_load(self):
+        indexes = self.__indexes()
+        with self.db.bulk_load():
+            self.assertLess(self.__indexes(), indexes)
+            with DbTxn("Import", self.db, batch=True) as trans:
+                tag = self.db.add_tag(Tag(), trans)
+                person = Person()
+                person.primary_name.get_primary_surname().set_surname("Smith")
+                person.add_tag(tag)
+                handle = self.db.add_person(person, trans)
+                person = self.db.get_person_from_handle(handle)
+                person.primary_name.first_name = "John"
+                self.db.commit_person(person, trans)
+        self.assertEqual(self.__indexes(), indexes)
+        self.assertEqual(list(self.db.find_backlink_handles(tag)), [("Person", handle)])
+        self.assertEqual(self.db.get_surname_list(), ["Smith"])
+        self.db.dbapi.execute("PRAGMA synchronous")
+        self.assertEqual(self.db.dbapi.fetchone()[0], 2)
+
+
 if __name__ == "__main__":
     unittest.main()
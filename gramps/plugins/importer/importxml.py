@@ -63,6 +63,7 @@ from gramps.gen.lib import (
     EventRoleType,
     EventType,
     Family,
+    FamilyRelType,
     LdsOrd,
     Location,
     Media,
@@ -80,6 +81,7 @@ from gramps.gen.lib import (
     PlaceType,
     RepoRef,
     Repository,
+    RepositoryType,
     Researcher,
     Source,
     SrcAttribute,
@@ -1050,7 +1052,9 @@ class GrampsParser(UpdateCallback):
         :param ifile: must be a file handle that is already open, with position
                       at the start of the file
         """
-        with DbTxn(_("Gramps XML import"), self.db, batch=True) as self.trans:
+        with self.db.bulk_load(), DbTxn(
+            _("Gramps XML import"), self.db, batch=True
+        ) as self.trans:
             self.set_total(linecount)
 
             self.db.disable_signals()
@@ -1285,6 +1289,7 @@ class GrampsParser(UpdateCallback):
             place_name.set_value(attrs.get("name", ""))
             self.placeobj.name = place_name
         if "type" in attrs:
+            self.placeobj.place_type = PlaceType()
             self.placeobj.place_type.set_from_xml_str(attrs.get("type"))
         self.info.add("new-object", PLACE_KEY, self.placeobj)
         self.place_names = 0
@@ -1790,6 +1795,7 @@ class GrampsParser(UpdateCallback):
         # Gramps LEGACY: the type now belongs to <rel> tag
         # Here we need to support old format of <family type="Married">
         if "type" in attrs:
+            self.family.type = FamilyRelType()
             self.family.type.set_from_xml_str(attrs["type"])
         self.convert_marker(attrs, self.family)
         if self.default_tag:
@@ -1798,6 +1804,7 @@ class GrampsParser(UpdateCallback):
 
     def start_rel(self, attrs):
         if "type" in attrs:
+            self.family.type = FamilyRelType()
             self.family.type.set_from_xml_str(attrs["type"])
 
     def start_file(self, attrs):
@@ -2076,6 +2083,7 @@ class GrampsParser(UpdateCallback):
             self.note.change = int(attrs.get("change", self.change))
             self.info.add("new-object", NOTE_KEY, self.note)
             self.note.format = int(attrs.get("format", Note.FLOWED))
+            self.note.type = NoteType()
             self.note.type.set_from_xml_str(attrs.get("type", NoteType.UNKNOWN))
             self.convert_marker(attrs, self.note)
 
@@ -2739,7 +2747,7 @@ class GrampsParser(UpdateCallback):
         # but you may re-order them if needed.
         LOG.warning(
             _("Invalid date {date} in XML {xml}, preserving XML as text").format(
-                date=date_error.date.__dict__, xml=xml
+                date=date_error.date.get_object_state(), xml=xml
             )
         )
         date_value.set(modifier=Date.MOD_TEXTONLY, text=xml)
@@ -2765,7 +2773,8 @@ class GrampsParser(UpdateCallback):
         date_value.set_as_text(attrs["val"])
 
     def start_pos(self, attrs):
-        self.person.position = (int(attrs["x"]), int(attrs["y"]))
+        # The position of the person in the old graph views is not kept
+        pass
 
     def stop_attribute(self, *tag):
         self.attribute = None
@@ -2848,9 +2857,11 @@ class GrampsParser(UpdateCallback):
     def stop_type(self, tag):
         if self.event:
             # Event type
+            self.event.type = EventType()
             self.event.type.set_from_xml_str(tag)
         elif self.repo:
             # Repository type
+            self.repo.type = RepositoryType()
             self.repo.type.set_from_xml_str(tag)
 
     def stop_childref(self, tag):
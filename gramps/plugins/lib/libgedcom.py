@@ -94,10 +94,10 @@ import re
 import time
 
 # from xml.parsers.expat import ParserCreate
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, deque, OrderedDict
 import string
 import mimetypes
-from io import StringIO, TextIOWrapper
+from io import TextIOWrapper
 from urllib.parse import urlparse
 
 # ------------------------------------------------------------------------
@@ -556,6 +556,8 @@ RESIDENCE_ADDR = 0
 RESIDENCE_PLAC = 1
 SOURCE_REFS_NO = 0
 SOURCE_REFS_YES = 1
+# Number of parsed date texts kept while reading a file
+DATE_CACHE_SIZE = 50000
 
 TYPE_BIRTH = ChildRefType()
 TYPE_ADOPT = ChildRefType(ChildRefType.ADOPTED)
@@ -933,7 +935,8 @@ class Lexer:
 
     def __init__(self, ifile, __add_msg):
         self.ifile = ifile
-        self.current_list = []
+        # lines read ahead, the newest first
+        self.current_list = deque()
         self.eof = False
         self.cnv = None
         self.cnt = 0
@@ -943,13 +946,15 @@ class Lexer:
             TOKEN_CONC: self.__fix_token_conc,
         }
         self.__add_msg = __add_msg
+        # The dates parsed from the date texts of the file, by text
+        self.dates: dict[str, Date] = {}
 
     def readline(self):
         """read a line from file with possibility of putting it back"""
         if len(self.current_list) <= 1 and not self.eof:
             self.__readahead()
         try:
-            return GedLine(self.current_list.pop())
+            return GedLine(self.current_list.pop(), self.dates)
         except:
             LOG.debug("Error in reading Gedcom line", exc_info=True)
             return None
@@ -1040,7 +1045,7 @@ class Lexer:
                 # line, however some programs put them there (FTM), so let's
                 # leave them in place.
                 data = data[:2] + (data[2].lstrip(),) + data[3:]
-                self.current_list.insert(0, data)
+                self.current_list.appendleft(data)
 
     def clean_up(self):
         """
@@ -1050,6 +1055,7 @@ class Lexer:
         for key in list(self.func_map.keys()):
             del self.func_map[key]
         del self.func_map
+        self.dates.clear()
 
 
 # -----------------------------------------------------------------------
@@ -1199,7 +1205,7 @@ class GedLine:
         dateobj.set_quality(qual)
         return dateobj
 
-    def __init__(self, data):
+    def __init__(self, data, dates):
         """
         If the level is 0, then this is a top level instance. In this case,
         we may find items in the form of:
@@ -1208,7 +1214,10 @@ class GedLine:
 
         If this is not the top level, we check the MAP_DATA array to see if
         there is a conversion function for the data.
+
+        dates is the dictionary of the dates parsed by the Lexer so far.
         """
+        self.dates = dates
         self.line = data[4]
         self.level = data[0]
         self.token = data[1]
@@ -1242,7 +1251,14 @@ class GedLine:
         """
         Converts the data field to a Date object
         """
-        self.data = self.__extract_date(self.data)
+        # The same date texts recur throughout a file, so the Lexer keeps
+        # the parsed dates, and each line gets its own copy.
+        dateobj = self.dates.get(self.data)
+        if dateobj is None:
+            if len(self.dates) >= DATE_CACHE_SIZE:
+                self.dates.clear()
+            dateobj = self.dates[self.data] = self.__extract_date(self.data)
+        self.data = Date(dateobj)
         self.token = TOKEN_DATE
 
     def calc_unknown(self):
@@ -1431,9 +1447,10 @@ class AnselReader(BaseReader):
     ?: should we allow TAB, as a Gramps extension?
     """
 
-    __printable_ascii = list(map(chr, list(range(32, 127))))  # up thru 126
+    __printable_ascii = frozenset(map(chr, range(32, 127)))  # up thru 126
     #                            LF  CR  Esc GS  RS  US
-    __use_ASCII = list(map(chr, [10, 13, 27, 29, 30, 31])) + __printable_ascii
+    __use_ASCII = frozenset(map(chr, [10, 13, 27, 29, 30, 31])) | __printable_ascii
+    __use_ASCII_bytes = "".join(sorted(__use_ASCII)).encode("ascii")
 
     # mappings of single byte ANSEL codes to unicode
     __onebyte = {
@@ -1829,52 +1846,56 @@ class AnselReader(BaseReader):
     def __ansel_to_unicode(self, text):
         """Convert an ANSEL encoded text to unicode"""
 
-        buff = StringIO()
+        if not text.translate(None, AnselReader.__use_ASCII_bytes):
+            # plain ASCII, which is most lines
+            return text.decode("ascii")
+        buff = []
         error = ""
-        while text:
-            if text[0] < 128:
-                if chr(text[0]) in AnselReader.__use_ASCII:
-                    head = chr(text[0])
+        pos = 0
+        while pos < len(text):
+            byte = text[pos]
+            if byte < 128:
+                if chr(byte) in AnselReader.__use_ASCII:
+                    head = chr(byte)
                 else:
                     # substitute space for disallowed (control) chars
-                    error += " (%#X)" % text[0]
+                    error += " (%#X)" % byte
                     head = " "
-                text = text[1:]
+                pos += 1
             else:
-                if text[0:2] in AnselReader.__twobyte:
-                    head = AnselReader.__twobyte[text[0:2]]
-                    text = text[2:]
-                elif bytes([text[0]]) in AnselReader.__onebyte:
-                    head = AnselReader.__onebyte[bytes([text[0]])]
-                    text = text[1:]
-                elif bytes([text[0]]) in AnselReader.__acombiners:
-                    cmb = AnselReader.__acombiners[bytes([text[0]])]
+                if text[pos : pos + 2] in AnselReader.__twobyte:
+                    head = AnselReader.__twobyte[text[pos : pos + 2]]
+                    pos += 2
+                elif text[pos : pos + 1] in AnselReader.__onebyte:
+                    head = AnselReader.__onebyte[text[pos : pos + 1]]
+                    pos += 1
+                elif text[pos : pos + 1] in AnselReader.__acombiners:
+                    cmb = AnselReader.__acombiners[text[pos : pos + 1]]
                     # always consume the combiner
-                    text = text[1:]
-                    next_byte = text[0]
+                    pos += 1
+                    next_byte = text[pos]
                     if (
                         next_byte < 128
                         and chr(next_byte) in AnselReader.__printable_ascii
                     ):
                         # consume next as well
-                        text = text[1:]
+                        pos += 1
                         # unicode: combiner follows base-char
                         head = chr(next_byte) + cmb
                     else:
                         # just drop the unexpected combiner
-                        error += " (%#X)" % text[0]
+                        error += " (%#X)" % next_byte
                         continue
                 else:
-                    error += " (%#X)" % text[0]
+                    error += " (%#X)" % byte
                     head = "\ufffd"  # "Replacement Char"
-                    text = text[1:]
-            buff.write(head)
-        ans = buff.getvalue()
+                    pos += 1
+            buff.append(head)
+        ans = "".join(buff)
 
         if error:
             # e.g. Illegal character (oxAB) (0xCB)... 1 NOTE xyz?pqr?lmn
             self.report_error(_("Illegal character%s") % error, ans)
-        buff.close()
         return ans
 
     def __init__(self, ifile, __add_msg):
@@ -2103,13 +2124,15 @@ class IdMapper:
         self.find_next = find_next
         self.id2user_format = id2user_format
         self.swap = {}
+        # The values of swap, to check them without a linear search
+        self.used = set()
 
     def __getitem__(self, gid):
         if gid == "":
             # We need to find the next gramps ID provided it is not already
             # the target of a swap
             new_val = self.find_next()
-            while new_val in list(self.swap.values()):
+            while new_val in self.used:
                 new_val = self.find_next()
         else:
             # remove any @ signs
@@ -2124,17 +2147,16 @@ class IdMapper:
                 # have found it. If we had already encountered I0001 and we are
                 # now looking for I1, it wouldn't be in self.swap, and we now
                 # find that I0001 is in use, so we have to create a new id.
-                if self.has_gid(formatted_gid) or (
-                    formatted_gid in list(self.swap.values())
-                ):
+                if self.has_gid(formatted_gid) or formatted_gid in self.used:
                     new_val = self.find_next()
-                    while new_val in list(self.swap.values()):
+                    while new_val in self.used:
                         new_val = self.find_next()
                 else:
                     new_val = formatted_gid
             # we need to distinguish between I1 and I0001, so we record the map
             # from the original format
             self.swap[gid] = new_val
+            self.used.add(new_val)
         return new_val
 
     def clean(self, gid):
@@ -2308,6 +2330,8 @@ class GedcomParser(UpdateCallback):
         self.fid2id = {}
         self.rid2id = {}
         self.nid2id = {}
+        # The number of children in the FAM section of each family
+        self.child_ref_count = {}
 
         self.place_import = PlaceImport(self.dbase)
 
@@ -3103,7 +3127,9 @@ class GedcomParser(UpdateCallback):
           0 TRLR                                          {1:1}
 
         """
-        with DbTxn(_("GEDCOM import"), self.dbase, not use_trans) as self.trans:
+        with self.dbase.bulk_load(), DbTxn(
+            _("GEDCOM import"), self.dbase, not use_trans
+        ) as self.trans:
             self.dbase.disable_signals()
             self.__parse_header_head()
             self.want_parse_warnings = False
@@ -3210,7 +3236,7 @@ class GedcomParser(UpdateCallback):
             family.set_handle(intid)
             family.set_gramps_id(gramps_id)
         # Add a counter for reordering the children later:
-        family._child_ref_count = 0
+        self.child_ref_count[family.handle] = 0
         return family
 
     def __find_or_create_media(self, gramps_id):
@@ -5538,13 +5564,13 @@ class GedcomParser(UpdateCallback):
         if event.type == EventType.MARRIAGE:
             descr = event.get_description()
             if descr == "Civil Union":
-                state.family.type.set(FamilyRelType.CIVIL_UNION)
+                state.family.set_relationship(FamilyRelType.CIVIL_UNION)
                 event.set_description("")
             elif descr == "Unmarried":
-                state.family.type.set(FamilyRelType.UNMARRIED)
+                state.family.set_relationship(FamilyRelType.UNMARRIED)
                 event.set_description("")
             else:
-                state.family.type.set(FamilyRelType.MARRIED)
+                state.family.set_relationship(FamilyRelType.MARRIED)
             if descr == "Y":
                 event.set_description("")
 
@@ -5642,12 +5668,13 @@ class GedcomParser(UpdateCallback):
     def set_child_ref_order(self, family, child_ref):
         """
         Sets the child_ref in family.child_ref_list to be in the position
-        family.child_ref_count. This reorders the children to be in the
+        self.child_ref_count. This reorders the children to be in the
         order given in the FAM section.
         """
+        index = self.child_ref_count[family.handle]
         family.child_ref_list.remove(child_ref)
-        family.child_ref_list.insert(family._child_ref_count, child_ref)
-        family._child_ref_count += 1
+        family.child_ref_list.insert(index, child_ref)
+        self.child_ref_count[family.handle] = index + 1
 
     def __family_slgs(self, line, state):
         """
@@ -235,12 +235,14 @@ class DescendPerson(_StopRecurse, _PersonSeen, _FamilySeen):
 
         person = self.database.get_person_from_handle(person_handle)
 
-        for family_handle in person.get_family_handle_list():
-            if family_handle not in self.families_seen:
-                family = self.database.get_family_from_handle(family_handle)
-
-                if family.get_child_ref_list():
-                    return True
+        family_handles = [
+            family_handle
+            for family_handle in person.get_family_handle_list()
+            if family_handle not in self.families_seen
+        ]
+        for family in self.database.get_families_from_handles(family_handles):
+            if family.get_child_ref_list():
+                return True
         return False
 
     def recurse(self, person_handle, g_level, s_level):
@@ -276,6 +278,10 @@ class DescendPerson(_StopRecurse, _PersonSeen, _FamilySeen):
             tmp_bold = self.__bold_now
             self.__bold_now = 0
 
+        families = {
+            family.handle: family
+            for family in self.database.get_families_from_handles(family_handles)
+        }
         for family_handle in family_handles:
             # Marriage box if the option is there.
             self._add_marriage((g_level, s_level + 1), person_handle, family_handle)
@@ -284,7 +290,7 @@ class DescendPerson(_StopRecurse, _PersonSeen, _FamilySeen):
                 self.continue_recursion()
                 return
 
-            family = self.database.get_family_from_handle(family_handle)
+            family = families[family_handle]
 
             spouse_handle = utils.find_spouse(person, family)
             if self.max_spouses > s_level:
@@ -354,6 +354,7 @@ class PlaceFormat(GenericFormat):
 
     def __init__(self, database, _in):
         self.database = database
+        self.event_date = None
         GenericFormat.__init__(self, _in)
 
     def get_place(self, database, event):
@@ -365,7 +366,7 @@ class PlaceFormat(GenericFormat):
         return None
 
     def _default_format(self, place):
-        return _pd.display(self.database, place, place.event_date)
+        return _pd.display(self.database, place, self.event_date)
 
     def parse_format(self, database, place):
         """Parse the place"""
@@ -452,7 +453,7 @@ class EventFormat(GenericFormat):
             place_format = PlaceFormat(self.database, self.string_in)
             place = place_format.get_place(self.database, event)
             if event and place:
-                place.event_date = event.get_date_object()
+                place_format.event_date = event.get_date_object()
             return place_format.parse_format(self.database, place)
 
         def format_attrib():
@@ -917,7 +918,7 @@ class VariableParse:
         place_f = PlaceFormat(self.database, self._in)
         place = place_f.get_place(self.database, event)
         if event and place:
-            place.event_date = event.get_date_object()
+            place_f.event_date = event.get_date_object()
         if self.empty_item(place):
             return
         return place_f.parse_format(self.database, place)
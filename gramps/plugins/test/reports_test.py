@@ -256,6 +256,20 @@ reports.addreport(
     target="/tmp/NAVWEB",
 )
 
+reports.addcli(
+    TestDynamic,
+    "navwebpage_workers",
+    err_does_not_contain("Failed to write report."),
+    ["/tmp/NAVWEB_WORKERS"],
+    "--force",
+    "-O",
+    TREE_NAME,
+    "--action",
+    "report",
+    "--options",
+    "name=navwebpage,target=/tmp/NAVWEB_WORKERS,workers=4",
+)
+
 reports.addreport(
     TestDynamic,
     "WebCal",
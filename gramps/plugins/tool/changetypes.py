@@ -126,6 +126,7 @@ class ChangeTypes(tool.BatchTool, ManagedWindow):
                 for event_handle in self.db.get_event_handles():
                     event = self.db.get_event_from_handle(event_handle)
                     if event.get_type().xml_str() == fromtype:
+                        event.type = EventType()
                         event.type.set_from_xml_str(totype)
                         modified += 1
                         self.db.commit_event(event, self.trans)
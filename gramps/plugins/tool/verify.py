@@ -77,7 +77,7 @@ from gramps.gen.lib.family import Family
 from gramps.gen.lib.date import Today
 from gramps.gui.editors import EditPerson, EditFamily
 from gramps.gen.utils.db import family_name
-from gramps.gen.utils.lru import LRU
+from gramps.gen.utils.lru import LRUCache
 from gramps.gui.display import display_help
 from gramps.gui.managedwindow import ManagedWindow
 from gramps.gen.updatecallback import UpdateCallback
@@ -304,8 +304,8 @@ class VerifyPerson:
 
 _person_cache_size = 20000
 _family_cache_size = 10000
-_person_cache = LRU(_person_cache_size + 1)
-_family_cache = LRU(_family_cache_size + 1)
+_person_cache = LRUCache(_person_cache_size + 1)
+_family_cache = LRUCache(_family_cache_size + 1)
 _today = Today().get_sort_value()
 
 
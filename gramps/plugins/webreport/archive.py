@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Narrative Web Page generator.
+
+Write the web site in a tar archive compressed with gzip.
+
+The archive is written as a stream: each file goes to the archive as soon as
+it is added, and the names of the files are kept in a set, to find the files
+already archived.  With several threads, the stream is cut in blocks which
+are compressed at the same time, each block being a gzip member of its own.
+A file made of several gzip members is read as a single stream.
+"""
+
+# ------------------------------------------------
+# python modules
+# ------------------------------------------------
+import gzip
+import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# The size of the blocks compressed by the threads
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+# ------------------------------------------------
+#
+# ParallelGzipFile class
+#
+# ------------------------------------------------
+class ParallelGzipFile:
+    """
+    A file object writing the data in gzip members, compressed by threads.
+    """
+
+    def __init__(self, fileobj, threads):
+        """
+        @param: fileobj -- The file to write the compressed data in
+        @param: threads -- The number of threads compressing the data
+        """
+        self.fileobj = fileobj
+        self.__threads = threads
+        self.__executor = None
+        self.__buffer = bytearray()
+        self.__pending = deque()
+
+    def write(self, data):
+        self.__buffer += data
+        if len(self.__buffer) >= BLOCK_SIZE:
+            self.__compress()
+        return len(data)
+
+    def __compress(self):
+        """
+        Give the buffered data to a thread, and write the blocks compressed
+        so far in order.
+        """
+        block = bytes(self.__buffer)
+        self.__buffer.clear()
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(self.__threads)
+        self.__pending.append(self.__executor.submit(gzip.compress, block, mtime=0))
+        # Bound the memory of the blocks waiting to be written
+        while len(self.__pending) > 2 * self.__threads:
+            self.fileobj.write(self.__pending.popleft().result())
+
+    def flush(self):
+        """
+        Write the blocks being compressed, and stop the threads until there
+        is more data to compress.
+        """
+        while self.__pending:
+            self.fileobj.write(self.__pending.popleft().result())
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def close(self):
+        if self.__buffer:
+            self.__compress()
+        self.flush()
+        self.fileobj.close()
+
+
+# ------------------------------------------------
+#
+# WebArchive class
+#
+# ------------------------------------------------
+class WebArchive:
+    """
+    A .tar.gz archive of the web site, written as a stream.
+    """
+
+    def __init__(self, path, threads=1):
+        """
+        @param: path    -- The file name of the archive
+        @param: threads -- The number of threads compressing the archive
+        """
+        self.names = set()
+        if threads > 1:
+            self.__gzip = ParallelGzipFile(open(path, "wb"), threads)
+            self.__tar = tarfile.open(fileobj=self.__gzip, mode="w|")
+        else:
+            self.__gzip = None
+            self.__tar = tarfile.open(path, "w|gz")
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def addfile(self, tarinfo, fileobj=None):
+        """
+        Add a file from a TarInfo and a file object, as for a TarFile.
+        """
+        self.names.add(tarinfo.name)
+        self.__tar.addfile(tarinfo, fileobj)
+
+    def add(self, name, arcname, filter=None):
+        """
+        Add the file name under the name arcname, as for a TarFile.
+        """
+        self.names.add(arcname)
+        self.__tar.add(name, arcname, filter=filter)
+
+    def flush(self):
+        """
+        Stop the threads compressing the archive, before the process is
+        forked.
+        """
+        if self.__gzip is not None:
+            self.__gzip.flush()
+
+    def close(self):
+        self.__tar.close()
+        if self.__gzip is not None:
+            self.__gzip.close()
@@ -3110,6 +3110,8 @@ class BasePage:
         @param: url    -- url to be linked
         """
         self.report.fam_link[handle] = url
+        if self.report.manifest:
+            self.report.manifest.add_link(handle, url)
         return Html(
             "a",
             self._("Family Map"),
@@ -44,6 +44,7 @@ Classe:
 from collections import defaultdict
 from operator import itemgetter
 from decimal import getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -123,14 +124,23 @@ class EventPages(BasePage):
         with self.r_user.progress(
             progress_title, message, len(event_handle_list) + 1
         ) as step:
-            index = 1
-            for event_handle in event_handle_list:
-                step()
-                index += 1
-                self.eventpage(self.report, the_lang, the_title, event_handle)
+            self.report.render_pages(
+                Event,
+                event_handle_list,
+                partial(self.eventpage, self.report, the_lang, the_title),
+                step,
+            )
             step()
-        self.eventlistpage(
-            self.report, the_lang, the_title, event_types, event_handle_list
+        self.report.render_index(
+            Event,
+            partial(
+                self.eventlistpage,
+                self.report,
+                the_lang,
+                the_title,
+                event_types,
+                event_handle_list,
+            ),
         )
 
     def __output_event(
@@ -43,6 +43,7 @@ Classe:
 # ------------------------------------------------
 from collections import defaultdict, OrderedDict
 from decimal import getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -113,18 +114,26 @@ class FamilyPages(BasePage):
             LOG.debug("    %s", str(item))
 
         message = _("Creating family pages...")
-        index = 1
         progress_title = self.report.pgrs_title(the_lang)
         with self.r_user.progress(
             progress_title, message, len(self.report.obj_dict[Family]) + 1
         ) as step:
-            for family_handle in self.report.obj_dict[Family]:
-                step()
-                index += 1
-                self.familypage(self.report, the_lang, the_title, family_handle)
+            self.report.render_pages(
+                Family,
+                self.report.obj_dict[Family],
+                partial(self.familypage, self.report, the_lang, the_title),
+                step,
+            )
             step()
-            self.familylistpage(
-                self.report, the_lang, the_title, self.report.obj_dict[Family].keys()
+            self.report.render_index(
+                Family,
+                partial(
+                    self.familylistpage,
+                    self.report,
+                    the_lang,
+                    the_title,
+                    self.report.obj_dict[Family].keys(),
+                ),
             )
 
     def __output_family(
@@ -509,28 +518,26 @@ class FamilyPages(BasePage):
                         relationshipdetail += toggle
                         mapdetail = Html("br")
                         fhdle = family.get_father_handle()
-                        for handle, dummy_url in self.report.fam_link.items():
-                            if fhdle == handle:
-                                father = self.r_db.get_person_from_handle(fhdle)
-                                break
+                        furl = self.get_family_map_link(fhdle)
+                        if furl:
+                            father = self.r_db.get_person_from_handle(fhdle)
                         if father:
                             primary_name = father.get_primary_name()
                             name = Name(primary_name)
                             name.set_display_as(name_format)
                             fname = html_escape(_nd.display_name(name))
-                            mapdetail += self.family_map_link_for_parent(fhdle, fname)
+                            mapdetail += self.family_map_link_for_parent(furl, fname)
                         mapdetail += Html("br")
                         mhdle = family.get_mother_handle()
-                        for handle, dummy_url in self.report.fam_link.items():
-                            if mhdle == handle:
-                                mother = self.r_db.get_person_from_handle(mhdle)
-                                break
+                        murl = self.get_family_map_link(mhdle)
+                        if murl:
+                            mother = self.r_db.get_person_from_handle(mhdle)
                         if mother:
                             primary_name = mother.get_primary_name()
                             name = Name(primary_name)
                             name.set_display_as(name_format)
                             mname = html_escape(_nd.display_name(name))
-                            mapdetail += self.family_map_link_for_parent(mhdle, mname)
+                            mapdetail += self.family_map_link_for_parent(murl, mname)
                         toggle += mapdetail
 
             # source references
@@ -547,13 +554,24 @@ class FamilyPages(BasePage):
         # and close the file
         self.xhtml_writer(familydetailpage, output_file, sio, ldatec)
 
-    def family_map_link_for_parent(self, handle, name):
+    def get_family_map_link(self, handle):
         """
-        Creates a link to the family map for the father or the mother
+        Return the url of the family map of a person, or None
 
         @param: handle -- The person handle
+        """
+        if not handle:
+            return None
+        if self.report.manifest:
+            return self.report.manifest.get_link(handle)
+        return self.report.fam_link.get(handle)
+
+    def family_map_link_for_parent(self, url, name):
+        """
+        Creates a link to the family map for the father or the mother
+
+        @param: url    -- The url of the family map of the person
         @param: name   -- The name for this person to display
         """
-        url = self.report.fam_link[handle]
         title = self._("Family Map for %s") % name
         return Html("a", title, href=url, title=title, class_="family_map", inline=True)
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Narrative Web Page generator.
+
+Keep a manifest of the pages written by the report, with the objects each
+page was built from and the queries it made.  On the next run, a page is only
+written again if one of these objects, as seen through the proxies of the
+report, or the result of one of these queries changed, if the objects
+referring to its object changed, or, for an index page, if the list of its
+objects changed.
+
+The links to the family maps of the people are kept with the pages of the
+people, so that they are known when these pages are not written again, and
+the pages using a link depend on it.
+
+The objects are compared by their content rather than their change time, as
+the living people proxy can change what is shown of a person when only a
+relative changed.  The queries recorded are the lookups on gramps ids, the
+backlink queries, the lists of handles and objects and the counts of
+objects.  A page making a query whose arguments cannot be kept in the
+manifest is always written again.
+"""
+
+# ------------------------------------------------
+# python modules
+# ------------------------------------------------
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import defaultdict
+from contextlib import contextmanager
+
+# ------------------------------------------------
+# Gramps module
+# ------------------------------------------------
+from gramps.gen.const import VERSION
+from gramps.gen.errors import HandleError
+from gramps.gen.lib import PlaceName
+from gramps.gen.proxy import CacheProxyDb
+
+LOG = logging.getLogger(".NarrativeWeb")
+
+# The name of the manifest in the target directory
+MANIFEST = ".narrativeweb.json"
+
+_FORMAT = 3
+
+# Options which do not change the pages
+_IGNORED_OPTIONS = ("incremental", "workers")
+
+# The queries of the database which are recorded
+_QUERIES = re.compile(
+    r"get_\w+_from_gramps_id|has_\w+_gramps_id|has_\w+_handle|"
+    r"find_backlink_handles|iter_\w+|get_(?!\w+_from_handles)\w+_handles|"
+    r"get_number_of_\w+"
+)
+
+# The key of the queries which cannot be made again
+_UNKNOWN = "?"
+
+# The prefix of the keys of the links to the family maps
+_LINK = "#"
+
+
+def _digest(value):
+    """
+    Return a short string identifying a value.
+    """
+    return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()
+
+
+def _get_state(value):
+    """
+    Return the content of an object, or the value itself.
+    """
+    if hasattr(value, "serialize"):
+        return value.serialize()
+    return value
+
+
+def _get_query_key(name, args, kwargs):
+    """
+    Return the key of a query, or _UNKNOWN if its arguments cannot be kept.
+    """
+    try:
+        return _UNKNOWN + json.dumps([name, args, kwargs], sort_keys=True)
+    except (TypeError, ValueError):
+        return _UNKNOWN
+
+
+def _get_result(name, result):
+    """
+    Return the result of a query, as a list if it is an iterator, and its
+    digest.
+    """
+    if name.startswith(("iter_", "find_")):
+        result = list(result)
+    if isinstance(result, list):
+        return result, _digest([_get_state(value) for value in result])
+    return result, _digest(_get_state(result))
+
+
+def _run_query(database, key):
+    """
+    Make a query again, and return the digest of its result.
+    """
+    name, args, kwargs = json.loads(key[len(_UNKNOWN) :])
+    return _get_result(name, getattr(database, name)(*args, **kwargs))[1]
+
+
+# ------------------------------------------------
+#
+# DependencyProxyDb class
+#
+# ------------------------------------------------
+class DependencyProxyDb(CacheProxyDb):
+    """
+    A cache proxy which records the objects read and the queries made while
+    a page is written.
+    """
+
+    def __init__(self, database):
+        CacheProxyDb.__init__(self, database)
+        # Handle -> (class name, digest of the content), and query key ->
+        # digest of the result, None when not recording
+        self.reads = None
+
+    def __getattr__(self, attr):
+        value = CacheProxyDb.__getattr__(self, attr)
+        if callable(value) and _QUERIES.fullmatch(attr):
+            return self.__get_query(attr, value)
+        return value
+
+    def __get_query(self, name, query):
+        """
+        Return a function making a query and recording its result.
+        """
+
+        def record_query(*args, **kwargs):
+            result = query(*args, **kwargs)
+            if self.reads is None:
+                return result
+            key = _get_query_key(name, args, kwargs)
+            if key == _UNKNOWN:
+                self.reads[key] = None
+                return result
+            values, self.reads[key] = _get_result(name, result)
+            if values is not result:
+                return iter(values)
+            return result
+
+        return record_query
+
+    def __record(self, obj):
+        if obj.handle not in self.reads:
+            self.reads[obj.handle] = (
+                obj.__class__.__name__,
+                _digest(obj.serialize()),
+            )
+
+    def _get_from_handle(self, get_func, handle):
+        obj = CacheProxyDb._get_from_handle(self, get_func, handle)
+        if self.reads is not None and obj is not None:
+            self.__record(obj)
+        return obj
+
+    def _get_from_handles(self, get_func, handles):
+        objects = CacheProxyDb._get_from_handles(self, get_func, handles)
+        if self.reads is not None:
+            for obj in objects:
+                self.__record(obj)
+        return objects
+
+
+# ------------------------------------------------
+#
+# DependencyDict class
+#
+# ------------------------------------------------
+class DependencyDict(defaultdict):
+    """
+    The entries of the report for a class of objects.  The name and path of
+    an object are taken from its entry, so reading the entry while a page is
+    written records the object.
+    """
+
+    def __init__(self, database, obj_class, entries):
+        defaultdict.__init__(self, set, entries)
+        self.__database = database
+        self.__get_func = getattr(
+            database, "get_%s_from_handle" % obj_class.__name__.lower()
+        )
+
+    def __record(self, handle):
+        reads = self.__database.reads
+        if reads is not None and handle not in reads:
+            try:
+                self.__get_func(handle)
+            except HandleError:
+                pass
+
+    def __getitem__(self, handle):
+        self.__record(handle)
+        return defaultdict.__getitem__(self, handle)
+
+    def get(self, handle, default=None):
+        self.__record(handle)
+        return defaultdict.get(self, handle, default)
+
+
+# ------------------------------------------------
+#
+# Manifest class
+#
+# ------------------------------------------------
+class Manifest:
+    """
+    The pages written by the report, with what they were built from.
+    """
+
+    def __init__(self, report, path):
+        """
+        @param: report -- The instance of the main report class
+        @param: path   -- The file name of the manifest
+        """
+        self.report = report
+        self.path = path
+        options = sorted(
+            (name, value)
+            for name, value in report.options.items()
+            if name not in _IGNORED_OPTIONS
+        )
+        self.signature = _digest((VERSION, options))
+        # The pages and objects of the last run
+        self.old_pages = {}
+        self.old_objects = {}
+        # The pages and objects of this run
+        self.pages = {}
+        self.objects = {}
+        # The files written in this run, relative to the target directory
+        self.written = set()
+        self.__changed = {}
+        self.__files = None
+        self.__links = None
+        for obj_class, entries in report.obj_dict.items():
+            if obj_class is not PlaceName:
+                report.obj_dict[obj_class] = DependencyDict(
+                    report.database, obj_class, entries
+                )
+        self.load()
+
+    def load(self):
+        """
+        Read the manifest of the last run.  It is ignored if the report had
+        other options, so that all the pages are written.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as manifest:
+                data = json.load(manifest)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as err:
+            LOG.warning("Ignoring the manifest %s: %s", self.path, err)
+            return
+        if data.get("format") != _FORMAT or data.get("signature") != self.signature:
+            LOG.debug("the options changed, writing all the pages")
+            return
+        self.old_pages = data["pages"]
+        self.old_objects = data["objects"]
+
+    def save(self):
+        """
+        Remove the files of the last run which were not written again, and
+        write the manifest of this run.
+        """
+        for page in self.old_pages.values():
+            for fname in page["files"]:
+                if fname not in self.written:
+                    LOG.debug("removing '%s'", fname)
+                    try:
+                        os.remove(os.path.join(self.report.html_dir, fname))
+                    except FileNotFoundError:
+                        pass
+        data = {
+            "format": _FORMAT,
+            "signature": self.signature,
+            "pages": self.pages,
+            "objects": self.objects,
+        }
+        with open(self.path + ".tmp", "w", encoding="utf-8") as manifest:
+            json.dump(data, manifest)
+        os.replace(self.path + ".tmp", self.path)
+
+    def __get_key(self, obj_class, handle):
+        """
+        Return the key of the page of an object, or of the index page of a
+        class of objects if handle is None, in the current language.
+        """
+        return "%s/%s/%s" % (
+            obj_class.__name__,
+            handle or "index",
+            self.report.the_lang or "",
+        )
+
+    def __is_changed(self, handle):
+        """
+        Return True if the object or the result of the query changed, or
+        the object is no longer in the report, since the last run.
+        """
+        if handle.startswith(_LINK):
+            link = self.report.fam_link.get(handle[len(_LINK) :])
+            return _digest(link) != self.old_objects.get(handle)
+        changed = self.__changed.get(handle)
+        if changed is None:
+            changed = True
+            old = self.old_objects.get(handle)
+            if old is None:
+                pass
+            elif handle.startswith(_UNKNOWN):
+                changed = _run_query(self.report.database, handle) != old
+            else:
+                class_name, digest = old
+                get_func = getattr(
+                    self.report.database, "get_%s_from_handle" % class_name.lower()
+                )
+                try:
+                    obj = get_func(handle)
+                except HandleError:
+                    obj = None
+                changed = obj is None or _digest(obj.serialize()) != digest
+            self.__changed[handle] = changed
+        return changed
+
+    def is_current(self, key, state):
+        """
+        Return True if the page was written by the last run from the same
+        state and objects.  The page is then kept in the manifest.
+        """
+        page = self.old_pages.get(key)
+        if page is None or page["state"] != state:
+            return False
+        if any(self.__is_changed(handle) for handle in page["deps"]):
+            return False
+        self.pages[key] = page
+        for handle in page["deps"]:
+            self.objects[handle] = self.old_objects[handle]
+        self.written.update(page["files"])
+        self.report.fam_link.update(page["links"])
+        return True
+
+    @contextmanager
+    def record(self, key, state):
+        """
+        Record the objects read, the queries made, the files written and
+        the links to the family maps added by a page.
+        """
+        database = self.report.database
+        database.reads = {}
+        self.__files = []
+        self.__links = {}
+        try:
+            yield
+        finally:
+            reads, database.reads = database.reads, None
+            files, self.__files = self.__files, None
+            links, self.__links = self.__links, None
+        self.objects.update(reads)
+        self.pages[key] = {
+            "state": state,
+            "deps": sorted(reads),
+            "files": files,
+            "links": links,
+        }
+
+    def add_file(self, fname):
+        """
+        Note that a file was written in the target directory.
+        """
+        fname = os.path.relpath(fname, self.report.html_dir)
+        self.written.add(fname)
+        if self.__files is not None:
+            self.__files.append(fname)
+
+    def add_link(self, handle, url):
+        """
+        Note that a page added the link to the family map of a person.
+        """
+        if self.__links is not None:
+            self.__links[handle] = url
+
+    def get_link(self, handle):
+        """
+        Return the link to the family map of a person, or None, and record
+        it in the dependencies of the page.
+        """
+        link = self.report.fam_link.get(handle)
+        reads = self.report.database.reads
+        if reads is not None:
+            reads[_LINK + handle] = _digest(link)
+        return link
+
+    def get_pages(self, obj_class, items, render, step, get_handle=None):
+        """
+        Return the items whose page must be written, and a function writing
+        and recording their pages.  For the other items, step is called.
+
+        @param: obj_class  -- The class of the objects of the pages
+        @param: items      -- The items, e.g. handles, to write a page for
+        @param: render     -- A function writing the page of an item
+        @param: step       -- A function called for each page
+        @param: get_handle -- A function returning the handle of the object
+                              of an item, if the items are not handles
+        """
+        bkref_dict = self.report.bkref_dict[obj_class]
+        pages = {}
+        todo = []
+        for item in items:
+            handle = item if get_handle is None else get_handle(item)
+            if handle is not None:
+                refs = sorted(repr(ref) for ref in bkref_dict.get(handle, ()))
+                key = self.__get_key(obj_class, handle)
+                state = [repr(item), _digest(refs)]
+                if self.is_current(key, state):
+                    step()
+                    continue
+                pages[item] = (key, state)
+            todo.append(item)
+        LOG.debug(
+            "%d of %d %s pages to write", len(todo), len(items), obj_class.__name__
+        )
+
+        def render_page(item):
+            if item in pages:
+                with self.record(*pages[item]):
+                    render(item)
+            else:
+                render(item)
+
+        return todo, render_page
+
+    def render_index(self, obj_class, render):
+        """
+        Write the index page of a class of objects, unless it is current.
+        """
+        key = self.__get_key(obj_class, None)
+        state = [_digest(sorted(self.report.obj_dict[obj_class]))]
+        if not self.is_current(key, state):
+            with self.record(key, state):
+                render()
+
+    def take_changes(self):
+        """
+        Return the pages and objects recorded since the last call, for a
+        worker process to give them to the report.
+        """
+        changes = (self.pages, self.objects, self.written)
+        self.pages, self.objects, self.written = {}, {}, set()
+        return changes
+
+    def add_changes(self, changes):
+        """
+        Add the pages and objects recorded by a worker process.
+        """
+        pages, objects, written = changes
+        self.pages.update(pages)
+        self.objects.update(objects)
+        self.written.update(written)
@@ -47,6 +47,7 @@ import shutil
 import tempfile
 from collections import defaultdict
 from decimal import getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -145,6 +146,8 @@ class MediaPages(BasePage):
                 self.report.obj_dict[Media].keys(),
                 key=lambda x: sort_by_desc_and_gid(self.r_db.get_media_from_handle(x)),
             )
+            # The pages link to the previous and next media pages
+            pages = []
             prev = None
             total = len(sorted_media_handles)
             index = 1
@@ -157,15 +160,8 @@ class MediaPages(BasePage):
                     next_ = self.unused_media_handles[0]
                 else:
                     next_ = None
-                self.mediapage(
-                    self.report,
-                    the_lang,
-                    the_title,
-                    handle,
-                    (prev, next_, index, media_count),
-                )
+                pages.append((handle, (prev, next_, index, media_count)))
                 prev = handle
-                step()
                 index += 1
 
             total = len(self.unused_media_handles)
@@ -178,19 +174,29 @@ class MediaPages(BasePage):
                         next_ = None
                     else:
                         next_ = self.unused_media_handles[idx]
-                    self.mediapage(
-                        self.report,
-                        the_lang,
-                        the_title,
-                        media_handle,
-                        (prev, next_, index, media_count),
-                    )
+                    pages.append((media_handle, (prev, next_, index, media_count)))
                     prev = media_handle
-                    step()
                     index += 1
                     idx += 1
 
-        self.medialistpage(self.report, the_lang, the_title, sorted_media_handles)
+            self.report.render_pages(
+                Media,
+                pages,
+                lambda page: self.mediapage(self.report, the_lang, the_title, *page),
+                step,
+                lambda page: page[0],
+            )
+
+        self.report.render_index(
+            Media,
+            partial(
+                self.medialistpage,
+                self.report,
+                the_lang,
+                the_title,
+                sorted_media_handles,
+            ),
+        )
 
     def medialistpage(self, report, the_lang, the_title, sorted_media_handles):
         """
@@ -749,13 +755,13 @@ class MediaPages(BasePage):
         try:
             mtime = os.stat(fullpath).st_mtime
             if self.report.archive:
-                if str(newpath) not in self.report.archive.getnames():
+                if str(newpath) not in self.report.archive:
                     # The current file not already archived.
                     self.report.archive.add(fullpath, str(newpath))
             else:
                 to_dir = os.path.join(self.html_dir, to_dir)
                 if not os.path.isdir(to_dir):
-                    os.makedirs(to_dir)
+                    os.makedirs(to_dir, exist_ok=True)
                 new_file = os.path.join(self.html_dir, newpath)
                 if not os.path.exists(newpath):
                     shutil.copyfile(fullpath, new_file)
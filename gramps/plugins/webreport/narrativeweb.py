@@ -127,6 +127,13 @@ from gramps.plugins.webreport.introduction import IntroductionPage
 from gramps.plugins.webreport.addressbook import AddressBookPage
 from gramps.plugins.webreport.addressbooklist import AddressBookListPage
 from gramps.plugins.webreport.calendar import CalendarPage
+from gramps.plugins.webreport import parallel
+from gramps.plugins.webreport.archive import WebArchive
+from gramps.plugins.webreport.manifest import (
+    MANIFEST,
+    DependencyProxyDb,
+    Manifest,
+)
 
 from gramps.plugins.webreport.common import (
     get_gendex_data,
@@ -180,7 +187,10 @@ class NavWebReport(Report):
 
         stdoptions.run_private_data_option(self, menu)
         stdoptions.run_living_people_option(self, menu)
-        self.database = CacheProxyDb(self.database)
+        if self.options["incremental"]:
+            self.database = DependencyProxyDb(self.database)
+        else:
+            self.database = CacheProxyDb(self.database)
         self._db = self.database
 
         filters_option = menu.get_option_by_name("filter")
@@ -314,6 +324,7 @@ class NavWebReport(Report):
         self.rel_class = None
         self.tab = None
         self.fam_link = {}
+        self.manifest = None
         if self.options["securesite"]:
             self.secure_mode = HTTPS
         else:
@@ -398,7 +409,7 @@ class NavWebReport(Report):
                 )
                 return
             try:
-                self.archive = tarfile.open(self.target_path, "w:gz")
+                self.archive = WebArchive(self.target_path, self.options["workers"])
             except (OSError, IOError) as value:
                 self.user.notify_error(
                     _("Could not create %s") % self.target_path, str(value)
@@ -500,6 +511,10 @@ class NavWebReport(Report):
                 if media:
                     self._add_media(media.handle, Media, media.handle)
 
+        # Only write the pages which changed since the last run
+        if self.options["incremental"] and not self.archive:
+            self.manifest = Manifest(self, os.path.join(self.html_dir, MANIFEST))
+
         #################################################
         #
         # Pass 2 Generate the web pages
@@ -588,6 +603,9 @@ class NavWebReport(Report):
         # copy all of the necessary files
         self.copy_narrated_files()
 
+        if self.manifest:
+            self.manifest.save()
+
         # if an archive is being used, close it?
         if self.archive:
             self.archive.close()
@@ -1826,12 +1844,52 @@ class NavWebReport(Report):
                 fname = os.path.join(self.html_dir, self.cur_fname)
             dir_name = os.path.dirname(fname)
             if not os.path.isdir(dir_name):
-                os.makedirs(dir_name)
+                # Another worker process may create it at the same time
+                os.makedirs(dir_name, exist_ok=True)
             output_file = open(
                 fname, "w", encoding=self.encoding, errors="xmlcharrefreplace"
             )
         return (output_file, string_io)
 
+    def render_pages(self, obj_class, items, render, step, get_handle=None):
+        """
+        Render a page for each item, in worker processes if the report is
+        set up for it.  In incremental mode, the pages which did not change
+        since the last run are skipped.
+
+        @param: obj_class  -- The class of the objects of the pages
+        @param: items      -- The items, e.g. handles, to render a page for
+        @param: render     -- A function rendering the page of an item
+        @param: step       -- A function called for each page
+        @param: get_handle -- A function returning the handle of the object of
+                              an item, if the items are not handles
+        """
+        items = list(items)
+        if self.manifest:
+            items, render = self.manifest.get_pages(
+                obj_class, items, render, step, get_handle
+            )
+        if len(items) > parallel.CHUNK_SIZE and parallel.can_render_in_parallel(self):
+            parallel.render_pages(self, items, render, step)
+        else:
+            for item in items:
+                step()
+                render(item)
+
+    def render_index(self, obj_class, render):
+        """
+        Render the index page of a class of objects.  In incremental mode, it
+        is skipped if neither the list of objects nor the objects changed
+        since the last run.
+
+        @param: obj_class -- The class of the objects of the index
+        @param: render    -- A function rendering the index page
+        """
+        if self.manifest:
+            self.manifest.render_index(obj_class, render)
+        else:
+            render()
+
     def close_file(self, output_file, string_io, date):
         """
         will close any file passed to it
@@ -1844,11 +1902,11 @@ class NavWebReport(Report):
                                when we use rsync.
         """
         if self.archive:
-            if self.cur_fname not in self.archive.getnames():
+            if self.cur_fname not in self.archive:
                 # The current file not already archived.
                 output_file.flush()
                 tarinfo = tarfile.TarInfo(self.cur_fname)
-                tarinfo.size = len(string_io.getvalue())
+                tarinfo.size = string_io.tell()
                 tarinfo.mtime = date if date != 0 else time.time()
                 if not win():
                     tarinfo.uid = os.getuid()
@@ -1860,6 +1918,8 @@ class NavWebReport(Report):
             output_file.close()
             if date is not None and date > 0:
                 os.utime(output_file.name, (date, date))
+            if self.manifest:
+                self.manifest.add_file(output_file.name)
 
     def prepare_copy_media(self, photo):
         """
@@ -1908,7 +1968,7 @@ class NavWebReport(Report):
                 return tarinfo
 
             dest = os.path.join(to_dir, to_fname)
-            if dest not in self.archive.getnames():
+            if dest not in self.archive:
                 # The current file not already archived.
                 self.archive.add(from_fname, dest, filter=set_mtime)
         else:
@@ -1916,7 +1976,7 @@ class NavWebReport(Report):
 
             destdir = os.path.dirname(dest)
             if not os.path.isdir(destdir):
-                os.makedirs(destdir)
+                os.makedirs(destdir, exist_ok=True)
 
             if from_fname != dest:
                 if not os.path.exists(dest):
@@ -2550,6 +2610,28 @@ class NavWebOptions(MenuReportOptions):
         )
         addopt("showhalfsiblings", showallsiblings)
 
+        workers = NumberOption(_("Number of worker processes"), 1, 1, 64)
+        workers.set_help(
+            _(
+                "The number of processes rendering the pages of the objects "
+                "at the same time. This is only possible for a family tree "
+                "stored in a file, and on systems where processes can be forked. "
+                "An archive is also compressed by as many threads."
+            )
+        )
+        addopt("workers", workers)
+
+        incremental = BooleanOption(_("Only write the pages which changed"), False)
+        incremental.set_help(
+            _(
+                "Keep a list of what each page is made of in the target "
+                "directory, and only write again the pages of the objects "
+                "which changed since the last run. This is not possible "
+                "for an archive."
+            )
+        )
+        addopt("incremental", incremental)
+
     def __add_advanced_options_2(self, menu):
         """
         Continue options on the "Advanced" tab.
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Narrative Web Page generator.
+
+Render the pages of the objects in worker processes.
+
+The workers are forked from the report, so that they share the lists of
+objects built by the first pass without copying them.  Each worker opens its
+own read-only connection to the database.  The pages are written directly in
+a directory, while for an archive the workers send them back to the report,
+which adds them in order.
+"""
+
+# ------------------------------------------------
+# python modules
+# ------------------------------------------------
+import logging
+import multiprocessing
+import tarfile
+from io import BytesIO
+
+# ------------------------------------------------
+# Gramps module
+# ------------------------------------------------
+from gramps.gen.db.generic import DbGeneric
+from gramps.gen.proxy import CacheProxyDb
+from gramps.gen.proxy.proxybase import ProxyDbBase
+from gramps.gen.user import User
+from gramps.plugins.webreport.common import _WRONGMEDIAPATH
+
+LOG = logging.getLogger(".NarrativeWeb")
+
+# Number of pages rendered by a worker in one go
+CHUNK_SIZE = 50
+
+# The report and the function rendering a page, inherited by the workers
+_REPORT = None
+_RENDER = None
+
+
+# ------------------------------------------------
+#
+# WorkerUser class
+#
+# ------------------------------------------------
+class WorkerUser(User):
+    """
+    Keep the warnings and errors of a worker, to give them to the user of the
+    report.
+    """
+
+    def __init__(self):
+        User.__init__(self)
+        self.messages = []
+
+    def warn(self, title, warning=""):
+        self.messages.append(("warn", title, warning))
+
+    def notify_error(self, title, error=""):
+        self.messages.append(("notify_error", title, error))
+
+
+# ------------------------------------------------
+#
+# WorkerArchive class
+#
+# ------------------------------------------------
+class WorkerArchive:
+    """
+    Replace the tar archive of the report in a worker.  The members are kept
+    in memory until they are added to the archive by the report.
+    """
+
+    def __init__(self, archive):
+        self.names = set(archive.names)
+        self.members = []
+        # Keep the archive of the report: if it was collected, its file would
+        # be closed and the end of the archive written by the worker
+        self.__archive = archive
+        # Only used to read the attributes of the files
+        self.__tar = tarfile.open(fileobj=BytesIO(), mode="w")
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def addfile(self, tarinfo, fileobj=None):
+        data = fileobj.read(tarinfo.size) if fileobj is not None else None
+        self.names.add(tarinfo.name)
+        self.members.append((tarinfo, data))
+
+    def add(self, name, arcname=None, filter=None):
+        tarinfo = self.__tar.gettarinfo(name, arcname)
+        if filter is not None:
+            tarinfo = filter(tarinfo)
+        with open(name, "rb") as fileobj:
+            self.addfile(tarinfo, fileobj)
+
+
+# ------------------------------------------------
+#
+# WorkerLinks class
+#
+# ------------------------------------------------
+class WorkerLinks(dict):
+    """
+    A dictionary that keeps the items set since it was last cleared.
+    """
+
+    def __init__(self, *args):
+        dict.__init__(self, *args)
+        self.changed = {}
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.changed[key] = value
+
+
+def get_base_database(database):
+    """
+    Return the database under the proxies of the report.
+    """
+    while isinstance(database, (CacheProxyDb, ProxyDbBase)):
+        database = database.db
+    return database
+
+
+def can_render_in_parallel(report):
+    """
+    Return True if the pages of the report can be rendered by workers.
+    """
+    if report.options["workers"] < 2:
+        return False
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    database = get_base_database(report.database)
+    return isinstance(database, DbGeneric) and database.get_save_path() not in (
+        None,
+        ":memory:",
+    )
+
+
+def _init_worker():
+    """
+    Prepare a worker process forked from the report.
+    """
+    report = _REPORT
+    get_base_database(report.database).reopen()
+    report.user = WorkerUser()
+    for tab in report.tab.values():
+        tab.r_user = report.user
+    if report.archive:
+        report.archive = WorkerArchive(report.archive)
+    report.fam_link = WorkerLinks(report.fam_link)
+    if report.manifest:
+        # Only give back the pages written by the worker
+        report.manifest.take_changes()
+
+
+def _render_chunk(items):
+    """
+    Render some pages in a worker, and return what the report needs to know
+    about them.
+    """
+    report = _REPORT
+    wrong_media = len(_WRONGMEDIAPATH)
+    for item in items:
+        _RENDER(item)
+    result = (
+        report.archive.members if report.archive else [],
+        report.fam_link.changed,
+        _WRONGMEDIAPATH[wrong_media:],
+        report.user.messages,
+        report.manifest.take_changes() if report.manifest else None,
+    )
+    if report.archive:
+        report.archive.members = []
+    report.fam_link.changed = {}
+    report.user.messages = []
+    return result
+
+
+def render_pages(report, items, render, step):
+    """
+    Render pages in worker processes.
+
+    @param: report -- The instance of the main report class
+    @param: items  -- The list of items, e.g. handles, to render a page for
+    @param: render -- A function rendering the page of an item
+    @param: step   -- A function called after each page
+    """
+    global _REPORT, _RENDER
+    chunks = [
+        items[start : start + CHUNK_SIZE] for start in range(0, len(items), CHUNK_SIZE)
+    ]
+    workers = min(report.options["workers"], len(chunks))
+    LOG.debug("rendering %d pages in %d workers", len(items), workers)
+    _REPORT, _RENDER = report, render
+    if report.archive:
+        report.archive.flush()
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(workers, _init_worker) as pool:
+            for chunk, result in zip(chunks, pool.imap(_render_chunk, chunks)):
+                members, links, wrong_media, messages, changes = result
+                if report.archive:
+                    for tarinfo, data in members:
+                        if tarinfo.name not in report.archive:
+                            fileobj = BytesIO(data) if data is not None else None
+                            report.archive.addfile(tarinfo, fileobj)
+                report.fam_link.update(links)
+                _WRONGMEDIAPATH.extend(wrong_media)
+                for method, title, message in messages:
+                    getattr(report.user, method)(title, message)
+                if changes:
+                    report.manifest.add_changes(changes)
+                for dummy_item in chunk:
+                    step()
+    finally:
+        _REPORT = _RENDER = None
@@ -45,6 +45,7 @@ Classe:
 from collections import defaultdict
 from operator import itemgetter
 from decimal import Decimal, getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -170,15 +171,24 @@ class PersonPages(BasePage):
         with self.r_user.progress(
             progress_title, message, len(self.report.obj_dict[Person]) + 1
         ) as step:
-            index = 1
-            for person_handle in sorted(self.report.obj_dict[Person]):
-                step()
-                index += 1
+
+            def render(person_handle):
                 person = self.r_db.get_person_from_handle(person_handle)
                 self.individualpage(self.report, the_lang, the_title, person)
+
+            self.report.render_pages(
+                Person, sorted(self.report.obj_dict[Person]), render, step
+            )
             step()
-            self.individuallistpage(
-                self.report, the_lang, the_title, self.report.obj_dict[Person].keys()
+            self.report.render_index(
+                Person,
+                partial(
+                    self.individuallistpage,
+                    self.report,
+                    the_lang,
+                    the_title,
+                    self.report.obj_dict[Person].keys(),
+                ),
             )
 
     #################################################
@@ -243,9 +253,9 @@ class PersonPages(BasePage):
         if showbirth:
             tcell = Html("td", class_="ColumnBirth", inline=True)
             trow += tcell
-            birth_date = _find_birth_date(self.r_db, person)
+            birth_date, fallback = _find_birth_date(self.r_db, person)
             if birth_date is not None:
-                if birth_date.fallback:
+                if fallback:
                     tcell += Html("em", self.rlocale.get_date(birth_date), inline=True)
                 else:
                     tcell += self.rlocale.get_date(birth_date)
@@ -255,9 +265,9 @@ class PersonPages(BasePage):
         if showdeath:
             tcell = Html("td", class_="ColumnDeath", inline=True)
             trow += tcell
-            death_date = _find_death_date(self.r_db, person)
+            death_date, fallback = _find_death_date(self.r_db, person)
             if death_date is not None:
-                if death_date.fallback:
+                if fallback:
                     tcell += Html("em", self.rlocale.get_date(death_date), inline=True)
                 else:
                     tcell += self.rlocale.get_date(death_date)
@@ -1850,7 +1860,7 @@ class PersonPages(BasePage):
                     if death:
                         p_death = _pd.display_event(self.r_db, death, fmt=0)
 
-                death_date = _find_death_date(self.r_db, self.person)
+                death_date = _find_death_date(self.r_db, self.person)[0]
                 if birth_date and birth_date is not Date.EMPTY:
                     alive = probably_alive(self.person, self.r_db, Today())
 
@@ -43,6 +43,7 @@ Classe:
 # ------------------------------------------------
 from collections import defaultdict
 from decimal import getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -168,17 +169,25 @@ class PlacePages(BasePage):
         with self.r_user.progress(
             progress_title, message, len(self.report.obj_dict[Place]) + 1
         ) as step:
-            index = 1
-            for place_name in self.report.obj_dict[PlaceName].keys():
-                step()
+
+            def render(place_name):
                 p_handle = self.report.obj_dict[PlaceName][place_name]
-                index += 1
                 if isinstance(p_handle, tuple):
                     self.placepage(
                         self.report, the_lang, the_title, p_handle[0], place_name
                     )
+
+            def get_handle(place_name):
+                p_handle = self.report.obj_dict[PlaceName][place_name]
+                return p_handle[0] if isinstance(p_handle, tuple) else None
+
+            self.report.render_pages(
+                Place, self.report.obj_dict[PlaceName], render, step, get_handle
+            )
             step()
-        self.placelistpage(self.report, the_lang, the_title)
+        self.report.render_index(
+            Place, partial(self.placelistpage, self.report, the_lang, the_title)
+        )
 
     def __output_place(
         self,
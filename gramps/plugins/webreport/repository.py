@@ -119,15 +119,21 @@ class RepositoryPages(BasePage):
             keys = sorted(repos_dict, key=self.rlocale.sort_key)
 
             # RepositoryListPage Class
-            self.repositorylistpage(self.report, the_lang, the_title, repos_dict, keys)
+            self.report.render_index(
+                Repository,
+                lambda: self.repositorylistpage(
+                    self.report, the_lang, the_title, repos_dict, keys
+                ),
+            )
 
-            idx = 1
-            for dummy_index, key in enumerate(keys):
+            def render(key):
                 (repo, handle) = repos_dict[key]
-                step()
-                idx += 1
                 self.repositorypage(self.report, the_lang, the_title, repo, handle)
 
+            self.report.render_pages(
+                Repository, keys, render, step, lambda key: repos_dict[key][1]
+            )
+
     def repositorylistpage(self, report, the_lang, the_title, repos_dict, keys):
         """
         Create Index for repositories
@@ -43,6 +43,7 @@ Classe:
 # ------------------------------------------------
 from collections import defaultdict
 from decimal import getcontext
+from functools import partial
 import logging
 
 # ------------------------------------------------
@@ -109,15 +110,23 @@ class SourcePages(BasePage):
         with self.r_user.progress(
             progress_title, message, len(self.report.obj_dict[Source]) + 1
         ) as step:
-            self.sourcelistpage(
-                self.report, the_lang, the_title, self.report.obj_dict[Source].keys()
+            self.report.render_index(
+                Source,
+                partial(
+                    self.sourcelistpage,
+                    self.report,
+                    the_lang,
+                    the_title,
+                    self.report.obj_dict[Source].keys(),
+                ),
             )
 
-            index = 1
-            for source_handle in self.report.obj_dict[Source]:
-                step()
-                index += 1
-                self.sourcepage(self.report, the_lang, the_title, source_handle)
+            self.report.render_pages(
+                Source,
+                self.report.obj_dict[Source],
+                partial(self.sourcepage, self.report, the_lang, the_title),
+                step,
+            )
 
     def sourcelistpage(self, report, the_lang, the_title, source_handles):
         """
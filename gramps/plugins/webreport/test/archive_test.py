@@ -0,0 +1,81 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the archive of the Narrated Web Site.
+"""
+
+import os
+import tarfile
+import tempfile
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from gramps.plugins.webreport import archive
+from gramps.plugins.webreport.archive import WebArchive
+
+
+class WebArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "site.tar.gz")
+        self.pages = {"ppl/%d.html" % index: os.urandom(3000) for index in range(20)}
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, threads):
+        web_archive = WebArchive(self.path, threads)
+        for name, data in self.pages.items():
+            tarinfo = tarfile.TarInfo(name)
+            tarinfo.size = len(data)
+            web_archive.addfile(tarinfo, BytesIO(data))
+            self.assertIn(name, web_archive)
+        web_archive.flush()
+        source = os.path.join(self.dir.name, "style.css")
+        with open(source, "wb") as css:
+            css.write(b"body {}")
+        web_archive.add(source, "css/style.css")
+        self.assertIn("css/style.css", web_archive)
+        self.assertNotIn("css/other.css", web_archive)
+        web_archive.close()
+
+    def check(self):
+        with tarfile.open(self.path, "r:gz") as tar:
+            self.assertEqual(tar.getnames(), list(self.pages) + ["css/style.css"])
+            for name, data in self.pages.items():
+                self.assertEqual(tar.extractfile(name).read(), data)
+
+    def test_stream(self):
+        self.write(1)
+        self.check()
+
+    def test_threads(self):
+        with mock.patch.object(archive, "BLOCK_SIZE", 10000):
+            self.write(3)
+        with open(self.path, "rb") as tar_gz:
+            # Several gzip members
+            self.assertGreater(tar_gz.read().count(b"\x1f\x8b\x08\x00"), 1)
+        self.check()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest for the manifest of the Narrated Web Site.
+"""
+
+import os
+import tempfile
+import unittest
+from collections import defaultdict
+from types import SimpleNamespace
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.display.place import displayer as _pd
+from gramps.gen.lib import (
+    ChildRef,
+    Date,
+    Event,
+    EventRef,
+    EventType,
+    Family,
+    Name,
+    Person,
+    Place,
+    PlaceName,
+    PlaceRef,
+)
+from gramps.gen.proxy import LivingProxyDb
+from gramps.plugins.webreport.manifest import (
+    MANIFEST,
+    DependencyProxyDb,
+    Manifest,
+)
+
+
+class ManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.dir = tempfile.TemporaryDirectory()
+        self.people = []
+        with DbTxn("Add people", self.db) as trans:
+            for dummy in range(3):
+                person = Person()
+                self.db.add_person(person, trans)
+                self.people.append(person.handle)
+            family = Family()
+            family.set_father_handle(self.people[0])
+            self.db.add_family(family, trans)
+            self.family = family.handle
+
+    def tearDown(self):
+        self.db.close()
+        self.dir.cleanup()
+
+    def run_report(self, people, proxy=None, query=None, maps=None):
+        """
+        Write a page for each person and an index, and return the pages
+        written.  The page of a person also shows the father of the family,
+        and the result of the query, if any, on the database.
+
+        If maps is given, the people in it get a family map, and a page is
+        written for the family, with the link to the map of the father.  The
+        family page also shows the last person.
+        """
+        database = DependencyProxyDb(self.db if proxy is None else proxy)
+        obj_dict = defaultdict(lambda: defaultdict(set))
+        for handle in people:
+            obj_dict[Person][handle] = (handle + ".html", handle, "")
+        report = SimpleNamespace(
+            database=database,
+            options={"title": "Test", "familymappages": maps is not None},
+            the_lang=None,
+            html_dir=self.dir.name,
+            obj_dict=obj_dict,
+            bkref_dict=defaultdict(lambda: defaultdict(set)),
+            fam_link={},
+        )
+        manifest = Manifest(report, os.path.join(self.dir.name, MANIFEST))
+        written = []
+
+        def write(fname):
+            fname = os.path.join(self.dir.name, fname)
+            with open(fname, "w") as page:
+                page.write("page")
+            manifest.add_file(fname)
+
+        def render(handle):
+            database.get_person_from_handle(handle)
+            family = database.get_family_from_handle(self.family)
+            report.obj_dict[Person].get(family.get_father_handle())
+            if query is not None:
+                query(database)
+            if maps is not None and handle in maps:
+                report.fam_link[handle] = handle + "-map.html"
+                manifest.add_link(handle, handle + "-map.html")
+            written.append(handle)
+            write(handle + ".html")
+
+        def render_family(handle):
+            family = database.get_family_from_handle(handle)
+            database.get_person_from_handle(self.people[-1])
+            written.append(manifest.get_link(family.get_father_handle()))
+            write(handle + ".html")
+
+        def render_index():
+            written.append("index")
+            write("index.html")
+
+        items, render_page = manifest.get_pages(Person, people, render, lambda: None)
+        for item in items:
+            render_page(item)
+        manifest.render_index(Person, render_index)
+        if maps is not None:
+            items, render_page = manifest.get_pages(
+                Family, [self.family], render_family, lambda: None
+            )
+            for item in items:
+                render_page(item)
+        manifest.save()
+        return written
+
+    def test_unchanged(self):
+        self.assertEqual(len(self.run_report(self.people)), 4)
+        self.assertEqual(self.run_report(self.people), [])
+
+    def test_changed(self):
+        self.run_report(self.people)
+        person = self.db.get_person_from_handle(self.people[1])
+        person.set_gramps_id("I9999")
+        with DbTxn("Edit person", self.db) as trans:
+            self.db.commit_person(person, trans, person.get_change_time() + 1)
+        self.assertEqual(self.run_report(self.people), [self.people[1]])
+
+    def test_entry_changed(self):
+        self.run_report(self.people)
+        person = self.db.get_person_from_handle(self.people[0])
+        with DbTxn("Edit father", self.db) as trans:
+            self.db.commit_person(person, trans, person.get_change_time() + 1)
+        # All the pages show the father
+        self.assertEqual(self.run_report(self.people), self.people)
+
+    def test_removed(self):
+        self.run_report(self.people)
+        removed = os.path.join(self.dir.name, self.people[2] + ".html")
+        self.assertTrue(os.path.exists(removed))
+        self.assertEqual(self.run_report(self.people[:2]), ["index"])
+        self.assertFalse(os.path.exists(removed))
+
+    def test_relative_changed(self):
+        with DbTxn("Add birth", self.db) as trans:
+            birth = Event()
+            birth.set_type(EventType.BIRTH)
+            birth.set_date_object(Date(1800))
+            self.db.add_event(birth, trans)
+            father = self.db.get_person_from_handle(self.people[0])
+            event_ref = EventRef()
+            event_ref.ref = birth.handle
+            father.add_event_ref(event_ref)
+            father.set_birth_ref(event_ref)
+            self.db.commit_person(father, trans)
+            child = self.db.get_person_from_handle(self.people[2])
+            name = Name()
+            name.set_first_name("Child")
+            child.set_primary_name(name)
+            child.add_parent_family_handle(self.family)
+            self.db.commit_person(child, trans)
+            family = self.db.get_family_from_handle(self.family)
+            child_ref = ChildRef()
+            child_ref.ref = child.handle
+            family.add_child_ref(child_ref)
+            self.db.commit_family(family, trans)
+        living = LivingProxyDb(self.db, LivingProxyDb.MODE_INCLUDE_LAST_NAME_ONLY)
+        self.run_report(self.people, living)
+        self.assertEqual(self.run_report(self.people, living), [])
+        # The child is now living from the birth of the father only
+        birth.set_date_object(Date(1990))
+        with DbTxn("Edit birth", self.db) as trans:
+            self.db.commit_event(birth, trans)
+        living = LivingProxyDb(self.db, LivingProxyDb.MODE_INCLUDE_LAST_NAME_ONLY)
+        self.assertIn(self.people[2], self.run_report(self.people, living))
+
+    def test_query_changed(self):
+        def query(database):
+            return list(database.find_backlink_handles(self.people[1]))
+
+        self.run_report(self.people, query=query)
+        self.assertEqual(self.run_report(self.people, query=query), [])
+        with DbTxn("Add family", self.db) as trans:
+            family = Family()
+            family.set_mother_handle(self.people[1])
+            self.db.add_family(family, trans)
+        self.assertEqual(self.run_report(self.people, query=query), self.people)
+
+    def test_family_map(self):
+        father = self.people[0]
+        maps = {father}
+        self.run_report(self.people, maps=maps)
+        self.assertEqual(self.run_report(self.people, maps=maps), [])
+        # The page of the father is current when the family page is written
+        person = self.db.get_person_from_handle(self.people[-1])
+        with DbTxn("Edit person", self.db) as trans:
+            self.db.commit_person(person, trans, person.get_change_time() + 1)
+        self.assertEqual(
+            self.run_report(self.people, maps=maps),
+            [self.people[-1], father + "-map.html"],
+        )
+        # The family page follows the link of the father
+        person = self.db.get_person_from_handle(father)
+        with DbTxn("Edit father", self.db) as trans:
+            self.db.commit_person(person, trans, person.get_change_time() + 1)
+        self.assertEqual(self.run_report(self.people, maps=set())[-1], None)
+
+    def test_place_title(self):
+        with DbTxn("Add places", self.db) as trans:
+            country = Place()
+            country.set_name(PlaceName(value="Country"))
+            self.db.add_place(country, trans)
+            city = Place()
+            city.set_name(PlaceName(value="City"))
+            placeref = PlaceRef()
+            placeref.ref = country.handle
+            city.add_placeref(placeref)
+            self.db.add_place(city, trans)
+        event = Event()
+        event.set_place_handle(city.handle)
+        database = DependencyProxyDb(self.db)
+        # The title is cached when the places are not recorded
+        _pd.display_event(database, event)
+        for dummy in range(2):
+            database.reads = {}
+            _pd.display_event(database, event)
+            self.assertEqual(set(database.reads), {city.handle, country.handle})
+        database.reads = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Measure the memory used by the objects of gramps.gen.lib.
+
+Usage: python test/lib_memory_benchmark.py [family tree file]
+
+The tree (by default the example tree) is imported into an in-memory
+database.  For every class the size of an instance is compared to the size of
+an instance with the same attributes in an instance dictionary, which is how
+the objects were stored before they used slots.  Finally, all the primary
+objects of the tree are loaded and the total memory is reported.
+"""
+
+import os
+import sys
+import tracemalloc
+
+from gramps.gen.const import DATA_DIR
+from gramps.gen.db.utils import import_as_dict
+from gramps.gen.lib.baseobj import BaseObject
+from gramps.gen.lib.grampstype import GrampsType
+from gramps.gen.user import User
+
+EXAMPLE = os.path.join(DATA_DIR, "tests", "example.gramps")
+COPIES = 10000
+
+
+def slot_names(cls):
+    """
+    Return the names of all the slots of a class, with private names mangled.
+    """
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_%s%s" % (klass.__name__.lstrip("_"), name)
+            names.append(name)
+    return names
+
+
+def collect(obj, found):
+    """
+    Collect one instance of every class of gen.lib reachable from obj.
+    """
+    if isinstance(obj, (list, tuple)):
+        for item in obj:
+            collect(item, found)
+        return
+    if not isinstance(obj, (BaseObject, GrampsType)):
+        return
+    if type(obj) in found:
+        return
+    found[type(obj)] = obj
+    for name in slot_names(type(obj)):
+        collect(getattr(obj, name, None), found)
+
+
+def measure(factory):
+    """
+    Return the number of bytes allocated by one call of factory.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for dummy in range(COPIES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # Subtract the pointer held by the list
+    return (after - before) / COPIES - 8
+
+
+def compare(obj):
+    """
+    Return the size of a copy of obj, and of an equivalent object that keeps
+    its attributes in an instance dictionary.
+    """
+    cls = type(obj)
+    state = [(name, getattr(obj, name)) for name in slot_names(cls)]
+    unslotted = type(cls.__name__, (), {})
+
+    def slotted_copy():
+        new = cls.__new__(cls)
+        for name, value in state:
+            object.__setattr__(new, name, value)
+        return new
+
+    def unslotted_copy():
+        new = unslotted()
+        new.__dict__.update(state)
+        return new
+
+    return measure(slotted_copy), measure(unslotted_copy)
+
+
+def main(filename):
+    db = import_as_dict(filename, User())
+
+    iterators = (
+        db.iter_people,
+        db.iter_families,
+        db.iter_events,
+        db.iter_places,
+        db.iter_citations,
+        db.iter_sources,
+        db.iter_repositories,
+        db.iter_media,
+        db.iter_notes,
+        db.iter_tags,
+    )
+    found = {}
+    for iterator in iterators:
+        for obj in iterator():
+            collect(obj, found)
+
+    print("%-20s %10s %10s %10s" % ("Class", "Slots", "Dict", "Saved"))
+    for cls in sorted(found, key=lambda cls: cls.__name__):
+        slotted, unslotted = compare(found[cls])
+        print(
+            "%-20s %10d %10d %9d%%"
+            % (
+                cls.__name__,
+                slotted,
+                unslotted,
+                100 * (unslotted - slotted) / unslotted,
+            )
+        )
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = [list(iterator()) for iterator in iterators]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        "Loaded %d primary objects in %.1f MiB"
+        % (sum(len(objects) for objects in tree), (after - before) / 2**20)
+    )
+    db.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else EXAMPLE)